@@ -106,6 +106,16 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--import-bundle",
+        action="store_true",
+        help="Preload the modules imported by the previous start in worker threads",
+    )
+    parser.add_argument(
+        "--compact-states",
+        action="store_true",
+        help="Keep states in a compact form to use less memory with many entities",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -205,6 +215,8 @@ def main() -> int:
         debug=args.debug,
         open_ui=args.open_ui,
         safe_mode=safe_mode,
+        import_bundle=args.import_bundle,
+        compact_states=args.compact_states,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
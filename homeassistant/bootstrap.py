@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Iterable
 import contextlib
+from dataclasses import dataclass
 from functools import partial
 from itertools import chain
 import logging
@@ -16,7 +18,7 @@ import platform
 import sys
 import threading
 from time import monotonic
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 # Import cryptography early since import openssl is not thread-safe
 # _frozen_importlib._DeadlockError: deadlock detected by _ModuleLock('cryptography.hazmat.backends.openssl.backend')
@@ -80,6 +82,7 @@ from .helpers import (
     entity,
     entity_registry,
     floor_registry,
+    import_bundle,
     issue_registry,
     label_registry,
     recorder,
@@ -97,6 +100,7 @@ from .setup import (
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
     _setup_started,
+    async_get_deps_reqs_processed_future,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
@@ -124,6 +128,10 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 
 # hass.data key for logging information.
 DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
+# hass.data key for the domains on the critical path of the setup.
+DATA_SETUP_CRITICAL_PATH: HassKey[list[SetupCriticalPathStep]] = HassKey(
+    "bootstrap_setup_critical_path"
+)
 
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
@@ -176,6 +184,11 @@ STAGE_1_INTEGRATIONS = {
     # Ensure supervisor is available
     "hassio",
 }
+# Stage 2 integrations wait for these stage 1 integrations to be set up.
+# They only wait for the other stage 1 integrations to process their
+# dependencies and requirements, which is what the discovery integrations
+# are set up first for.
+STAGE_1_SETUP_BLOCKING_INTEGRATIONS = {"mqtt_eventstream", "cloud", "hassio"}
 DEFAULT_INTEGRATIONS = {
     # These integrations are set up unless recovery mode is activated.
     #
@@ -279,6 +292,7 @@ async def async_setup_hass(
         hass.config.safe_mode = runtime_config.safe_mode
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
+        hass.states.async_set_compact(runtime_config.compact_states)
 
         return hass
 
@@ -322,6 +336,9 @@ async def async_setup_hass(
             if not is_virtual_env():
                 await async_mount_local_lib_path(runtime_config.config_dir)
 
+            if runtime_config.import_bundle:
+                await import_bundle.async_setup(hass)
+
             basic_setup_success = (
                 await async_from_config_dict(config_dict, hass) is not None
             )
@@ -770,30 +787,130 @@ class _WatchPendingSetups:
             self._handle = None
 
 
-async def async_setup_multi_components(
-    hass: core.HomeAssistant,
-    domains: set[str],
-    config: dict[str, Any],
-) -> None:
-    """Set up multiple domains. Log on failure."""
-    # Avoid creating tasks for domains that were setup in a previous stage
-    domains_not_yet_setup = domains - hass.config.components
-    # Create setup tasks for base platforms first since everything will have
-    # to wait to be imported, and the sooner we can get the base platforms
-    # loaded the sooner we can start loading the rest of the integrations.
-    futures = {
-        domain: hass.async_create_task_internal(
-            async_setup_component(hass, domain, config),
-            f"setup component {domain}",
-            eager_start=True,
-        )
+class SetupCriticalPathStep(NamedTuple):
+    """A domain on the critical path of the setup."""
+
+    domain: str
+    wait_time: float
+    """Time between scheduling the setup and the setup starting to run."""
+    run_time: float
+    """Time the setup ran, not counting waits for other integrations."""
+
+
+@dataclass(slots=True)
+class _ScheduledSetup:
+    """The setup of a domain scheduled by bootstrap."""
+
+    scheduled: float
+    blockers: set[str]
+    finished: float | None = None
+
+
+class _SetupScheduler:
+    """Set up domains as soon as the domains they wait for allow it.
+
+    Integrations wait for their dependencies and after dependencies when
+    they are set up. The scheduler only holds the setup of a group of
+    domains back until the bootstrap stage they belong to can start, and
+    records the domains each setup waited for to report the critical path.
+    """
+
+    def __init__(self, hass: core.HomeAssistant, config: dict[str, Any]) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._config = config
+        self._setups: dict[str, _ScheduledSetup] = {}
+
+    @core.callback
+    def async_schedule(
+        self,
+        domains: set[str],
+        start: asyncio.Future[None] | None = None,
+        blockers: Iterable[str] = (),
+    ) -> dict[str, asyncio.Task[None]]:
+        """Schedule the setup of domains once start is done.
+
+        blockers are the domains the setups wait for through start.
+        """
+        hass = self._hass
+        now = monotonic()
+        blockers = set(blockers)
+        # Create setup tasks for base platforms first since everything will have
+        # to wait to be imported, and the sooner we can get the base platforms
+        # loaded the sooner we can start loading the rest of the integrations.
+        tasks: dict[str, asyncio.Task[None]] = {}
         for domain in sorted(
-            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
-        )
-    }
-    results = await asyncio.gather(*futures.values(), return_exceptions=True)
-    for idx, domain in enumerate(futures):
-        result = results[idx]
+            domains - hass.config.components, key=SETUP_ORDER_SORT_KEY, reverse=True
+        ):
+            setup = self._setups[domain] = _ScheduledSetup(now, blockers)
+            tasks[domain] = hass.async_create_task_internal(
+                self._async_setup(domain, setup, start),
+                f"setup component {domain}",
+                eager_start=True,
+            )
+        return tasks
+
+    async def _async_setup(
+        self, domain: str, setup: _ScheduledSetup, start: asyncio.Future[None] | None
+    ) -> None:
+        """Set up a domain once start is done."""
+        if start is not None:
+            await start
+        try:
+            await async_setup_component(self._hass, domain, self._config)
+        finally:
+            setup.finished = monotonic()
+
+    @core.callback
+    def async_critical_path(self) -> list[SetupCriticalPathStep]:
+        """Return the chain of setups that delayed the last setup to finish.
+
+        Starting with the last setup, each step is preceded by the domain
+        it waited for that finished last.
+        """
+        setups = self._setups
+        integrations = self._hass.data[loader.DATA_INTEGRATIONS]
+        run_times = async_get_setup_timings(self._hass)
+        finished = {
+            domain: setup.finished
+            for domain, setup in setups.items()
+            if setup.finished is not None
+        }
+        path: list[SetupCriticalPathStep] = []
+        candidates = list(finished)
+        while candidates:
+            domain = max(candidates, key=finished.__getitem__)
+            setup = setups[domain]
+            run_time = run_times.get(domain, 0.0)
+            path.append(
+                SetupCriticalPathStep(
+                    domain,
+                    max(0.0, finished[domain] - setup.scheduled - run_time),
+                    run_time,
+                )
+            )
+            blockers = set(setup.blockers)
+            if type(integration := integrations.get(domain)) is loader.Integration:
+                blockers.update(integration.dependencies)
+                blockers.update(integration.after_dependencies)
+            # Setups that finished at the same time cannot wait for each other
+            candidates = [
+                blocker
+                for blocker in blockers
+                if blocker in finished and finished[blocker] < finished[domain]
+            ]
+        path.reverse()
+        return path
+
+
+async def _async_wait_tasks(tasks: dict[str, asyncio.Task[None]]) -> None:
+    """Wait for setup tasks. Log on failure.
+
+    Cancelling the wait, as a stage timeout does, cancels the pending setups.
+    """
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    for domain, result in zip(tasks, results, strict=True):
+        # A cancelled setup must not cancel bootstrap
         if isinstance(result, BaseException):
             _LOGGER.error(
                 "Error setting up integration %s - received exception",
@@ -802,6 +919,29 @@ async def async_setup_multi_components(
             )
 
 
+async def async_setup_multi_components(
+    hass: core.HomeAssistant,
+    domains: set[str],
+    config: dict[str, Any],
+) -> None:
+    """Set up multiple domains. Log on failure."""
+    scheduler = _SetupScheduler(hass, config)
+    await _async_wait_tasks(scheduler.async_schedule(domains))
+
+
+async def _async_wait_stage_1_blockers(
+    hass: core.HomeAssistant, stage_1_tasks: dict[str, asyncio.Task[None]]
+) -> None:
+    """Wait until the stage 1 setups allow stage 2 setups to start."""
+    for domain, task in stage_1_tasks.items():
+        waits: tuple[asyncio.Future[None], ...] = (task,)
+        if domain not in STAGE_1_SETUP_BLOCKING_INTEGRATIONS:
+            # The setup can fail before the dependencies and
+            # requirements are processed so wait for either
+            waits = (task, async_get_deps_reqs_processed_future(hass, domain))
+        await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+
+
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
@@ -1009,6 +1149,9 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - stage_1_domains
 
+    scheduler = _SetupScheduler(hass, config)
+    # Every setup waits for the setup group before it to be set up
+    group_blockers: set[str] = set()
     for name, domain_group in pre_stage_domains:
         if domain_group:
             stage_2_domains -= domain_group
@@ -1021,35 +1164,72 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            await _async_wait_tasks(
+                scheduler.async_schedule(domain_group, blockers=group_blockers)
+            )
+            group_blockers = domain_group
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
 
     # Start setup
+    stage_1_tasks: dict[str, asyncio.Task[None]] = {}
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
+        stage_1_tasks = scheduler.async_schedule(
+            stage_1_domains, blockers=group_blockers
+        )
+
+    # Stage 2 setups start as soon as the stage 1 setups allow it
+    # instead of waiting for all the stage 1 setups to finish
+    stage_2_start = hass.loop.create_future()
+    stage_2_tasks: dict[str, asyncio.Task[None]] = {}
+    if stage_2_domains:
+        stage_2_tasks = scheduler.async_schedule(
+            stage_2_domains,
+            stage_2_start,
+            group_blockers | (stage_1_domains & STAGE_1_SETUP_BLOCKING_INTEGRATIONS),
+        )
+
+    @core.callback
+    def _async_start_stage_2() -> None:
+        """Start the stage 2 setups."""
+        if stage_2_start.done():
+            return
+        # Add after dependencies when setting up stage 2 domains
+        async_set_domains_to_be_loaded(hass, stage_2_domains)
+        if stage_2_domains:
+            _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+        stage_2_start.set_result(None)
+
+    async def _async_start_stage_2_when_unblocked() -> None:
+        """Start the stage 2 setups once the stage 1 setups allow it."""
+        await _async_wait_stage_1_blockers(hass, stage_1_tasks)
+        _async_start_stage_2()
+
+    start_stage_2_task = create_eager_task(
+        _async_start_stage_2_when_unblocked(), loop=hass.loop
+    )
+    if stage_1_tasks:
         try:
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await _async_wait_tasks(stage_1_tasks)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
                 hass._active_tasks,  # noqa: SLF001
             )
+    start_stage_2_task.cancel()
+    _async_start_stage_2()
 
-    # Add after dependencies when setting up stage 2 domains
-    async_set_domains_to_be_loaded(hass, stage_2_domains)
-
-    if stage_2_domains:
-        _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+    if stage_2_tasks:
         try:
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await _async_wait_tasks(stage_2_tasks)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1069,9 +1249,20 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    critical_path = hass.data[DATA_SETUP_CRITICAL_PATH] = (
+        scheduler.async_critical_path()
+    )
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        _LOGGER.debug(
+            "Setup critical path: %s",
+            " -> ".join(
+                f"{step.domain} (waited {step.wait_time:.2f}s,"
+                f" ran {step.run_time:.2f}s)"
+                for step in critical_path
+            ),
+        )
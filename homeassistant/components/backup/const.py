@@ -11,6 +11,10 @@ if TYPE_CHECKING:
     from .manager import BackupManager
 
 BUF_SIZE = 2**20 * 4  # 4MB
+# The contents of the backup are compressed in chunks of this size
+COMPRESS_CHUNK_SIZE = 2**20  # 1MB
+# Compressing releases the GIL, so the chunks are compressed in parallel
+MAX_COMPRESS_WORKERS = 4
 DOMAIN = "backup"
 DATA_MANAGER: HassKey[BackupManager] = HassKey(DOMAIN)
 LOGGER = getLogger(__package__)
@@ -5,11 +5,14 @@ from __future__ import annotations
 import abc
 import asyncio
 from collections.abc import AsyncIterator, Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from enum import StrEnum
 import hashlib
 import io
 import json
+import os
 from pathlib import Path
 import shutil
 import tarfile
@@ -41,10 +44,11 @@ from .const import (
     EXCLUDE_DATABASE_FROM_BACKUP,
     EXCLUDE_FROM_BACKUP,
     LOGGER,
+    MAX_COMPRESS_WORKERS,
 )
 from .models import AgentBackup, Folder
 from .store import BackupStore
-from .util import make_backup_dir, read_backup
+from .util import CompressedChunks, InnerTarFile, make_backup_dir, read_backup
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -935,6 +939,8 @@ class CoreBackupReaderWriter(BackupReaderWriter):
         """Initialize the backup reader/writer."""
         self._hass = hass
         self.temp_backup_dir = Path(hass.config.path("tmp_backups"))
+        # The compressed chunks of the last unencrypted local backup
+        self._compressed_chunks: CompressedChunks | None = None
 
     async def async_create_backup(
         self,
@@ -1071,7 +1077,12 @@ class CoreBackupReaderWriter(BackupReaderWriter):
         password: str | None,
         tar_file_path: Path | None,
     ) -> tuple[Path, int]:
-        """Generate backup contents and return the size."""
+        """Generate backup contents and return the size.
+
+        The compressed chunks of a backup kept by the local agent are
+        copied by the next backup when their contents did not change.
+        """
+        keep_backup = tar_file_path is not None
         if not tar_file_path:
             tar_file_path = self.temp_backup_dir / f"{backup_data['slug']}.tar"
         make_backup_dir(tar_file_path.parent)
@@ -1080,28 +1091,53 @@ class CoreBackupReaderWriter(BackupReaderWriter):
         if not database_included:
             excludes = excludes + EXCLUDE_DATABASE_FROM_BACKUP
 
-        outer_secure_tarfile = SecureTarFile(
-            tar_file_path, "w", gzip=False, bufsize=BUF_SIZE
+        inner_tar: InnerTarFile | None = None
+        executor = ThreadPoolExecutor(
+            max_workers=min(MAX_COMPRESS_WORKERS, os.cpu_count() or 1),
+            thread_name_prefix="BackupCompress",
         )
-        with outer_secure_tarfile as outer_secure_tarfile_tarfile:
-            raw_bytes = json_bytes(backup_data)
-            fileobj = io.BytesIO(raw_bytes)
-            tar_info = tarfile.TarInfo(name="./backup.json")
-            tar_info.size = len(raw_bytes)
-            tar_info.mtime = int(time.time())
-            outer_secure_tarfile_tarfile.addfile(tar_info, fileobj=fileobj)
-            with outer_secure_tarfile.create_inner_tar(
-                "./homeassistant.tar.gz",
-                gzip=True,
-                key=password_to_key(password) if password is not None else None,
-            ) as core_tar:
-                atomic_contents_add(
-                    tar_file=core_tar,
-                    origin_path=Path(self._hass.config.path()),
-                    excludes=excludes,
-                    arcname="data",
-                )
-        return (tar_file_path, tar_file_path.stat().st_size)
+        try:
+            outer_secure_tarfile = SecureTarFile(
+                tar_file_path, "w", gzip=False, bufsize=BUF_SIZE
+            )
+            with outer_secure_tarfile as outer_secure_tarfile_tarfile:
+                raw_bytes = json_bytes(backup_data)
+                fileobj = io.BytesIO(raw_bytes)
+                tar_info = tarfile.TarInfo(name="./backup.json")
+                tar_info.size = len(raw_bytes)
+                tar_info.mtime = int(time.time())
+                outer_secure_tarfile_tarfile.addfile(tar_info, fileobj=fileobj)
+                core_tar_file: AbstractContextManager[tarfile.TarFile]
+                if password is None:
+                    core_tar_file = inner_tar = InnerTarFile(
+                        outer_secure_tarfile_tarfile,
+                        "./homeassistant.tar.gz",
+                        executor=executor,
+                        previous_chunks=self._compressed_chunks,
+                    )
+                else:
+                    # Encrypted backups are compressed by securetar
+                    core_tar_file = outer_secure_tarfile.create_inner_tar(
+                        "./homeassistant.tar.gz",
+                        gzip=True,
+                        key=password_to_key(password),
+                    )
+                with core_tar_file as core_tar:
+                    atomic_contents_add(
+                        tar_file=core_tar,
+                        origin_path=Path(self._hass.config.path()),
+                        excludes=excludes,
+                        arcname="data",
+                    )
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        stat = tar_file_path.stat()
+        if keep_backup and inner_tar is not None and inner_tar.chunks is not None:
+            self._compressed_chunks = CompressedChunks(
+                tar_file_path, stat.st_size, stat.st_mtime_ns, inner_tar.chunks
+            )
+        return (tar_file_path, stat.st_size)
 
     async def async_receive_backup(
         self,
@@ -3,19 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+import hashlib
 from pathlib import Path
 from queue import SimpleQueue
+import struct
 import tarfile
-from typing import cast
+import time
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, cast
+import zlib
 
 import aiohttp
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util.json import JsonObjectType, json_loads_object
 
-from .const import BUF_SIZE
+from .const import BUF_SIZE, COMPRESS_CHUNK_SIZE, MAX_COMPRESS_WORKERS
 from .models import AddonInfo, AgentBackup, Folder
 
+if TYPE_CHECKING:
+    from _typeshed import SupportsRead
+
+# Same compression level as securetar
+COMPRESS_LEVEL = 6
+GZIP_WINDOW_SIZE = 2**15
+# An empty final block of fixed Huffman codes ends the deflate stream
+DEFLATE_FINAL_BLOCK = b"\x03\x00"
+MAX_PENDING_CHUNKS = 2 * MAX_COMPRESS_WORKERS
+
 
 def make_backup_dir(path: Path) -> None:
     """Create a backup directory if it does not exist."""
@@ -109,3 +127,270 @@ async def receive_file(
     finally:
         if fut is not None:
             await fut
+
+
+@dataclass(slots=True)
+class CompressedChunks:
+    """Compressed chunks of a backup file, by the hash of their contents."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    chunks: dict[bytes, tuple[int, int]]
+    """Offset and length of the compressed chunks in the backup file."""
+
+
+def _compress_chunk(chunk: bytes, window: bytes) -> bytes:
+    """Compress a chunk to raw deflate blocks ending with a sync flush."""
+    if window:
+        compressor = zlib.compressobj(
+            COMPRESS_LEVEL,
+            zlib.DEFLATED,
+            -zlib.MAX_WBITS,
+            zlib.DEF_MEM_LEVEL,
+            zlib.Z_DEFAULT_STRATEGY,
+            window,
+        )
+    else:
+        compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+class _ParallelGzipWriter:
+    """Write a gzip stream, compressing its chunks in parallel.
+
+    Every chunk is compressed to raw deflate blocks ending with a sync flush,
+    with the data before it as dictionary, so the chunks written in order
+    make up a single gzip member. A compressed chunk of the previous backup
+    is copied instead when the chunk and the data before it are unchanged.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        executor: Executor,
+        previous_chunks: CompressedChunks | None,
+        data_offset: int,
+    ) -> None:
+        """Initialize the writer and write the gzip header.
+
+        data_offset is the offset of the gzip stream in the backup file.
+        """
+        self._fileobj = fileobj
+        self._executor = executor
+        self._buffer = bytearray()
+        self._window = b""
+        self._crc = 0
+        self._size = 0
+        self._offset = 0
+        self._pending: deque[tuple[bytes, Future[bytes] | bytes]] = deque()
+        self._data_offset = data_offset
+        self.chunks: dict[bytes, tuple[int, int]] = {}
+        self._previous_chunks: dict[bytes, tuple[int, int]] = {}
+        self._previous_file: IO[bytes] | None = None
+        if previous_chunks is not None:
+            try:
+                stat = previous_chunks.path.stat()
+                if (stat.st_size, stat.st_mtime_ns) == (
+                    previous_chunks.size,
+                    previous_chunks.mtime_ns,
+                ):
+                    self._previous_file = previous_chunks.path.open("rb")
+                    self._previous_chunks = previous_chunks.chunks
+            except OSError:
+                pass
+
+        # Magic, deflate, no flags, mtime, no extra flags, unknown OS
+        self._write(
+            b"\x1f\x8b\x08\x00" + struct.pack("<I", int(time.time())) + b"\x00\xff"
+        )
+
+    def write(self, data: bytes) -> int:
+        """Write data, compressing every full chunk."""
+        self._buffer += data
+        while len(self._buffer) >= COMPRESS_CHUNK_SIZE:
+            chunk = bytes(self._buffer[:COMPRESS_CHUNK_SIZE])
+            del self._buffer[:COMPRESS_CHUNK_SIZE]
+            self._add_chunk(chunk)
+        return len(data)
+
+    def tell(self) -> int:
+        """Return the number of uncompressed bytes written."""
+        return self._size + len(self._buffer)
+
+    def align(self) -> None:
+        """Start a new chunk, compressing the data written so far."""
+        if self._buffer:
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+            self._add_chunk(chunk)
+
+    def close(self) -> None:
+        """Write the remaining chunks and the gzip trailer."""
+        self.align()
+        while self._pending:
+            self._write_pending_chunk()
+        self._write(
+            DEFLATE_FINAL_BLOCK + struct.pack("<II", self._crc, self._size & 0xFFFFFFFF)
+        )
+        self.discard()
+
+    def discard(self) -> None:
+        """Discard the pending chunks and close the previous backup."""
+        for _, compressed in self._pending:
+            if isinstance(compressed, Future):
+                compressed.cancel()
+        self._pending.clear()
+        if self._previous_file is not None:
+            self._previous_file.close()
+            self._previous_file = None
+
+    def _add_chunk(self, chunk: bytes) -> None:
+        """Queue a chunk to be compressed and written in order."""
+        window = self._window
+        self._crc = zlib.crc32(chunk, self._crc)
+        self._size += len(chunk)
+        self._window = (window + chunk[-GZIP_WINDOW_SIZE:])[-GZIP_WINDOW_SIZE:]
+
+        hasher = hashlib.sha256(window)
+        hasher.update(chunk)
+        key = hasher.digest()
+
+        compressed: Future[bytes] | bytes | None = None
+        if self._previous_file is not None and (
+            location := self._previous_chunks.get(key)
+        ):
+            offset, length = location
+            self._previous_file.seek(offset)
+            if len(data := self._previous_file.read(length)) == length:
+                compressed = data
+        if compressed is None:
+            compressed = self._executor.submit(_compress_chunk, chunk, window)
+
+        self._pending.append((key, compressed))
+        while len(self._pending) > MAX_PENDING_CHUNKS:
+            self._write_pending_chunk()
+
+    def _write_pending_chunk(self) -> None:
+        """Write the oldest compressed chunk."""
+        key, compressed = self._pending.popleft()
+        if isinstance(compressed, Future):
+            compressed = compressed.result()
+        self.chunks[key] = (self._data_offset + self._offset, len(compressed))
+        self._write(compressed)
+
+    def _write(self, data: bytes) -> None:
+        """Write compressed data."""
+        self._fileobj.write(data)
+        self._offset += len(data)
+
+
+class _ChunkAlignedTarFile(tarfile.TarFile):
+    """Tar file starting every large file on a new compressed chunk.
+
+    The compressed chunks of a large file that did not change are then the
+    same as in the previous backup, even when the files before it changed.
+    """
+
+    def addfile(
+        self, tarinfo: tarfile.TarInfo, fileobj: SupportsRead[bytes] | None = None
+    ) -> None:
+        """Add a file, starting a new chunk first if the file is large."""
+        if tarinfo.size >= COMPRESS_CHUNK_SIZE:
+            cast(_ParallelGzipWriter, self.fileobj).align()
+        super().addfile(tarinfo, fileobj)
+
+
+class InnerTarFile:
+    """Add a gzip compressed tar file to an outer tar file.
+
+    The inner tar file is written in the same format as the unencrypted inner
+    tar files of securetar, but its chunks are compressed in parallel by the
+    executor. Encrypted inner tar files are written by securetar.
+    """
+
+    def __init__(
+        self,
+        outer_tar: tarfile.TarFile,
+        name: str,
+        *,
+        executor: Executor,
+        previous_chunks: CompressedChunks | None = None,
+    ) -> None:
+        """Initialize the inner tar file.
+
+        The compressed chunks of the previous backup are copied when their
+        contents did not change. The compressed chunks of this tar file are
+        available as chunks once it is closed.
+        """
+        self._outer_tar = outer_tar
+        self._name = name
+        self._executor = executor
+        self._previous_chunks = previous_chunks
+        self._tar_info = tarfile.TarInfo(name=name)
+        self._header_offset = 0
+        self._header_size = 0
+        self._writer: _ParallelGzipWriter | None = None
+        self._tar: tarfile.TarFile | None = None
+        self.chunks: dict[bytes, tuple[int, int]] | None = None
+
+    def __enter__(self) -> tarfile.TarFile:
+        """Write a header for the inner tar file and open it."""
+        outer_tar = self._outer_tar
+        fileobj = cast(IO[bytes], outer_tar.fileobj)
+        if outer_tar.format == tarfile.PAX_FORMAT:
+            # A float mtime forces a PAX header, which supports large files
+            self._tar_info.mtime = time.time()
+        else:
+            self._tar_info.mtime = int(time.time())
+        self._header_offset = fileobj.tell()
+        header = self._tar_info.tobuf(
+            outer_tar.format, outer_tar.encoding, outer_tar.errors
+        )
+        self._header_size = len(header)
+        # The header is written again with the size once the tar file is closed
+        fileobj.write(header)
+
+        self._writer = _ParallelGzipWriter(
+            fileobj, self._executor, self._previous_chunks, fileobj.tell()
+        )
+        self._tar = _ChunkAlignedTarFile(
+            fileobj=cast(IO[bytes], self._writer),
+            mode="w",
+            copybufsize=COMPRESS_CHUNK_SIZE,
+        )
+        return self._tar
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the inner tar file and write its header with its size."""
+        assert self._tar is not None
+        assert self._writer is not None
+        if exc_type is not None:
+            self._writer.discard()
+            return
+
+        self._tar.close()
+        self._writer.close()
+        self.chunks = self._writer.chunks
+
+        outer_tar = self._outer_tar
+        fileobj = cast(IO[bytes], outer_tar.fileobj)
+        end_offset = fileobj.tell()
+        size = end_offset - self._header_offset - self._header_size
+        if remainder := size % tarfile.BLOCKSIZE:
+            fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+        padded_end_offset = fileobj.tell()
+
+        self._tar_info.size = size
+        fileobj.seek(self._header_offset)
+        fileobj.write(
+            self._tar_info.tobuf(outer_tar.format, outer_tar.encoding, outer_tar.errors)
+        )
+        fileobj.seek(padded_end_offset)
+        outer_tar.offset += padded_end_offset - self._header_offset
+        outer_tar.members.append(self._tar_info)  # type: ignore[attr-defined]
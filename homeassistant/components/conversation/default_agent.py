@@ -29,7 +29,7 @@ from hassil.recognize import (
     recognize_best,
 )
 from hassil.string_matcher import UnmatchedRangeEntity, UnmatchedTextEntity
-from hassil.trie import Trie
+from hassil.trie import Trie, TrieNode
 from hassil.util import merge_dict
 from home_assistant_intents import ErrorKey, get_intents, get_languages
 import yaml
@@ -181,6 +181,69 @@ class IntentCache:
         """Clear the cache."""
         self.cache.clear()
 
+    def invalidate(self, names: Iterable[str]) -> None:
+        """Remove the results for texts that contain any of the lowercase names."""
+        if not (names := [name for name in names if name]):
+            return
+
+        # Copy the keys since results are put from the executor
+        for key in list(self.cache):
+            text = key.text.strip().lower()
+            if any(name in text for name in names):
+                self.cache.pop(key, None)
+
+
+@dataclass(slots=True)
+class EntityNames:
+    """Names of an entity for the name slot list."""
+
+    exposed: bool
+    """True if the entity is exposed."""
+
+    name_tuples: list[tuple[str, str, dict[str, Any]]]
+    """(input name, output name, context) tuples of the entity."""
+
+    values: list[tuple[str, TextSlotValue]] | None = None
+    """(trie text, slot value) pairs, created when they are needed."""
+
+    def get_values(self) -> list[tuple[str, TextSlotValue]]:
+        """Return the (trie text, slot value) pairs of the names."""
+        if (values := self.values) is None:
+            values = []
+            for name_tuple in self.name_tuples:
+                value = TextSlotValue.from_tuple(name_tuple, allow_template=False)
+                assert isinstance(value.text_in, TextChunk)
+                values.append((value.text_in.text.strip().lower(), value))
+            self.values = values
+
+        return values
+
+
+def _trie_remove(trie: Trie, text: str, value: TextSlotValue) -> None:
+    """Remove a value of a text from a trie, pruning the nodes left empty."""
+    path: list[tuple[dict[str, TrieNode], str]] = []
+    children: dict[str, TrieNode] | None = trie.roots
+    node: TrieNode | None = None
+    for char in text:
+        if children is None or (node := children.get(char)) is None:
+            return
+        path.append((children, char))
+        children = node.children
+
+    if node is None or not node.values:
+        return
+
+    node.values = [node_value for node_value in node.values if node_value is not value]
+    if node.values:
+        return
+
+    node.text = node.values = None
+    for children, char in reversed(path):
+        node = children[char]
+        if node.text is not None or node.children:
+            break
+        del children[char]
+
 
 def _get_language_variations(language: str) -> Iterable[str]:
     """Generate language codes with and without region."""
@@ -241,6 +304,13 @@ class DefaultAgent(ConversationEntity):
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
 
+        # entity_id -> names, updated per entity once the slot lists are made
+        self._entity_names: dict[str, EntityNames] = {}
+        self._entity_names_version = 0
+        self._updated_entity_ids: set[str] = set()
+        self._update_exposed = False
+        self._update_areas = False
+
         # Used to filter slot lists before intent matching
         self._exposed_names_trie: Trie | None = None
         self._unexposed_names_trie: Trie | None = None
@@ -248,7 +318,7 @@ class DefaultAgent(ConversationEntity):
         # Sentences that will trigger a callback (skipping intent recognition)
         self.trigger_sentences: list[TriggerData] = []
         self._trigger_intents: Intents | None = None
-        self._unsub_clear_slot_list: list[Callable[[], None]] | None = None
+        self._unsub_slot_list_updates: list[Callable[[], None]] | None = None
         self._load_intents_lock = asyncio.Lock()
 
         # LRU cache to avoid unnecessary intent matching
@@ -274,32 +344,51 @@ class DefaultAgent(ConversationEntity):
         return not event_data["old_state"] or not event_data["new_state"]
 
     @core.callback
-    def _listen_clear_slot_list(self) -> None:
-        """Listen for changes that can invalidate slot list."""
-        assert self._unsub_clear_slot_list is None
+    def _listen_slot_list_updates(self) -> None:
+        """Listen for changes that require updating the slot lists."""
+        assert self._unsub_slot_list_updates is None
 
-        self._unsub_clear_slot_list = [
+        self._unsub_slot_list_updates = [
             self.hass.bus.async_listen(
                 ar.EVENT_AREA_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_areas_updated,
             ),
             self.hass.bus.async_listen(
                 fr.EVENT_FLOOR_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_areas_updated,
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_entity_updated,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_entity_updated,
                 event_filter=self._filter_state_changes,
             ),
-            async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
+            async_listen_entity_updates(self.hass, DOMAIN, self._async_exposed_updated),
         ]
 
+    @core.callback
+    def _async_areas_updated(self, event: core.Event[Any]) -> None:
+        """Update the area and floor slot lists before they are used next."""
+        self._update_areas = True
+
+    @core.callback
+    def _async_entity_updated(
+        self,
+        event: core.Event[er.EventEntityRegistryUpdatedData]
+        | core.Event[core.EventStateChangedData],
+    ) -> None:
+        """Update the names of an entity before they are used next."""
+        self._updated_entity_ids.add(event.data["entity_id"])
+
+    @core.callback
+    def _async_exposed_updated(self) -> None:
+        """Update the names of the entities with a changed expose setting."""
+        self._update_exposed = True
+
     async def async_recognize_intent(
         self, user_input: ConversationInput, strict_intents_only: bool = False
     ) -> RecognizeResult | None:
@@ -318,12 +407,16 @@ class DefaultAgent(ConversationEntity):
         if self._exposed_names_trie is not None:
             # Filter by input string
             text_lower = user_input.text.strip().lower()
-            slot_lists["name"] = TextSlotList(
-                name="name",
-                values=[
-                    result[2] for result in self._exposed_names_trie.find(text_lower)
-                ],
-            )
+            slot_lists = {
+                **slot_lists,
+                "name": TextSlotList(
+                    name="name",
+                    values=[
+                        result[2]
+                        for result in self._exposed_names_trie.find(text_lower)
+                    ],
+                ),
+            }
 
         start = time.monotonic()
 
@@ -705,61 +798,56 @@ class DefaultAgent(ConversationEntity):
 
     def _get_unexposed_entity_names(self, text: str) -> TextSlotList:
         """Get filtered slot list with unexposed entity names in Home Assistant."""
-        if self._unexposed_names_trie is None:
-            # Build trie
-            self._unexposed_names_trie = Trie()
-            for name_tuple in self._get_entity_name_tuples(exposed=False):
-                self._unexposed_names_trie.insert(
-                    name_tuple[0].lower(),
-                    TextSlotValue.from_tuple(name_tuple, allow_template=False),
-                )
+        if (unexposed_names_trie := self._unexposed_names_trie) is None:
+            # Build trie. This runs in the executor, so it is only kept when
+            # the entity names were not updated in the meantime.
+            version = self._entity_names_version
+            unexposed_names_trie = Trie()
+            for entity_names in list(self._entity_names.values()):
+                if not entity_names.exposed:
+                    for name_text, name_value in entity_names.get_values():
+                        unexposed_names_trie.insert(name_text, name_value)
+
+            if version == self._entity_names_version:
+                self._unexposed_names_trie = unexposed_names_trie
 
         # Build filtered slot list
         text_lower = text.strip().lower()
         return TextSlotList(
             name="name",
-            values=[
-                result[2] for result in self._unexposed_names_trie.find(text_lower)
-            ],
+            values=[result[2] for result in unexposed_names_trie.find(text_lower)],
         )
 
-    def _get_entity_name_tuples(
-        self, exposed: bool
-    ) -> Iterable[tuple[str, str, dict[str, Any]]]:
-        """Yield (input name, output name, context) tuples for entities."""
-        entity_registry = er.async_get(self.hass)
-
-        for state in self.hass.states.async_all():
-            entity_exposed = async_should_expose(self.hass, DOMAIN, state.entity_id)
-            if exposed and (not entity_exposed):
-                # Required exposed, entity is not
-                continue
+    def _get_entity_names(
+        self, state: core.State, entity_registry: er.EntityRegistry
+    ) -> EntityNames:
+        """Return the names of an entity with its expose setting."""
+        name_tuples: list[tuple[str, str, dict[str, Any]]] = []
+
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
 
-            if (not exposed) and entity_exposed:
-                # Required not exposed, entity is
-                continue
+        if (entity := entity_registry.async_get(state.entity_id)) and entity.aliases:
+            for alias in entity.aliases:
+                alias = alias.strip()
+                if not alias:
+                    continue
 
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            if (
-                entity := entity_registry.async_get(state.entity_id)
-            ) and entity.aliases:
-                for alias in entity.aliases:
-                    alias = alias.strip()
-                    if not alias:
-                        continue
+                name_tuples.append((alias, alias, context))
 
-                    yield (alias, alias, context)
+        # Default name
+        name_tuples.append((state.name, state.name, context))
 
-            # Default name
-            yield (state.name, state.name, context)
+        return EntityNames(
+            exposed=async_should_expose(self.hass, DOMAIN, state.entity_id),
+            name_tuples=name_tuples,
+        )
 
     def _recognize_strict(
         self,
@@ -1043,41 +1131,43 @@ class DefaultAgent(ConversationEntity):
             language_variant,
         )
 
-    @core.callback
-    def _async_clear_slot_list(self, event: core.Event[Any] | None = None) -> None:
-        """Clear slot lists when a registry has changed."""
-        # Two subscribers can be scheduled at same time
-        _LOGGER.debug("Clearing slot lists")
-        if self._unsub_clear_slot_list is None:
-            return
-        self._slot_lists = None
-        self._exposed_names_trie = None
-        self._unexposed_names_trie = None
-        for unsub in self._unsub_clear_slot_list:
-            unsub()
-        self._unsub_clear_slot_list = None
-
-        # Slot lists have changed, so we must clear the cache
-        self._intent_cache.clear()
-
     @core.callback
     def _make_slot_lists(self) -> dict[str, SlotList]:
-        """Create slot lists with areas and entity names/aliases."""
-        if self._slot_lists is not None:
+        """Create slot lists with areas and floors, and the entity name tries.
+
+        The slot lists and tries are made once, then only the areas, floors
+        and entities that changed are updated before they are used again.
+        """
+        if self._slot_lists is None:
+            self._slot_lists = self._make_area_slot_lists()
+            self._make_entity_names()
+            self._listen_slot_list_updates()
             return self._slot_lists
 
-        start = time.monotonic()
+        if self._update_areas:
+            self._update_areas = False
+            self._slot_lists = self._make_area_slot_lists()
 
-        # Gather entity names, keeping track of exposed names.
-        # We try intent recognition with only exposed names first, then all names.
-        #
-        # NOTE: We do not pass entity ids in here because multiple entities may
-        # have the same name. The intent matcher doesn't gather all matching
-        # values for a list, just the first. So we will need to match by name no
-        # matter what.
-        exposed_entity_names = list(self._get_entity_name_tuples(exposed=True))
-        _LOGGER.debug("Exposed entities: %s", exposed_entity_names)
+            # Areas are not filtered by the input text and the area of the
+            # device is part of the intent context, so clear the whole cache
+            self._intent_cache.clear()
 
+        if self._update_exposed:
+            self._update_exposed = False
+            for entity_id, entity_names in self._entity_names.items():
+                if entity_names.exposed != async_should_expose(
+                    self.hass, DOMAIN, entity_id
+                ):
+                    self._updated_entity_ids.add(entity_id)
+
+        if self._updated_entity_ids:
+            self._update_entity_names()
+
+        return self._slot_lists
+
+    @core.callback
+    def _make_area_slot_lists(self) -> dict[str, SlotList]:
+        """Create slot lists with area and floor names/aliases."""
         # Expose all areas.
         areas = ar.async_get(self.hass)
         area_names = []
@@ -1108,28 +1198,108 @@ class DefaultAgent(ConversationEntity):
 
                 floor_names.append((alias, floor.name))
 
-        # Build trie
-        self._exposed_names_trie = Trie()
-        name_list = TextSlotList.from_tuples(exposed_entity_names, allow_template=False)
-        for name_value in name_list.values:
-            assert isinstance(name_value.text_in, TextChunk)
-            name_text = name_value.text_in.text.strip().lower()
-            self._exposed_names_trie.insert(name_text, name_value)
-
-        self._slot_lists = {
+        return {
             "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": name_list,
             "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
         }
 
-        self._listen_clear_slot_list()
+    @core.callback
+    def _make_entity_names(self) -> None:
+        """Gather the names of all entities and build the exposed names trie."""
+        start = time.monotonic()
+
+        # Gather entity names, keeping track of exposed names.
+        # We try intent recognition with only exposed names first, then all names.
+        #
+        # NOTE: We do not pass entity ids in here because multiple entities may
+        # have the same name. The intent matcher doesn't gather all matching
+        # values for a list, just the first. So we will need to match by name no
+        # matter what.
+        entity_registry = er.async_get(self.hass)
+        self._entity_names = {
+            state.entity_id: self._get_entity_names(state, entity_registry)
+            for state in self.hass.states.async_all()
+        }
+        self._entity_names_version += 1
+        self._updated_entity_ids.clear()
+        self._update_exposed = False
+
+        # Build trie
+        self._exposed_names_trie = Trie()
+        self._unexposed_names_trie = None
+        for entity_names in self._entity_names.values():
+            if entity_names.exposed:
+                for name_text, name_value in entity_names.get_values():
+                    self._exposed_names_trie.insert(name_text, name_value)
 
         _LOGGER.debug(
             "Created slot lists in %.2f seconds",
             time.monotonic() - start,
         )
 
-        return self._slot_lists
+    @core.callback
+    def _update_entity_names(self) -> None:
+        """Update the names of the changed entities.
+
+        Only the cached results for texts that contain an old or a new name
+        of a changed entity are removed, since the names are filtered by the
+        input text before intent matching.
+        """
+        start = time.monotonic()
+        entity_registry = er.async_get(self.hass)
+        updated_entity_ids = self._updated_entity_ids
+        self._updated_entity_ids = set()
+        self._entity_names_version += 1
+        changed_names: set[str] = set()
+        unexposed_names_changed = False
+
+        for entity_id in updated_entity_ids:
+            old_names = self._entity_names.pop(entity_id, None)
+            new_names: EntityNames | None = None
+            if (state := self.hass.states.get(entity_id)) is not None:
+                new_names = self._get_entity_names(state, entity_registry)
+                if (
+                    old_names is not None
+                    and old_names.exposed == new_names.exposed
+                    and old_names.name_tuples == new_names.name_tuples
+                ):
+                    # Nothing changed, keep the values in the tries
+                    self._entity_names[entity_id] = old_names
+                    continue
+
+                self._entity_names[entity_id] = new_names
+
+            for entity_names, update_trie in (
+                (old_names, _trie_remove),
+                (new_names, Trie.insert),
+            ):
+                if entity_names is None:
+                    continue
+
+                names_trie: Trie | None = None
+                if entity_names.exposed:
+                    names_trie = self._exposed_names_trie
+                else:
+                    unexposed_names_changed = True
+
+                for name_text, name_value in entity_names.get_values():
+                    changed_names.add(name_text)
+                    if names_trie is not None:
+                        update_trie(names_trie, name_text, name_value)
+
+        if unexposed_names_changed:
+            # The unexposed names trie may be read in the executor, so it is
+            # rebuilt there when it is needed instead of being updated here
+            self._unexposed_names_trie = None
+
+        # Slot lists have changed, so we must remove the affected results
+        self._intent_cache.invalidate(changed_names)
+
+        _LOGGER.debug(
+            "Updated slot lists for %s entities in %.2f seconds",
+            len(updated_entity_ids),
+            time.monotonic() - start,
+        )
 
     def _make_intent_context(
         self, user_input: ConversationInput
@@ -0,0 +1,266 @@
+"""Coalesce concurrent history queries into shared recorder queries."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime as dt, timedelta
+import logging
+from typing import Any, cast
+
+from sqlalchemy.orm.session import Session
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+type CompressedStates = dict[str, list[dict[str, Any]]]
+type HistoryResponseBuilder[_T] = Callable[[CompressedStates, dt], _T]
+
+type _QueryKey = tuple[dt | None, bool, bool, bool, bool]
+
+# The history cards of a dashboard compute their start time when they
+# are loaded so the start times of their requests differ slightly
+COALESCE_START_TIME_WINDOW = timedelta(seconds=1)
+
+
+@dataclass(slots=True)
+class _HistoryRequest:
+    """A request waiting for the result of a coalesced query."""
+
+    start_time: dt
+    entity_ids: list[str]
+    build: HistoryResponseBuilder[Any]
+    future: asyncio.Future[Any]
+
+
+@dataclass(slots=True)
+class _CoalescedQuery:
+    """A query that requests for a close time window can still join."""
+
+    first_start_time: dt
+    start_time: dt
+    requests: list[_HistoryRequest] = field(default_factory=list)
+
+
+class HistoryQueryCoalescer:
+    """Merge concurrent history requests for the same window into one query.
+
+    Every history card of a dashboard requests the history of its
+    entities for the same time window when the dashboard is loaded.
+    The requests with the same end time and options that arrive before
+    the query runs are merged into a single recorder query for all of
+    their entities and the result is split between them.
+
+    Requests that include the state at the start time also join when
+    their start time is within COALESCE_START_TIME_WINDOW of the first
+    request of the query, which then starts at the earliest start time.
+    Requests without the start time state must not get states from
+    before their start time since they continue a previous response.
+
+    The recorder looks further back for the start state when only a
+    single entity is queried, so requests that only match a single
+    recorded entity are still queried on their own.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._pending: dict[_QueryKey, list[_CoalescedQuery]] = {}
+        self.queries = 0
+        self.requests = 0
+
+    async def async_get_significant_states[_T](
+        self,
+        start_time: dt,
+        end_time: dt | None,
+        entity_ids: list[str],
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+        build: HistoryResponseBuilder[_T],
+    ) -> _T:
+        """Return the response built from the compressed significant states.
+
+        The response is built in the executor by calling build with the
+        states of the requested entities and the end time of the query.
+
+        If end_time is None, the history until the query runs is fetched.
+        """
+        self.requests += 1
+        key = (
+            end_time,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        pending = self._pending.setdefault(key, [])
+        for query in pending:
+            if query.first_start_time == start_time or (
+                include_start_time_state
+                and abs(query.first_start_time - start_time)
+                <= COALESCE_START_TIME_WINDOW
+            ):
+                query.start_time = min(query.start_time, start_time)
+                break
+        else:
+            query = _CoalescedQuery(start_time, start_time)
+            pending.append(query)
+            # The query runs in the next iteration of the event loop
+            # so the requests that arrive in this one can join it
+            self._hass.async_create_task(
+                self._async_run_query(key, query),
+                "history query",
+                eager_start=False,
+            )
+        future: asyncio.Future[_T] = self._hass.loop.create_future()
+        query.requests.append(_HistoryRequest(start_time, entity_ids, build, future))
+        return await future
+
+    async def _async_run_query(self, key: _QueryKey, query: _CoalescedQuery) -> None:
+        """Run a coalesced query and resolve its requests."""
+        pending = self._pending[key]
+        pending.remove(query)
+        if not pending:
+            del self._pending[key]
+        requests = [request for request in query.requests if not request.future.done()]
+        if not requests:
+            return
+        try:
+            queries, results = await get_instance(self._hass).async_add_executor_job(
+                self._get_significant_states, key, query.start_time, requests
+            )
+        except Exception as err:  # noqa: BLE001
+            results = [err] * len(requests)
+            queries = 0
+        self.queries += queries
+        _LOGGER.debug(
+            "Served %s history requests with %s queries, %s requests with %s"
+            " queries in total",
+            len(requests),
+            queries,
+            self.requests,
+            self.queries,
+        )
+        for request, result in zip(requests, results, strict=True):
+            if request.future.done():
+                continue
+            if isinstance(result, Exception):
+                request.future.set_exception(result)
+            else:
+                request.future.set_result(result)
+
+    def _get_significant_states(
+        self, key: _QueryKey, start_time: dt, requests: list[_HistoryRequest]
+    ) -> tuple[int, list[Any]]:
+        """Query the significant states and build the responses.
+
+        Returns the number of queries and the response or the raised
+        exception for each request.
+        """
+        hass = self._hass
+        (
+            end_time,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        ) = key
+        query_end_time = end_time or dt_util.utcnow()
+
+        def _query(
+            session: Session, start_time: dt, entity_ids: list[str]
+        ) -> CompressedStates:
+            return cast(
+                CompressedStates,
+                history.get_significant_states_with_session(
+                    hass,
+                    session,
+                    start_time,
+                    query_end_time,
+                    entity_ids,
+                    None,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    True,
+                ),
+            )
+
+        states_by_request: list[CompressedStates | Exception] = []
+        queries = 0
+        with session_scope(hass=hass, read_only=True) as session:
+            shared_entity_ids: dict[str, None] = {}
+            shared: list[bool] = []
+            if (
+                len(requests) > 1
+                and (
+                    states_meta_manager := get_instance(hass).states_meta_manager
+                ).active
+            ):
+                entity_id_to_metadata_id = states_meta_manager.get_many(
+                    {
+                        entity_id: None
+                        for request in requests
+                        for entity_id in request.entity_ids
+                    },
+                    session,
+                    False,
+                )
+            else:
+                entity_id_to_metadata_id = {}
+            for request in requests:
+                metadata_ids = {
+                    entity_id_to_metadata_id.get(entity_id)
+                    for entity_id in request.entity_ids
+                }
+                metadata_ids.discard(None)
+                # Only requests for multiple recorded entities get the
+                # same result when they are queried together
+                shared.append(len(metadata_ids) > 1)
+                if shared[-1]:
+                    shared_entity_ids.update(dict.fromkeys(request.entity_ids))
+            shared_states: CompressedStates | Exception = {}
+            if shared_entity_ids:
+                queries += 1
+                try:
+                    shared_states = _query(session, start_time, list(shared_entity_ids))
+                except Exception as err:  # noqa: BLE001
+                    shared_states = err
+            for request, is_shared in zip(requests, shared, strict=True):
+                if is_shared:
+                    states_by_request.append(shared_states)
+                    continue
+                queries += 1
+                try:
+                    states_by_request.append(
+                        _query(session, request.start_time, request.entity_ids)
+                    )
+                except Exception as err:  # noqa: BLE001
+                    states_by_request.append(err)
+
+        results: list[Any] = []
+        for request, is_shared, states in zip(
+            requests, shared, states_by_request, strict=True
+        ):
+            if isinstance(states, Exception):
+                results.append(states)
+                continue
+            if is_shared:
+                states = {
+                    entity_id: states[entity_id]
+                    for entity_id in request.entity_ids
+                    if entity_id in states
+                }
+            try:
+                results.append(request.build(states, query_end_time))
+            except Exception as err:  # noqa: BLE001
+                results.append(err)
+        return queries, results
@@ -1,7 +1,18 @@
 """History integration constants."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.util.hass_dict import HassKey
+
+if TYPE_CHECKING:
+    from .coalescer import HistoryQueryCoalescer
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+DATA_HISTORY_COALESCER: HassKey[HistoryQueryCoalescer] = HassKey(f"{DOMAIN}_coalescer")
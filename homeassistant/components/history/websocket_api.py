@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
+from functools import partial
 import logging
 from typing import Any, cast
 
@@ -38,7 +39,12 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .coalescer import CompressedStates, HistoryQueryCoalescer
+from .const import (
+    DATA_HISTORY_COALESCER,
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,39 +64,16 @@ class HistoryLiveStream:
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
+    hass.data[DATA_HISTORY_COALESCER] = HistoryQueryCoalescer(hass)
     websocket_api.async_register_command(hass, ws_get_history_during_period)
     websocket_api.async_register_command(hass, ws_stream)
 
 
-def _ws_get_significant_states(
-    hass: HomeAssistant,
-    msg_id: int,
-    start_time: dt,
-    end_time: dt | None,
-    entity_ids: list[str] | None,
-    include_start_time_state: bool,
-    significant_changes_only: bool,
-    minimal_response: bool,
-    no_attributes: bool,
+def _generate_history_during_period_response(
+    msg_id: int, states: CompressedStates, end_time: dt
 ) -> bytes:
-    """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
-    )
+    """Convert history significant_states to json in the executor."""
+    return json_bytes(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -156,10 +139,7 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
-            _ws_get_significant_states,
-            hass,
-            msg["id"],
+        await hass.data[DATA_HISTORY_COALESCER].async_get_significant_states(
             start_time,
             end_time,
             entity_ids,
@@ -167,6 +147,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            partial(_generate_history_during_period_response, msg["id"]),
         )
     )
 
@@ -211,33 +192,13 @@ def _generate_websocket_response(
 
 
 def _generate_historical_response(
-    hass: HomeAssistant,
     msg_id: int,
     start_time: dt,
-    end_time: dt,
-    entity_ids: list[str] | None,
-    include_start_time_state: bool,
-    significant_changes_only: bool,
-    minimal_response: bool,
-    no_attributes: bool,
     send_empty: bool,
-) -> tuple[float, dt | None, bytes | None]:
+    states: CompressedStates,
+    end_time: dt,
+) -> tuple[float, dt | None, bytes | None, dt]:
     """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
-    )
     last_time_ts = 0.0
     for state_list in states.values():
         if (
@@ -252,7 +213,7 @@ def _generate_historical_response(
         # so the websocket client knows it should render/process/consume the
         # data.
         if not send_empty:
-            return last_time_ts, None, None
+            return last_time_ts, None, None, end_time
         last_time_dt = end_time
     else:
         last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
@@ -261,6 +222,7 @@ def _generate_historical_response(
         last_time_ts,
         last_time_dt,
         _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+        end_time,
     )
 
 
@@ -269,20 +231,26 @@ async def _async_send_historical_states(
     connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
-    end_time: dt,
-    entity_ids: list[str] | None,
+    end_time: dt | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
-) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
-    instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
+) -> tuple[dt | None, dt]:
+    """Fetch history significant_states and send them to the client.
+
+    If end_time is None, the history until the query runs is fetched.
+
+    Returns the time of the last state sent and the end time of the query.
+    """
+    (
+        last_time_ts,
+        last_time_dt,
+        payload,
+        query_end_time,
+    ) = await hass.data[DATA_HISTORY_COALESCER].async_get_significant_states(
         start_time,
         end_time,
         entity_ids,
@@ -290,11 +258,11 @@ async def _async_send_historical_states(
         significant_changes_only,
         minimal_response,
         no_attributes,
-        send_empty,
+        partial(_generate_historical_response, msg_id, start_time, send_empty),
     )
     if payload:
         connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    return last_time_dt if last_time_ts != 0 else None, query_end_time
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -517,16 +485,20 @@ async def ws_stream(
         significant_changes_only=significant_changes_only,
         minimal_response=minimal_response,
     )
-    subscriptions_setup_complete_time = dt_util.utcnow()
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
-    # Fetch everything from history
-    last_event_time = await _async_send_historical_states(
+    # Fetch everything from history until the query runs, which is
+    # after the subscriptions are set up, so the live events since
+    # then are not missed
+    (
+        last_event_time,
+        subscriptions_setup_complete_time,
+    ) = await _async_send_historical_states(
         hass,
         connection,
         msg_id,
         start_time,
-        subscriptions_setup_complete_time,
+        None,
         entity_ids,
         include_start_time_state,
         significant_changes_only,
@@ -7,6 +7,7 @@ from contextlib import suppress
 from dataclasses import dataclass
 import logging
 import math
+import os
 import queue
 import threading
 import time
@@ -14,7 +15,7 @@ from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
-from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
+from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import requests.exceptions
 import urllib3.exceptions
@@ -47,6 +48,7 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -81,21 +83,21 @@ from .const import (
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
-    INFLUX_CONF_FIELDS,
-    INFLUX_CONF_MEASUREMENT,
     INFLUX_CONF_ORG,
     INFLUX_CONF_STATE,
-    INFLUX_CONF_TAGS,
-    INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAYED_MESSAGE,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_ERROR,
+    SPOOL_FILE,
+    SPOOL_MAX_SIZE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
@@ -105,6 +107,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Microseconds in the unit of the precision
+_PRECISION_MICROSECONDS = {"s": 1_000_000, "ms": 1000, "us": 1}
+
 
 def create_influx_url(conf: dict) -> dict:
     """Build URL used from config inputs and default when necessary."""
@@ -201,10 +206,55 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
-    """Build event to json converter and add to config."""
+def _escape_key(key: str) -> str:
+    """Escape a measurement, tag or key like influxdb.line_protocol.make_line."""
+    return (
+        key.replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+def _escape_string(value: str) -> str:
+    """Escape a string field value like influxdb.line_protocol.make_line."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _encode_line(
+    measurement: str,
+    tags: dict[str, Any],
+    fields: dict[str, float | str],
+    timestamp: float,
+    precision: str | None,
+) -> str:
+    """Encode a point in the line protocol."""
+    line = _escape_key(measurement)
+    if tag_list := [
+        f"{_escape_key(key)}={_escape_key(value)}"
+        for key in sorted(tags)
+        if key and (value := "" if tags[key] is None else str(tags[key]))
+    ]:
+        line += "," + ",".join(tag_list)
+    if fields:
+        line += " " + ",".join(
+            f'{_escape_key(key)}="{_escape_string(value)}"'
+            if isinstance(value, str)
+            else f"{_escape_key(key)}={value!r}"
+            for key, value in sorted(fields.items())
+            if key
+        )
+    microseconds = round(timestamp * 1_000_000)
+    if precision is None or precision == "ns":
+        return f"{line} {microseconds * 1000}"
+    return f"{line} {microseconds // _PRECISION_MICROSECONDS[precision]}"
+
+
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:
+    """Build the converter of events to lines of the line protocol."""
     entity_filter = convert_include_exclude_filter(conf)
-    tags = conf.get(CONF_TAGS)
+    tags: dict[str, str] = conf[CONF_TAGS]
     tags_attributes: list[str] = conf[CONF_TAGS_ATTRIBUTES]
     default_measurement = conf.get(CONF_DEFAULT_MEASUREMENT)
     measurement_attr: str = conf[CONF_MEASUREMENT_ATTR]
@@ -215,9 +265,10 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
         conf[CONF_COMPONENT_CONFIG_DOMAIN],
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
+    precision = conf.get(CONF_PRECISION)
 
-    def event_to_json(event: Event) -> dict[str, Any] | None:
-        """Convert event into json in format Influx expects."""
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a line of the line protocol."""
         state: State | None = event.data.get(EVENT_NEW_STATE)
         if (
             state is None
@@ -266,59 +317,55 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
-        json: dict[str, Any] = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
+        point_tags: dict[str, Any] = {
+            CONF_DOMAIN: state.domain,
+            CONF_ENTITY_ID: state.object_id,
         }
+        fields: dict[str, Any] = {}
         if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
+            fields[INFLUX_CONF_STATE] = state.state
         if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+            fields[INFLUX_CONF_VALUE] = _state_as_value
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
+                point_tags[key] = value
             elif (
                 (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
                 and (key != "device_class" or include_dc)
                 and key not in ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in fields:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we cannot do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields[new_key] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
                 with suppress(KeyError, TypeError):
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
+                    if not math.isfinite(fields[key]):
+                        del fields[key]
 
-        json[INFLUX_CONF_TAGS].update(tags)
+        point_tags.update(tags)
 
-        return json
+        return _encode_line(
+            str(measurement), point_tags, fields, event.time_fired_timestamp, precision
+        )
 
-    return event_to_json
+    return event_to_line
 
 
 @dataclass
@@ -326,7 +373,7 @@ class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
-    write: Callable[[str], None]
+    write: Callable[[list[str]], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -351,12 +398,13 @@ def get_influx_connection(  # noqa: C901
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
-        write_api = influx.write_api(write_options=initial_write_mode)
+        # The writes are batched by the InfluxThread which needs to know when
+        # they fail to retry them
+        write_api = influx.write_api(write_options=SYNCHRONOUS)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write lines to V2 influx."""
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -367,7 +415,7 @@ def get_influx_connection(  # noqa: C901
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -391,7 +439,6 @@ def get_influx_connection(  # noqa: C901
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -431,10 +478,10 @@ def get_influx_connection(  # noqa: C901
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write lines to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -443,7 +490,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -491,9 +538,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_line = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_line, max_tries)
     instance.start()
 
     def shutdown(event):
@@ -508,19 +555,25 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
+    """A threaded event handler class.
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    The events which cannot be written are spooled to disk and written
+    once writing to Influx works again.
+    """
+
+    def __init__(self, hass, influx, event_to_line, max_tries):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
             queue.SimpleQueue()
         )
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
         self.write_errors = 0
         self.shutdown = False
+        self.spool_path = hass.config.path(STORAGE_DIR, SPOOL_FILE)
+        self.spool_size = 0
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -534,19 +587,26 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
+    def get_events_lines(self):
+        """Return a batch of events encoded for writing.
+
+        The batch is complete when it is full or when the batch timeout
+        has passed since its first event.
+        """
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
-        json = []
+        lines = []
+        deadline = 0.0
 
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
+            while len(lines) < BATCH_BUFFER_SIZE and not self.shutdown:
+                timeout = None if count == 0 else max(0.0, deadline - time.monotonic())
                 item = self.queue.get(timeout=timeout)
+                if count == 0:
+                    deadline = time.monotonic() + self.batch_timeout()
                 count += 1
 
                 if item is None:
@@ -556,8 +616,8 @@ class InfluxThread(threading.Thread):
                     age = time.monotonic() - timestamp
 
                     if age < queue_seconds:
-                        if event_json := self.event_to_json(event):
-                            json.append(event_json)
+                        if line := self.event_to_line(event):
+                            lines.append(line)
                     else:
                         dropped += 1
                 elif isinstance(item, threading.Event):
@@ -566,37 +626,88 @@ class InfluxThread(threading.Thread):
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
-        return count, json
+        return count, lines
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+    def write_to_influxdb(self, lines):
+        """Write encoded events to influxdb, with retry."""
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
-
+                self.influx.write(lines)
+            except ValueError as err:
+                _LOGGER.error(err)
+                break
+            except ConnectionError as err:
+                if retry < self.max_tries:
+                    time.sleep(RETRY_DELAY)
+                    continue
+                if not self.write_errors and not self.spool_size:
+                    _LOGGER.error(err)
+                if not self._spool(lines):
+                    self.write_errors += len(lines)
+            else:
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                _LOGGER.debug(WROTE_MESSAGE, len(lines))
+                if self.spool_size:
+                    self._replay_spool()
                 break
+
+    def _spool(self, lines, mode="a"):
+        """Write the lines to the spool, return if they fit."""
+        data = "".join(f"{line}\n" for line in lines).encode()
+        spool_size = len(data) if mode == "w" else self.spool_size + len(data)
+        if spool_size > SPOOL_MAX_SIZE:
+            return False
+        try:
+            os.makedirs(os.path.dirname(self.spool_path), exist_ok=True)
+            with open(self.spool_path, f"{mode}b") as spool:
+                spool.write(data)
+        except OSError as err:
+            _LOGGER.error(SPOOL_ERROR, err)
+            return False
+        self.spool_size = spool_size
+        return True
+
+    def _replay_spool(self):
+        """Write the spooled events in batches and remove the spool."""
+        try:
+            with open(self.spool_path, "rb") as spool:
+                lines = spool.read().decode(errors="replace").split("\n")
+        except OSError as err:
+            _LOGGER.error(SPOOL_ERROR, err)
+            self.spool_size = 0
+            return
+        # Drop what follows the last complete line, it is
+        # empty unless Home Assistant stopped while spooling
+        del lines[-1]
+
+        for start in range(0, len(lines), BATCH_BUFFER_SIZE):
+            try:
+                self.influx.write(lines[start : start + BATCH_BUFFER_SIZE])
             except ValueError as err:
                 _LOGGER.error(err)
-                break
-            except ConnectionError as err:
-                if retry < self.max_tries:
-                    time.sleep(RETRY_DELAY)
-                else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+            except ConnectionError:
+                # Keep the lines which have not been written
+                self._spool(lines[start:], "w")
+                return
+
+        try:
+            os.remove(self.spool_path)
+        except OSError as err:
+            _LOGGER.error(SPOOL_ERROR, err)
+        self.spool_size = 0
+        _LOGGER.debug(REPLAYED_MESSAGE, len(lines))
 
     def run(self):
         """Process incoming events."""
+        with suppress(OSError):
+            self.spool_size = os.path.getsize(self.spool_path)
         while not self.shutdown:
-            _, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+            _, lines = self.get_events_lines()
+            if lines:
+                self.write_to_influxdb(lines)
 
     def block_till_done(self):
         """Block till all events processed.
@@ -77,7 +77,9 @@ RETRY_DELAY = 20
 QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
-BATCH_BUFFER_SIZE = 100
+BATCH_BUFFER_SIZE = 1000
+SPOOL_FILE = "influxdb.spool"
+SPOOL_MAX_SIZE = 32 * 1024 * 1024  # bytes
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -120,6 +122,8 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+REPLAYED_MESSAGE = "Replayed %d spooled events."
+SPOOL_ERROR = "Could not access the spool of unwritten events due to '%s'."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
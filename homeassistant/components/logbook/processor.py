@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
+from itertools import dropwhile, islice
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -157,32 +159,74 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
+            return self.humanify(self._execute_events_stmt(session, start_day, end_day))
+
+    def get_events_after(
+        self,
+        start_day: dt,
+        end_day: dt,
+        after: tuple[float, int] | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Get up to limit events for a period of time.
+
+        The period can be fetched with multiple calls by passing the time
+        of the last event fetched and the number of events fetched with
+        that time as after, these events are skipped. The times of the
+        events must be timestamps.
+        """
+        if after:
+            start_day = dt_util.utc_from_timestamp(after[0]) - timedelta(microseconds=1)
+        with session_scope(hass=self.hass, read_only=True) as session:
+            events: Iterable[dict[str, Any]] = _humanify(
+                self.hass,
+                self._execute_events_stmt(session, start_day, end_day),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
             )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
+            if after:
+                after_when, after_count = after
+                events = islice(
+                    dropwhile(
+                        lambda event: event[LOGBOOK_ENTRY_WHEN] < after_when, events
+                    ),
+                    after_count,
+                    None,
+                )
+            return list(islice(events, limit))
+
+    def _execute_events_stmt(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> Sequence[Row] | Result:
+        """Execute the statement that selects the events for a period of time.
+
+        The rows are fetched in batches for periods longer than a day.
+        """
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
+        )
+        stmt = statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+        return execute_stmt_lambda_element(
+            session, stmt, start_day, end_day, orm_rows=False
+        )
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
+from itertools import takewhile
 import logging
 from typing import Any
 
@@ -35,6 +36,11 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# maximum number of historical events to deliver in a single message
+MAX_EVENTS_PER_MESSAGE = 5000
+# maximum number of messages waiting to be written to the websocket
+# before the next chunk of historical events is fetched
+MAX_PENDING_HISTORICAL_MESSAGES = 2
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -104,12 +110,16 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
             event_processor,
             partial,
         )
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while fetching historical events
+            return last_event_time
         # If there is no last_event_time, there are no historical
         # results, but we still send an empty message
         # if its the last one (not partial) so
@@ -125,23 +135,31 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
         event_processor,
         partial=True,
     )
+    if msg_id not in connection.subscriptions:
+        # Unsubscribe happened while fetching historical events
+        return recent_query_last_event_time
     if recent_query_last_event_time:
         connection.send_message(recent_message)
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
         event_processor,
         partial,
     )
+    if msg_id not in connection.subscriptions:
+        # Unsubscribe happened while fetching historical events
+        return recent_query_last_event_time or older_query_last_event_time
     # If there is no last_event_time, there are no historical
     # results, but we still send an empty message
     # if its the last one (not partial) so
@@ -156,21 +174,44 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
     event_processor: EventProcessor,
     partial: bool,
 ) -> tuple[bytes, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
-        _ws_stream_get_events,
-        msg_id,
-        start_time,
-        end_time,
-        event_processor,
-        partial,
-    )
+    """Fetch the events in chunks and send all but the last chunk.
+
+    Every chunk is fetched in its own executor job so the database
+    session is not held while the client reads the messages. The next
+    chunk is only fetched once the client caught up with the messages
+    so the memory used does not grow when the client reads slower than
+    the events are fetched, and no more chunks are fetched once the
+    client unsubscribed.
+
+    Returns the message with the last chunk and the time of the last event.
+    """
+    instance = get_instance(hass)
+    after: tuple[float, int] | None = None
+    last_event_time: dt | None = None
+    while True:
+        message, chunk_last_event_time, after = await instance.async_add_executor_job(
+            _ws_stream_get_events,
+            msg_id,
+            start_time,
+            end_time,
+            event_processor,
+            partial,
+            after,
+        )
+        last_event_time = chunk_last_event_time or last_event_time
+        if after is None:
+            return message, last_event_time
+        connection.send_message(message)
+        await connection.async_wait_drained(MAX_PENDING_HISTORICAL_MESSAGES)
+        if msg_id not in connection.subscriptions:
+            return message, last_event_time
 
 
 def _generate_stream_message(
@@ -184,18 +225,14 @@ def _generate_stream_message(
     }
 
 
-def _ws_stream_get_events(
+def _generate_stream_message_bytes(
     msg_id: int,
+    events: list[dict[str, Any]],
     start_day: dt,
     end_day: dt,
-    event_processor: EventProcessor,
     partial: bool,
-) -> tuple[bytes, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
-    last_time = None
-    if events:
-        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+) -> bytes:
+    """Generate a logbook stream message response as json."""
     message = _generate_stream_message(events, start_day, end_day)
     if partial:
         # This is a hint to consumers of the api that
@@ -203,7 +240,51 @@ def _ws_stream_get_events(
         # data in case the UI needs to show that historical
         # data is still loading in the future
         message["partial"] = True
-    return json_bytes(messages.event_message(msg_id, message)), last_time
+    return json_bytes(messages.event_message(msg_id, message))
+
+
+def _ws_stream_get_events(
+    msg_id: int,
+    start_day: dt,
+    end_day: dt,
+    event_processor: EventProcessor,
+    partial: bool,
+    after: tuple[float, int] | None,
+) -> tuple[bytes, dt | None, tuple[float, int] | None]:
+    """Fetch a chunk of events and convert them to json in the executor.
+
+    Returns the message, the time of the last event and where to
+    continue fetching the events or None if this was the last chunk.
+    """
+    events = event_processor.get_events_after(
+        start_day, end_day, after, MAX_EVENTS_PER_MESSAGE + 1
+    )
+    has_more = len(events) > MAX_EVENTS_PER_MESSAGE
+    del events[MAX_EVENTS_PER_MESSAGE:]
+    last_time: dt | None = None
+    next_after: tuple[float, int] | None = None
+    if events:
+        last_when = events[-1]["when"]
+        last_time = dt_util.utc_from_timestamp(last_when)
+        if has_more:
+            last_when_count = sum(
+                1
+                for _ in takewhile(
+                    lambda event: event["when"] == last_when, reversed(events)
+                )
+            )
+            if after and after[0] == last_when and last_when_count == len(events):
+                # All events of the chunk happened at the same time
+                # as the events fetched with the previous chunks
+                last_when_count += after[1]
+            next_after = (last_when, last_when_count)
+    return (
+        _generate_stream_message_bytes(
+            msg_id, events, start_day, end_day, partial or has_more
+        ),
+        last_time,
+        next_after,
+    )
 
 
 async def _async_events_consumer(
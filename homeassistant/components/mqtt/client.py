@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable, Iterator
 import contextlib
 from dataclasses import dataclass
 from functools import lru_cache, partial
@@ -267,12 +267,107 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _TopicTrieNode:
+    """A level of the topic filters in the wildcard subscriptions trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: dict[Subscription, None] = {}
+
+
+class WildcardSubscriptions:
+    """Wildcard subscriptions indexed by the levels of their topic filter.
+
+    Matching a topic walks the trie level by level instead of testing the
+    topic against every wildcard subscription, following the same rules
+    as paho's MQTTMatcher. The matches are returned in the order the
+    subscriptions were added.
+    """
+
+    __slots__ = ("_order", "_root", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the wildcard subscriptions."""
+        self._root = _TopicTrieNode()
+        self._order: dict[Subscription, int] = {}
+        self._sequence = 0
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions in the order they were added."""
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions."""
+        return len(self._order)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.subscriptions[subscription] = None
+        if subscription not in self._order:
+            self._order[subscription] = self._sequence
+            self._sequence += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError if the subscription was not added.
+        """
+        del self._order[subscription]
+        path: list[tuple[_TopicTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.subscriptions[subscription]
+        # Prune the levels that are no longer used by any topic filter
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching the topic."""
+        levels = topic.split("/")
+        last = len(levels)
+        # Wildcards at the first level don't match topics starting with $
+        wildcard_first_level = not topic.startswith("$")
+        matches: list[Subscription] = []
+        nodes = [(self._root, 0)]
+        while nodes:
+            node, idx = nodes.pop()
+            children = node.children
+            if (wildcard_first_level or idx) and (
+                multi_level := children.get("#")
+            ) is not None:
+                matches.extend(multi_level.subscriptions)
+            if idx == last:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                nodes.append((child, idx + 1))
+            if (wildcard_first_level or idx) and (
+                single_level := children.get("+")
+            ) is not None:
+                nodes.append((single_level, idx + 1))
+        if len(matches) > 1:
+            matches.sort(key=self._order.__getitem__)
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -376,9 +471,7 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        # To ensure the wildcard subscriptions order is preserved, we use a dict
-        # with `None` values instead of a set.
-        self._wildcard_subscriptions: dict[Subscription, None] = {}
+        self._wildcard_subscriptions = WildcardSubscriptions()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -756,7 +849,7 @@ class MQTT:
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
-            self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -774,7 +867,7 @@ class MQTT:
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
             else:
-                del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscriptions.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -845,9 +938,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1059,13 +1151,8 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions.match(topic))
         return subscriptions
 
     @callback
@@ -1261,13 +1348,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -357,6 +357,9 @@ async def async_start(  # noqa: C901
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
     platform_setup_lock: dict[str, asyncio.Lock] = {}
+    platform_setup_payloads: dict[str, list[MQTTDiscoveryPayload]] = {}
+    queued_messages: list[ReceiveMessage] = []
+    queued_message_idx: dict[str, int] = {}
     integration_discovery_messages: dict[str, MQTTIntegrationDiscoveryConfig] = {}
 
     @callback
@@ -371,21 +374,69 @@ async def async_start(  # noqa: C901
             hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
         )
 
-    async def _async_component_setup(
-        component: str, discovery_payload: MQTTDiscoveryPayload
-    ) -> None:
-        """Perform component set up."""
-        async with platform_setup_lock.setdefault(component, asyncio.Lock()):
-            if component not in mqtt_data.platforms_loaded:
-                await async_forward_entry_setup_and_setup_discovery(
-                    hass, config_entry, {component}
-                )
-        _async_add_component(discovery_payload)
+    async def _async_component_setup(component: str) -> None:
+        """Perform component set up.
+
+        The components discovered while the platform is set up are
+        added when the set up is done.
+        """
+        try:
+            async with platform_setup_lock.setdefault(component, asyncio.Lock()):
+                if component not in mqtt_data.platforms_loaded:
+                    await async_forward_entry_setup_and_setup_discovery(
+                        hass, config_entry, {component}
+                    )
+        finally:
+            discovery_payloads = platform_setup_payloads.pop(component)
+        for discovery_payload in discovery_payloads:
+            _async_add_component(discovery_payload)
 
     @callback
-    def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
-        """Process the received message."""
+    def async_discovery_message_received(msg: ReceiveMessage) -> None:
+        """Process or queue the received message.
+
+        The retained discovery messages are received in bursts when
+        subscribing, so they are queued and processed together once the
+        burst was received. Only the last retained message received on a
+        topic is processed since the earlier ones are outdated.
+        """
         mqtt_data.last_discovery = msg.timestamp
+        if not msg.retain:
+            # Process the queued messages first to keep the order
+            # of the messages received on a topic
+            _async_process_queued_messages()
+            _async_process_discovery_message(msg)
+            return
+        if not queued_messages:
+            config_entry.async_create_task(
+                hass, _async_process_queued_messages_later(), eager_start=False
+            )
+        topic = msg.topic
+        if (idx := queued_message_idx.get(topic)) is not None:
+            queued_messages[idx] = msg
+            return
+        queued_message_idx[topic] = len(queued_messages)
+        queued_messages.append(msg)
+
+    async def _async_process_queued_messages_later() -> None:
+        """Process the queued messages after the burst was received."""
+        _async_process_queued_messages()
+
+    @callback
+    def _async_process_queued_messages() -> None:
+        """Process the queued messages."""
+        if not queued_messages:
+            return
+        messages = queued_messages.copy()
+        queued_messages.clear()
+        queued_message_idx.clear()
+        _LOGGER.debug("Processing %s retained discovery messages", len(messages))
+        for msg in messages:
+            _async_process_discovery_message(msg)
+
+    @callback
+    def _async_process_discovery_message(msg: ReceiveMessage) -> None:  # noqa: C901
+        """Process the received message."""
         payload = msg.payload
         topic = msg.topic
         topic_trimmed = topic.replace(f"{discovery_topic}/", "", 1)
@@ -554,9 +605,11 @@ async def async_start(  # noqa: C901
 
         if component not in mqtt_data.platforms_loaded and payload:
             # Load component first
-            config_entry.async_create_task(
-                hass, _async_component_setup(component, payload)
-            )
+            if component in platform_setup_payloads:
+                platform_setup_payloads[component].append(payload)
+            else:
+                platform_setup_payloads[component] = [payload]
+                config_entry.async_create_task(hass, _async_component_setup(component))
         elif already_discovered:
             # Dispatch update
             message = f"Component has already been discovered: {component} {discovery_id}, sending update"
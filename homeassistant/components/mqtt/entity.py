@@ -245,6 +245,13 @@ def async_setup_entity_entry_helper(
 ) -> None:
     """Set up entity creation dynamically through MQTT discovery."""
     mqtt_data = hass.data[DATA_MQTT]
+    discovered_entities: list[Entity] = []
+
+    async def _async_add_discovered_entities() -> None:
+        """Add the entities discovered together at once."""
+        entities = discovered_entities.copy()
+        discovered_entities.clear()
+        async_add_entities(entities)
 
     @callback
     def _async_setup_entity_entry_from_discovery(
@@ -262,9 +269,12 @@ def async_setup_entity_entry_helper(
                 entity_class = schema_class_mapping[config[CONF_SCHEMA]]
             if TYPE_CHECKING:
                 assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
-            )
+            entity = entity_class(hass, config, entry, discovery_payload.discovery_data)
+            if not discovered_entities:
+                entry.async_create_task(
+                    hass, _async_add_discovered_entities(), eager_start=False
+                )
+            discovered_entities.append(entity)
         except vol.Invalid as err:
             _handle_discovery_failure(hass, discovery_payload)
             async_handle_schema_error(discovery_payload, err)
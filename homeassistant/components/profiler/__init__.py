@@ -25,6 +25,7 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.loader import async_get_import_times
 
 from .const import DOMAIN
 
@@ -40,6 +41,7 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_LOG_IMPORT_TIMES = "log_import_times"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,15 +65,18 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_LOG_IMPORT_TIMES,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
+DEFAULT_MAX_MODULES = 50
 
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_MAX_MODULES = "max_modules"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -260,6 +265,19 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    async def _async_log_import_times(call: ServiceCall) -> None:
+        """Log the slowest imports of integration modules."""
+        import_times = async_get_import_times(hass)
+        for module, seconds in sorted(
+            import_times.items(), key=lambda item: item[1], reverse=True
+        )[: call.data[CONF_MAX_MODULES]]:
+            _LOGGER.critical("Import of %s took %.3f seconds", module, seconds)
+        _LOGGER.critical(
+            "Imported %s integration modules in %.3f seconds",
+            len(import_times),
+            sum(import_times.values()),
+        )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -382,6 +400,20 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_IMPORT_TIMES,
+        _async_log_import_times,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_MAX_MODULES, default=DEFAULT_MAX_MODULES): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=1000)
+                )
+            }
+        ),
+    )
+
     return True
 
 
@@ -73,6 +73,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import PrometheusExposition
+
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
@@ -122,8 +124,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -144,6 +144,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    hass.http.register_view(
+        PrometheusView(conf[CONF_REQUIRES_AUTH], metrics.exposition)
+    )
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
@@ -191,6 +194,7 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
+        self.exposition = PrometheusExposition()
         self._climate_units = climate_units
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
@@ -246,6 +250,8 @@ class PrometheusMetrics:
             if hasattr(self, handler) and state.state:
                 getattr(self, handler)(state)
 
+        self.exposition.entity_changed(entity_id)
+
     def handle_entity_registry_updated(
         self, event: Event[EventEntityRegistryUpdatedData]
     ) -> None:
@@ -328,12 +334,14 @@ class PrometheusMetrics:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
+            # The metrics are rendered by the exposition instead of the registry
             self._metrics[metric] = factory(
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=None,
             )
+            self.exposition.add_metric(self._metrics[metric])
             return cast(_MetricBaseT, self._metrics[metric])
 
     @staticmethod
@@ -818,19 +826,28 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, exposition: PrometheusExposition) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._exposition = exposition
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
-        body = await hass.async_add_executor_job(
-            prometheus_client.generate_latest, prometheus_client.REGISTRY
-        )
-        return web.Response(
+        body = await hass.async_add_executor_job(self._generate_latest)
+        response = web.Response(
             body=body,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
+            zlib_executor_size=32768,
+        )
+        response.enable_compression()
+        return response
+
+    def _generate_latest(self) -> bytes:
+        """Return the metrics of the registry followed by the entity metrics."""
+        return (
+            prometheus_client.generate_latest(prometheus_client.REGISTRY)
+            + self._exposition.generate_latest()
         )
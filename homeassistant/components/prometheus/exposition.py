@@ -0,0 +1,148 @@
+"""Render the metrics of the Prometheus exporter in the text exposition format."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import threading
+
+from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.samples import Sample
+from prometheus_client.utils import floatToGoString
+
+
+def _escape_documentation(documentation: str) -> str:
+    """Escape the documentation of a metric for the HELP line."""
+    return documentation.replace("\\", r"\\").replace("\n", r"\n")
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape the value of a label."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+@dataclass(slots=True)
+class _RenderedMetric:
+    """The rendered samples of a metric, by the values of their labels."""
+
+    header: bytes
+    created_header: bytes
+    samples: dict[Sequence[str], tuple[bytes, bytes]] = field(default_factory=dict)
+    text: bytes | None = None
+
+
+class PrometheusExposition:
+    """Render the metrics and keep the rendered samples between scrapes.
+
+    The samples are rendered the same way as prometheus_client.generate_latest
+    renders them, but only the samples of the entities that changed since the
+    previous scrape are rendered again. The first label of the metrics must
+    be the entity id.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the exposition."""
+        self._metrics: list[MetricWrapperBase] = []
+        self._rendered: dict[MetricWrapperBase, _RenderedMetric] = {}
+        self._changed_entity_ids: set[str] = set()
+        self._changed_lock = threading.Lock()
+        self._render_lock = threading.Lock()
+
+    def add_metric(self, metric: MetricWrapperBase) -> None:
+        """Add a metric to the exposition."""
+        with self._changed_lock:
+            self._metrics.append(metric)
+
+    def entity_changed(self, entity_id: str) -> None:
+        """Mark the samples of an entity to be rendered again by the next scrape.
+
+        Must be called after the values of the samples have been set.
+        """
+        with self._changed_lock:
+            self._changed_entity_ids.add(entity_id)
+
+    def generate_latest(self) -> bytes:
+        """Return the metrics in the text exposition format."""
+        with self._render_lock:
+            with self._changed_lock:
+                metrics = self._metrics.copy()
+                changed_entity_ids = self._changed_entity_ids
+                self._changed_entity_ids = set()
+            output: list[bytes] = []
+            for metric in metrics:
+                if (rendered := self._rendered.get(metric)) is None:
+                    rendered = self._rendered[metric] = _render_header(metric)
+                output.append(self._render_metric(metric, rendered, changed_entity_ids))
+            return b"".join(output)
+
+    @staticmethod
+    def _render_metric(
+        metric: MetricWrapperBase,
+        rendered: _RenderedMetric,
+        changed_entity_ids: set[str],
+    ) -> bytes:
+        """Return the rendered metric, rendering the changed samples again."""
+        with metric._lock:  # noqa: SLF001
+            children = metric._metrics.copy()  # noqa: SLF001
+        previous = rendered.samples
+        samples: dict[Sequence[str], tuple[bytes, bytes]] = {}
+        changed = False
+        for labelvalues, child in children.items():
+            if labelvalues[0] in changed_entity_ids or labelvalues not in previous:
+                samples[labelvalues] = _render_child(metric, labelvalues, child)
+                changed = True
+            else:
+                samples[labelvalues] = previous[labelvalues]
+        rendered.samples = samples
+        if not changed and len(samples) == len(previous) and rendered.text is not None:
+            return rendered.text
+
+        text = [rendered.header]
+        text.extend(sample for sample, _ in samples.values())
+        if created := [created for _, created in samples.values() if created]:
+            text.append(rendered.created_header)
+            text.extend(created)
+        rendered.text = b"".join(text)
+        return rendered.text
+
+
+def _render_header(metric: MetricWrapperBase) -> _RenderedMetric:
+    """Render the HELP and TYPE lines of a metric."""
+    described = next(iter(metric.describe()))
+    name = described.name
+    metric_type = described.type
+    documentation = _escape_documentation(described.documentation)
+    if metric_type == "counter":
+        header = f"# HELP {name}_total {documentation}\n# TYPE {name}_total counter\n"
+    else:
+        header = f"# HELP {name} {documentation}\n# TYPE {name} {metric_type}\n"
+    created_header = (
+        f"# HELP {name}_created {documentation}\n# TYPE {name}_created gauge\n"
+    )
+    return _RenderedMetric(header.encode(), created_header.encode())
+
+
+def _render_child(
+    metric: MetricWrapperBase,
+    labelvalues: Sequence[str],
+    child: MetricWrapperBase,
+) -> tuple[bytes, bytes]:
+    """Render the samples of a labelset and its created sample, if any."""
+    labels = ",".join(
+        f'{labelname}="{_escape_label_value(labelvalue)}"'
+        for labelname, labelvalue in sorted(
+            zip(metric._labelnames, labelvalues, strict=True)  # noqa: SLF001
+        )
+    )
+    name = child._name  # noqa: SLF001
+    sample_lines: list[str] = []
+    created_lines: list[str] = []
+    sample: Sample
+    for sample in child._child_samples():  # noqa: SLF001
+        value = floatToGoString(sample.value)  # type: ignore[no-untyped-call]
+        line = f"{name}{sample.name}{{{labels}}} {value}\n"
+        if sample.name == "_created":
+            created_lines.append(line)
+        else:
+            sample_lines.append(line)
+    return "".join(sample_lines).encode(), "".join(created_lines).encode()
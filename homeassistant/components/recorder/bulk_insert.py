@@ -0,0 +1,193 @@
+"""Bulk insert new rows of the recorder event session."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Engine, insert
+from sqlalchemy.orm.session import Session
+
+from .db_schema import SCHEMA_VERSION, EventData, Events, StateAttributes, States
+
+
+class BulkInsertManager:
+    """Collect new rows and insert them with multi-row INSERT statements.
+
+    All rows of a table are passed with the same keys (render_nulls)
+    so SQLAlchemy does not split them into one statement per set of
+    non-NULL columns.
+
+    The ORM unit of work needs the generated primary key of every new
+    StateAttributes, EventData and States row before it can insert the
+    rows that reference them, which makes it fall back to one INSERT per
+    row. Collecting the new rows per table and inserting them with
+    RETURNING lets the database generate the ids for a whole table in
+    one statement.
+
+    The ids are written back to the row objects so the table managers
+    holding them as pending rows pick them up in post_commit_pending.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk insert manager."""
+        self.active = False
+        self._state_attributes: list[StateAttributes] = []
+        self._event_data: list[EventData] = []
+        self._states: list[States] = []
+        self._events: list[Events] = []
+
+    def activate(self, engine: Engine, schema_version: int | None) -> None:
+        """Activate the manager if the database can return ids in bulk.
+
+        The rows are inserted with the columns of the current schema, so
+        databases still on an older schema keep using the ORM.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.active = (
+            schema_version == SCHEMA_VERSION
+            and engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
+
+    def add_state_attributes(self, state_attributes: StateAttributes) -> None:
+        """Add a new StateAttributes row."""
+        self._state_attributes.append(state_attributes)
+
+    def add_event_data(self, event_data: EventData) -> None:
+        """Add a new EventData row."""
+        self._event_data.append(event_data)
+
+    def add_state(self, state: States) -> None:
+        """Add a new States row."""
+        self._states.append(state)
+
+    def add_event(self, event: Events) -> None:
+        """Add a new Events row."""
+        self._events.append(event)
+
+    def insert(self, session: Session) -> None:
+        """Insert the pending rows into the session's transaction.
+
+        The rows stay pending until clear is called after the commit
+        so they can be inserted again if the commit is retried.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        # Flush the rows that are still added with the ORM
+        # (StatesMeta, EventTypes, RecorderRuns) so their ids are known
+        session.flush()
+        if self._state_attributes:
+            attributes_ids = session.execute(
+                insert(StateAttributes)
+                .returning(StateAttributes.attributes_id, sort_by_parameter_order=True)
+                .execution_options(render_nulls=True),
+                [
+                    {"hash": row.hash, "shared_attrs": row.shared_attrs}
+                    for row in self._state_attributes
+                ],
+            ).scalars()
+            for state_attributes, attributes_id in zip(
+                self._state_attributes, attributes_ids, strict=True
+            ):
+                state_attributes.attributes_id = attributes_id
+        if self._event_data:
+            data_ids = session.execute(
+                insert(EventData)
+                .returning(EventData.data_id, sort_by_parameter_order=True)
+                .execution_options(render_nulls=True),
+                [
+                    {"hash": row.hash, "shared_data": row.shared_data}
+                    for row in self._event_data
+                ],
+            ).scalars()
+            for event_data, data_id in zip(self._event_data, data_ids, strict=True):
+                event_data.data_id = data_id
+        if self._states:
+            for states in _states_by_generation(self._states):
+                state_ids = session.execute(
+                    insert(States)
+                    .returning(States.state_id, sort_by_parameter_order=True)
+                    .execution_options(render_nulls=True),
+                    [_state_row(row) for row in states],
+                ).scalars()
+                for state, state_id in zip(states, state_ids, strict=True):
+                    state.state_id = state_id
+        if self._events:
+            # The event_ids are not needed so there is no need for RETURNING
+            session.execute(
+                insert(Events).execution_options(render_nulls=True),
+                [_event_row(row) for row in self._events],
+            )
+
+    def clear(self) -> None:
+        """Clear the pending rows after they have been committed or discarded.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._state_attributes.clear()
+        self._event_data.clear()
+        self._states.clear()
+        self._events.clear()
+
+
+def _states_by_generation(states: list[States]) -> list[list[States]]:
+    """Split states so each state is inserted after its pending old state.
+
+    An entity that changes more than once between commits links the new
+    state to a pending state of the same batch, which needs its state_id
+    before the new state can be inserted.
+    """
+    generations: dict[int, int] = {}
+    batches: list[list[States]] = []
+    for row in states:
+        generation = 0
+        if (old_state := row.old_state) is not None and (
+            old_generation := generations.get(id(old_state))
+        ) is not None:
+            generation = old_generation + 1
+        generations[id(row)] = generation
+        if generation == len(batches):
+            batches.append([])
+        batches[generation].append(row)
+    return batches
+
+
+def _state_row(row: States) -> dict[str, Any]:
+    """Return the INSERT parameters for a States row."""
+    old_state = row.old_state
+    state_attributes = row.state_attributes
+    states_meta = row.states_meta_rel
+    return {
+        "entity_id": row.entity_id,
+        "state": row.state,
+        "last_changed_ts": row.last_changed_ts,
+        "last_reported_ts": row.last_reported_ts,
+        "last_updated_ts": row.last_updated_ts,
+        "old_state_id": old_state.state_id if old_state else row.old_state_id,
+        "attributes_id": (
+            state_attributes.attributes_id if state_attributes else row.attributes_id
+        ),
+        "origin_idx": row.origin_idx,
+        "context_id_bin": row.context_id_bin,
+        "context_user_id_bin": row.context_user_id_bin,
+        "context_parent_id_bin": row.context_parent_id_bin,
+        "metadata_id": states_meta.metadata_id if states_meta else row.metadata_id,
+    }
+
+
+def _event_row(row: Events) -> dict[str, Any]:
+    """Return the INSERT parameters for an Events row."""
+    event_data = row.event_data_rel
+    event_type = row.event_type_rel
+    return {
+        "origin_idx": row.origin_idx,
+        "time_fired_ts": row.time_fired_ts,
+        "context_id_bin": row.context_id_bin,
+        "context_user_id_bin": row.context_user_id_bin,
+        "context_parent_id_bin": row.context_parent_id_bin,
+        "data_id": event_data.data_id if event_data else row.data_id,
+        "event_type_id": event_type.event_type_id if event_type else row.event_type_id,
+    }
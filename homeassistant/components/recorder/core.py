@@ -50,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import BulkInsertManager
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -82,6 +83,7 @@ from .models import DatabaseEngine, StatisticData, StatisticMetaData, Unsupporte
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
+from .table_managers.recent_states import RecentStatesManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
@@ -205,7 +207,9 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = False
 
         self.recorder_runs_manager = RecorderRunsManager()
+        self.bulk_insert_manager = BulkInsertManager()
         self.states_manager = StatesManager()
+        self.recent_states_manager = RecentStatesManager()
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
@@ -296,35 +300,39 @@ class Recorder(threading.Thread):
         queue_put = self._queue.put_nowait
 
         @callback
-        def _event_listener(event: Event) -> None:
-            """Listen for new events and put them in the process queue."""
-            if event.event_type in exclude_event_types:
-                return
+        def _events_listener(events: list[Event]) -> None:
+            """Listen for new events and put them in the process queue.
 
-            if entity_filter is None or not (
-                entity_id := event.data.get(ATTR_ENTITY_ID)
-            ):
-                queue_put(event)
+            The events of a batch all have the same event type.
+            """
+            if events[0].event_type in exclude_event_types:
                 return
 
-            if isinstance(entity_id, str):
-                if entity_filter(entity_id):
+            for event in events:
+                if entity_filter is None or not (
+                    entity_id := event.data.get(ATTR_ENTITY_ID)
+                ):
                     queue_put(event)
-                return
+                    continue
 
-            if isinstance(entity_id, list):
-                for eid in entity_id:
-                    if entity_filter(eid):
+                if isinstance(entity_id, str):
+                    if entity_filter(entity_id):
                         queue_put(event)
-                        return
-                return
+                    continue
 
-            # Unknown what it is.
-            queue_put(event)
+                if isinstance(entity_id, list):
+                    for eid in entity_id:
+                        if entity_filter(eid):
+                            queue_put(event)
+                            break
+                    continue
 
-        self._event_listener = self.hass.bus.async_listen(
+                # Unknown what it is.
+                queue_put(event)
+
+        self._event_listener = self.hass.bus.async_listen_batch(
             MATCH_ALL,
-            _event_listener,
+            _events_listener,
         )
         self._queue_watcher = async_track_time_interval(
             self.hass,
@@ -1043,7 +1051,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_session(session, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1065,10 +1073,22 @@ class Recorder(threading.Thread):
             # No matching attributes found, save them in the DB
             dbevent_data = EventData(shared_data=shared_data, hash=hash_)
             event_data_manager.add_pending(dbevent_data)
-            self._add_to_session(session, dbevent_data)
+            if self.bulk_insert_manager.active:
+                self._event_session_has_pending_writes = True
+                self.bulk_insert_manager.add_event_data(dbevent_data)
+            else:
+                self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_session(session, dbevent)
+
+    def _add_event_to_session(self, session: Session, dbevent: Events) -> None:
+        """Add a new Events row to the bulk insert manager or the session."""
+        if self.bulk_insert_manager.active:
+            self._event_session_has_pending_writes = True
+            self.bulk_insert_manager.add_event(dbevent)
+        else:
+            self._add_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1147,10 +1167,20 @@ class Recorder(threading.Thread):
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
             state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
+            if self.bulk_insert_manager.active:
+                self._event_session_has_pending_writes = True
+                self.bulk_insert_manager.add_state_attributes(dbstate_attributes)
+            else:
+                self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if states_meta_manager.active:
+            self.recent_states_manager.add_pending(dbstate, shared_attrs)
+        if self.bulk_insert_manager.active:
+            self._event_session_has_pending_writes = True
+            self.bulk_insert_manager.add_state(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1213,7 +1243,10 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if self.bulk_insert_manager.active:
+            self.bulk_insert_manager.insert(session)
         session.commit()
+        self.bulk_insert_manager.clear()
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1221,6 +1254,7 @@ class Recorder(threading.Thread):
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
+        self.recent_states_manager.post_commit_pending()
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
@@ -1248,11 +1282,13 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        self.recent_states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.bulk_insert_manager.clear()
 
         if not self.event_session:
             return
@@ -1431,6 +1467,8 @@ class Recorder(threading.Thread):
             end_incomplete_runs(session, self.recorder_runs_manager.recording_start)
             self.recorder_runs_manager.start(session)
 
+        assert self.engine is not None
+        self.bulk_insert_manager.activate(self.engine, self.schema_version)
         self._open_event_session()
 
     def _schedule_compile_missing_statistics(self) -> None:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby
 from operator import itemgetter
 from typing import Any, cast
 
@@ -254,6 +254,63 @@ def get_significant_states_with_session(
     start_time_ts = start_time.timestamp()
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    # The recent window of the history is usually kept in memory
+    # and only the remaining entities need to be queried
+    recent_rows, metadata_ids = instance.recent_states_manager.get_significant_rows(
+        metadata_ids,
+        start_time_ts,
+        end_time_ts,
+        significant_changes_only,
+        metadata_ids_in_significant_domains,
+        no_attributes,
+        include_start_time_state,
+        run_start_ts,
+        bool(single_metadata_id),
+    )
+    # The rows kept in memory have the same columns as the database rows
+    states: Iterable[Row] = cast(list[Row], recent_rows)
+    if metadata_ids:
+        states = chain(
+            states,
+            _execute_significant_states_stmt(
+                session,
+                start_time_ts,
+                end_time_ts,
+                end_time,
+                single_metadata_id,
+                metadata_ids,
+                metadata_ids_in_significant_domains,
+                significant_changes_only,
+                no_attributes,
+                include_start_time_state,
+                run_start_ts,
+            ),
+        )
+    return _sorted_states_to_dict(
+        states,
+        start_time_ts if include_start_time_state else None,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _execute_significant_states_stmt(
+    session: Session,
+    start_time_ts: float,
+    end_time_ts: float | None,
+    end_time: datetime | None,
+    single_metadata_id: int | None,
+    metadata_ids: list[int],
+    metadata_ids_in_significant_domains: list[int],
+    significant_changes_only: bool,
+    no_attributes: bool,
+    include_start_time_state: bool,
+    run_start_ts: float | None,
+) -> Iterable[Row]:
+    """Execute the significant states query."""
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
@@ -275,15 +332,7 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
-        entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
-    )
+    return execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False)
 
 
 def get_full_significant_states_with_session(
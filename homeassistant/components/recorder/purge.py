@@ -525,6 +525,7 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
 
     # Evict eny entries in the old_states cache referring to a purged state
     instance.states_manager.evict_purged_state_ids(state_ids)
+    instance.recent_states_manager.evict_purged_state_ids(state_ids)
 
 
 def _purge_batch_attributes_ids(
@@ -7,16 +7,29 @@ from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby, pairwise
 import logging
 from operator import itemgetter
 import re
 from time import time as time_time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    and_,
+    bindparam,
+    case,
+    func,
+    lambda_stmt,
+    literal,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.attributes import QueryableAttribute
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
@@ -166,17 +179,6 @@ UNIT_CLASSES = {
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
 
-def mean(values: list[float]) -> float | None:
-    """Return the mean of the values.
-
-    This is a very simple version that only works
-    with a non-empty list of floats. The built-in
-    statistics.mean is more robust but is almost
-    an order of magnitude slower.
-    """
-    return sum(values) / len(values)
-
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -908,65 +910,6 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
-def _reduce_statistics(
-    stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
-    period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
-    _want_mean = "mean" in types
-    _want_min = "min" in types
-    _want_max = "max" in types
-    _want_last_reset = "last_reset" in types
-    _want_state = "state" in types
-    _want_sum = "sum" in types
-    for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
-
-    return result
-
-
 def reduce_day_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -1005,17 +948,6 @@ def reduce_day_ts_factory() -> (
     return _same_day_ts, _day_start_end_ts_cached
 
 
-def _reduce_statistics_per_day(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
-
-
 def reduce_week_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -1055,17 +987,6 @@ def reduce_week_ts_factory() -> (
     return _same_week_ts, _week_start_end_ts_cached
 
 
-def _reduce_statistics_per_week(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
-
-
 def _find_month_end_time(timestamp: datetime) -> datetime:
     """Return the end of the month (midnight at the first day of the next month)."""
     # We add 4 days to the end to make sure we are in the next month
@@ -1110,17 +1031,6 @@ def reduce_month_ts_factory() -> (
     return _same_month_ts, _month_start_end_ts_cached
 
 
-def _reduce_statistics_per_month(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
-
-
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1144,6 +1054,134 @@ def _generate_statistics_during_period_stmt(
     return stmt
 
 
+_REDUCE_TS_FACTORIES = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
+def _period_boundaries(
+    period_start_end: Callable[[float], tuple[float, float]],
+    first_start_ts: float,
+    last_start_ts: float,
+) -> list[float]:
+    """Return the start of each period and the end of the last period.
+
+    The periods cover first_start_ts until last_start_ts.
+    """
+    boundaries = list(period_start_end(first_start_ts))
+    while boundaries[-1] <= last_start_ts:
+        boundaries.append(period_start_end(boundaries[-1])[1])
+    return boundaries
+
+
+def _period_start_expression(
+    start_ts: QueryableAttribute[float | None], period_starts: list[float]
+) -> ColumnElement[float]:
+    """Return an expression for the start of the period start_ts is within.
+
+    The periods are not of equal length in local time, so the expression
+    is a balanced tree of CASE expressions which only needs a binary search
+    per row.
+    """
+    if len(period_starts) == 1:
+        return literal(period_starts[0], Float, literal_execute=True)
+    middle = len(period_starts) // 2
+    return case(
+        (
+            start_ts < literal(period_starts[middle], Float, literal_execute=True),
+            _period_start_expression(start_ts, period_starts[:middle]),
+        ),
+        else_=_period_start_expression(start_ts, period_starts[middle:]),
+    )
+
+
+def _reduced_statistics_during_period(
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    period_start_end: Callable[[float], tuple[float, float]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> tuple[Sequence[Row], dict[float, float]]:
+    """Reduce hourly statistics to daily, weekly or monthly statistics in SQL.
+
+    The mean, min and max are aggregated over the hourly statistics of the
+    period, the last_reset, state and sum are taken from the last hourly
+    statistic of the period.
+
+    Returns the reduced rows with the period start as start_ts and a map
+    from the start to the end of each period.
+    """
+    table = Statistics
+    filters = [table.start_ts >= start_time.timestamp()]
+    if metadata_ids:
+        filters.append(table.metadata_id.in_(metadata_ids))
+    if end_time is not None:
+        filters.append(table.start_ts < end_time.timestamp())
+    # Only create periods for the time range that has statistics
+    first_start_ts, last_start_ts = session.execute(
+        select(func.min(table.start_ts), func.max(table.start_ts)).where(*filters)
+    ).one()
+    if first_start_ts is None:
+        return [], {}
+
+    boundaries = _period_boundaries(period_start_end, first_start_ts, last_start_ts)
+    period_starts = boundaries[:-1]
+    hourly = select(
+        table.metadata_id,
+        table.start_ts,
+        _period_start_expression(table.start_ts, period_starts).label(
+            "period_start_ts"
+        ),
+        table.mean,
+        table.min,
+        table.max,
+    ).where(*filters)
+    hourly_subquery = hourly.subquery()
+    periods = select(
+        hourly_subquery.c.metadata_id,
+        hourly_subquery.c.period_start_ts,
+        func.max(hourly_subquery.c.start_ts).label("last_start_ts"),
+    )
+    if "mean" in types:
+        periods = periods.add_columns(func.avg(hourly_subquery.c.mean).label("mean"))
+    if "min" in types:
+        periods = periods.add_columns(func.min(hourly_subquery.c.min).label("min"))
+    if "max" in types:
+        periods = periods.add_columns(func.max(hourly_subquery.c.max).label("max"))
+    periods_subquery = periods.group_by(
+        hourly_subquery.c.metadata_id, hourly_subquery.c.period_start_ts
+    ).subquery()
+
+    stmt = select(
+        periods_subquery.c.metadata_id,
+        periods_subquery.c.period_start_ts.label("start_ts"),
+    )
+    for key in ("mean", "min", "max"):
+        if key in types:
+            stmt = stmt.add_columns(periods_subquery.c[key])
+    if last_columns := [
+        getattr(table, column)
+        for key, column in _type_column_mapping.items()
+        if key in ("last_reset", "state", "sum") and key in types
+    ]:
+        # The statistics table has a unique index on metadata_id and start_ts
+        stmt = stmt.add_columns(*last_columns).join(
+            table,
+            (table.metadata_id == periods_subquery.c.metadata_id)
+            & (table.start_ts == periods_subquery.c.last_start_ts),
+        )
+    stmt = stmt.order_by(
+        periods_subquery.c.metadata_id, periods_subquery.c.period_start_ts
+    )
+    return (
+        session.execute(stmt).all(),
+        dict(pairwise(boundaries)),
+    )
+
+
 def _generate_max_mean_min_statistic_in_sub_period_stmt(
     columns: Select,
     start_time: datetime | None,
@@ -1776,12 +1814,21 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    period_ends: dict[float, float] | None = None
+    if reduce_ts_factory := _REDUCE_TS_FACTORIES.get(period):
+        # Reduce the hourly statistics in the database instead
+        # of transferring and iterating all the hourly rows
+        _, period_start_end = reduce_ts_factory()
+        stats, period_ends = _reduced_statistics_during_period(
+            session, start_time, end_time, metadata_ids, period_start_end, types
+        )
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
     if not stats:
         return {}
@@ -1797,14 +1844,10 @@ def _statistics_during_period_with_session(
         types,
     )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
-
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
-
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+    if period_ends is not None:
+        for rows in result.values():
+            for row in rows:
+                row["end"] = period_ends[row["start"]]
 
     if "change" in _types:
         _augment_result_with_change(
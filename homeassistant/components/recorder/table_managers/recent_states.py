@@ -0,0 +1,333 @@
+"""Support keeping the recently recorded States in memory."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+import logging
+import sys
+import threading
+from typing import NamedTuple
+
+from ..db_schema import States
+
+_LOGGER = logging.getLogger(__name__)
+
+# How far back the recent states are kept. The frontend requests
+# the last 24 hours of history on every dashboard load.
+RECENT_STATES_WINDOW = 86400
+
+# Limit the number of rows kept per entity and in total so
+# entities that update very frequently cannot exhaust the memory
+# of low end hardware.
+MAX_ROWS_PER_ENTITY = 4096
+MAX_ROWS = 500000
+
+
+class RecentStateRow(NamedTuple):
+    """A row with the columns of the significant states query."""
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    attributes: str | None
+
+
+class _EntityStates:
+    """Columns of the recent states of a single entity, oldest first."""
+
+    __slots__ = (
+        "attributes",
+        "last_changed_ts",
+        "last_updated_ts",
+        "state_ids",
+        "states",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.state_ids = array("q")
+        self.last_updated_ts = array("d")
+        # 0.0 is used for NULL since a last_changed_ts is never 0
+        self.last_changed_ts = array("d")
+        self.states: list[str | None] = []
+        self.attributes: list[str | None] = []
+
+    def insert(
+        self,
+        state_id: int,
+        last_updated_ts: float,
+        last_changed_ts: float | None,
+        state: str | None,
+        attributes: str | None,
+    ) -> None:
+        """Insert a row keeping the rows ordered by last_updated_ts."""
+        last_updated = self.last_updated_ts
+        if not last_updated or last_updated[-1] <= last_updated_ts:
+            idx = len(last_updated)
+        else:
+            idx = bisect_right(last_updated, last_updated_ts)
+        # Most state changes keep the attributes so share the string
+        # with the previous row instead of keeping a copy per row
+        if idx and attributes == (previous := self.attributes[idx - 1]):
+            attributes = previous
+        self.state_ids.insert(idx, state_id)
+        last_updated.insert(idx, last_updated_ts)
+        self.last_changed_ts.insert(idx, last_changed_ts or 0.0)
+        self.states.insert(idx, sys.intern(state) if state else state)
+        self.attributes.insert(idx, attributes)
+
+    def trim(self, cutoff_ts: float, max_rows: int) -> int:
+        """Remove the rows older than cutoff_ts and above max_rows.
+
+        The newest row older than cutoff_ts is kept since it is the
+        state at the start of the window.
+
+        Returns the number of removed rows.
+        """
+        remove = 0
+        if len(self.last_updated_ts) > 1 and self.last_updated_ts[1] < cutoff_ts:
+            remove = bisect_left(self.last_updated_ts, cutoff_ts) - 1
+        remove = max(remove, len(self.last_updated_ts) - max_rows)
+        if remove > 0:
+            del self.state_ids[:remove]
+            del self.last_updated_ts[:remove]
+            del self.last_changed_ts[:remove]
+            del self.states[:remove]
+            del self.attributes[:remove]
+        return remove
+
+    def rows(
+        self,
+        metadata_id: int,
+        start_time_ts: float,
+        end_time_ts: float | None,
+        significant_changes_only: bool,
+        in_significant_domain: bool,
+        no_attributes: bool,
+        start_state: bool,
+    ) -> list[RecentStateRow]:
+        """Return the rows the significant states query would return."""
+        last_updated = self.last_updated_ts
+        last_changed = self.last_changed_ts
+        states = self.states
+        attributes = self.attributes
+        first = bisect_right(last_updated, start_time_ts)
+        # Rows at exactly the start time are neither the start state
+        # nor part of the period in the database query
+        start_idx = bisect_left(last_updated, start_time_ts) - 1
+        end = (
+            bisect_left(last_updated, end_time_ts) if end_time_ts else len(last_updated)
+        )
+        include_last_changed = not significant_changes_only
+        result: list[RecentStateRow] = []
+        if start_state and start_idx >= 0:
+            result.append(
+                RecentStateRow(
+                    metadata_id,
+                    states[start_idx],
+                    0,
+                    0 if include_last_changed else None,
+                    None if no_attributes else attributes[start_idx],
+                )
+            )
+        for idx in range(first, end):
+            last_updated_ts = last_updated[idx]
+            last_changed_ts = last_changed[idx] or None
+            if (
+                significant_changes_only
+                and not in_significant_domain
+                and last_changed_ts is not None
+                and last_changed_ts != last_updated_ts
+            ):
+                continue
+            result.append(
+                RecentStateRow(
+                    metadata_id,
+                    states[idx],
+                    last_updated_ts,
+                    last_changed_ts if include_last_changed else None,
+                    None if no_attributes else attributes[idx],
+                )
+            )
+        return result
+
+
+class RecentStatesManager:
+    """Keep the recently committed States in memory.
+
+    The rows are fed from the recorder write path after each commit
+    and kept in columns per metadata_id so the recent window of the
+    history can be served without querying the database.
+
+    The rows are written from the recorder thread and read from the
+    database executor threads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the recent states manager."""
+        self._lock = threading.Lock()
+        self._pending: list[tuple[States, str | None]] = []
+        self._entities: dict[int, _EntityStates] = {}
+        self._rows = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def rows(self) -> int:
+        """Return the number of rows kept in memory."""
+        return self._rows
+
+    def add_pending(self, state: States, shared_attrs: str | None) -> None:
+        """Add a state that is in the session but not yet committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.append((state, shared_attrs))
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to add the committed States.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._pending:
+            return
+        with self._lock:
+            entities = self._entities
+            touched: set[_EntityStates] = set()
+            newest_ts = 0.0
+            for state, shared_attrs in self._pending:
+                # Only look at the relationship when the metadata_id was
+                # not known when the state was added to avoid a lazy load
+                if (metadata_id := state.metadata_id) is None and (
+                    states_meta := state.states_meta_rel
+                ):
+                    metadata_id = states_meta.metadata_id
+                if metadata_id is None or state.last_updated_ts is None:
+                    continue
+                if (entity_states := entities.get(metadata_id)) is None:
+                    entity_states = entities[metadata_id] = _EntityStates()
+                entity_states.insert(
+                    state.state_id,
+                    state.last_updated_ts,
+                    state.last_changed_ts,
+                    state.state,
+                    shared_attrs,
+                )
+                touched.add(entity_states)
+                newest_ts = max(newest_ts, state.last_updated_ts)
+                self._rows += 1
+            cutoff_ts = newest_ts - RECENT_STATES_WINDOW
+            for entity_states in touched:
+                self._rows -= entity_states.trim(cutoff_ts, MAX_ROWS_PER_ENTITY)
+            if self._rows > MAX_ROWS:
+                self._evict_oldest_entities()
+        self._pending.clear()
+
+    def _evict_oldest_entities(self) -> None:
+        """Evict the entities that have not changed for the longest time."""
+        by_last_update = sorted(
+            self._entities.items(), key=lambda item: item[1].last_updated_ts[-1]
+        )
+        target = MAX_ROWS * 9 // 10
+        for metadata_id, entity_states in by_last_update:
+            if self._rows <= target:
+                break
+            self._rows -= len(entity_states.state_ids)
+            del self._entities[metadata_id]
+        _LOGGER.debug(
+            "Evicted recent states to stay below %s rows: %s rows left",
+            MAX_ROWS,
+            self._rows,
+        )
+
+    def get_significant_rows(
+        self,
+        metadata_ids: list[int],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        significant_changes_only: bool,
+        metadata_ids_in_significant_domains: Iterable[int],
+        no_attributes: bool,
+        include_start_time_state: bool,
+        run_start_ts: float | None,
+        single_entity: bool,
+    ) -> tuple[list[RecentStateRow], list[int]]:
+        """Return the rows for the metadata_ids that can be served from memory.
+
+        Returns the rows ordered by metadata_id and last_updated_ts and the
+        metadata_ids that still need to be queried from the database.
+
+        An entity can only be served from memory if a row older than the
+        start time is kept, which guarantees all the rows since then are
+        kept as well.
+        """
+        rows: list[RecentStateRow] = []
+        missing: list[int] = []
+        significant_domains = set(metadata_ids_in_significant_domains)
+        with self._lock:
+            for metadata_id in metadata_ids:
+                entity_states = self._entities.get(metadata_id)
+                if (
+                    entity_states is None
+                    or entity_states.last_updated_ts[0] >= start_time_ts
+                ):
+                    missing.append(metadata_id)
+                    continue
+                # When querying multiple entities the database only looks
+                # for the start state since the start of the recorder run
+                start_state = include_start_time_state and (
+                    single_entity
+                    or (
+                        run_start_ts is not None
+                        and entity_states.last_updated_ts[
+                            bisect_left(entity_states.last_updated_ts, start_time_ts)
+                            - 1
+                        ]
+                        >= run_start_ts
+                    )
+                )
+                rows.extend(
+                    entity_states.rows(
+                        metadata_id,
+                        start_time_ts,
+                        end_time_ts,
+                        significant_changes_only,
+                        metadata_id in significant_domains,
+                        no_attributes,
+                        start_state,
+                    )
+                )
+            self.hits += len(metadata_ids) - len(missing)
+            self.misses += len(missing)
+        return rows, missing
+
+    def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
+        """Evict the entities that may have purged states kept in memory.
+
+        Purging removes the oldest states so only the entities that kept
+        a state older than the newest purged state are evicted.
+        """
+        if not purged_state_ids:
+            return
+        max_purged_state_id = max(purged_state_ids)
+        with self._lock:
+            for metadata_id, entity_states in list(self._entities.items()):
+                if min(entity_states.state_ids) <= max_purged_state_id:
+                    self._rows -= len(entity_states.state_ids)
+                    del self._entities[metadata_id]
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.clear()
+        with self._lock:
+            self._entities.clear()
+            self._rows = 0
@@ -99,42 +99,40 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
-def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
-) -> float:
-    """Calculate a time weighted average.
+def _time_weighted_average_min_max(
+    fstates: list[tuple[float, State]], start_ts: float, end_ts: float
+) -> tuple[float, float, float]:
+    """Calculate the time weighted average, minimum and maximum.
 
     The average is calculated by weighting the states by duration in seconds between
     state changes.
     Note: there's no interpolation of values between state changes.
+
+    All three are calculated in a single pass over the states using the
+    timestamps of the states to avoid creating datetime objects.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
     accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
+    first_fstate, first_state = fstates[0]
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    start_ts = old_start_ts = max(first_state.last_updated_timestamp, start_ts)
+    old_fstate = min_fstate = max_fstate = first_fstate
+
+    for fstate, state in itertools.islice(fstates, 1, None):
+        start_time_ts = max(state.last_updated_timestamp, start_ts)
+        # Accumulate the value, weighted by duration until next state change
+        accumulated += old_fstate * (start_time_ts - old_start_ts)
+        if fstate < min_fstate:
+            min_fstate = fstate
+        elif fstate > max_fstate:
+            max_fstate = fstate
         old_fstate = fstate
-        old_start_time = start_time
+        old_start_ts = start_time_ts
 
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+    # Accumulate the value, weighted by duration until end of the period
+    accumulated += old_fstate * (end_ts - old_start_ts)
 
-    period_seconds = (end - start).total_seconds()
+    period_seconds = end_ts - start_ts
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -142,8 +140,8 @@ def _time_weighted_average(
         # we can measure. This probably means the precision of statistics
         # column schema in the database is incorrect but it is actually possible
         # to happen if the state change event fired at the exact microsecond
-        return 0.0
-    return accumulated / period_seconds
+        return 0.0, min_fstate, max_fstate
+    return accumulated / period_seconds, min_fstate, max_fstate
 
 
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
@@ -410,6 +408,8 @@ def compile_statistics(  # noqa: C901
 ) -> statistics.PlatformCompiledStatistics:
     """Compile statistics for all entities during start-end."""
     result: list[StatisticResult] = []
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
@@ -525,19 +525,19 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
+        wanted = wanted_statistics[entity_id]
+        if "mean" in wanted or "min" in wanted or "max" in wanted:
+            mean, min_, max_ = _time_weighted_average_min_max(
+                valid_float_states, start_ts, end_ts
             )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
-
-        if "sum" in wanted_statistics[entity_id]:
+            if "mean" in wanted:
+                stat["mean"] = mean
+            if "min" in wanted:
+                stat["min"] = min_
+            if "max" in wanted:
+                stat["max"] = max_
+
+        if "sum" in wanted:
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0.0
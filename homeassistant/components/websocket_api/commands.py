@@ -6,7 +6,7 @@ from collections.abc import Callable
 from functools import lru_cache, partial
 import json
 import logging
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 import voluptuous as vol
 
@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -67,6 +68,7 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_SUBSCRIPTIONS = "websocket_api_entity_subscriptions"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -367,31 +369,178 @@ def _send_handle_get_states_response(
     )
 
 
+class _EntitySubscriptions:
+    """Forward state changed events to the subscribe_entities subscriptions.
+
+    All the subscriptions share a single state changed listener so the
+    state diff of an event is serialized once, the permissions of a user
+    are checked once and the subscriptions with the same message id on
+    different connections are sent the same bytes. The state changes of a
+    batch written with async_set_many are sent in a single message.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the entity subscriptions."""
+        self._hass = hass
+        self._subscriptions: dict[
+            tuple[ActiveConnection, int], _EntitySubscription
+        ] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        connection: ActiveConnection,
+        msg_id: int,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to state changed events."""
+        key = (connection, msg_id)
+        subscription = _EntitySubscription(
+            connection.send_message,
+            entity_ids,
+            entity_filter,
+            connection.user,
+            str(msg_id).encode(),
+        )
+        self._subscriptions[key] = subscription
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen_batch(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            if self._subscriptions.get(key) is not subscription:
+                return
+            del self._subscriptions[key]
+            if not self._subscriptions and self._unsub:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_forward_entity_changes(
+        self, events: list[Event[EventStateChangedData]]
+    ) -> None:
+        """Forward entity state changed events to websocket."""
+        if len(events) == 1:
+            self._async_forward_entity_change(events[0])
+            return
+        event_entity_ids = [event.data["entity_id"] for event in events]
+        allowed_by_user: dict[tuple[str, str], bool] = {}
+        messages_by_events: dict[tuple[bytes, tuple[int, ...]], list[bytes]] = {}
+
+        def _allowed(user: User, entity_id: str) -> bool:
+            # We have to lookup the permissions again because the user
+            # might have changed since the subscription was created.
+            if (allowed := allowed_by_user.get((user.id, entity_id))) is None:
+                permissions = user.permissions
+                allowed = allowed_by_user[user.id, entity_id] = (
+                    user.is_admin
+                    or permissions.access_all_entities(POLICY_READ)
+                    or permissions.check_entity(entity_id, POLICY_READ)
+                )
+            return allowed
+
+        # Sending a message can close a connection and unsubscribe it
+        for (
+            send_message,
+            entity_ids,
+            entity_filter,
+            user,
+            message_id_as_bytes,
+        ) in list(self._subscriptions.values()):
+            # An error for one subscription must not stop the others
+            try:
+                if not (
+                    matching := tuple(
+                        idx
+                        for idx, entity_id in enumerate(event_entity_ids)
+                        if (not entity_ids or entity_id in entity_ids)
+                        and (not entity_filter or entity_filter(entity_id))
+                        and _allowed(user, entity_id)
+                    )
+                ):
+                    continue
+                key = (message_id_as_bytes, matching)
+                if (state_messages := messages_by_events.get(key)) is None:
+                    state_messages = messages_by_events[key] = (
+                        messages.state_diff_messages(
+                            message_id_as_bytes, [events[idx] for idx in matching]
+                        )
+                    )
+                for message in state_messages:
+                    send_message(message)
+            except Exception:
+                _LOGGER.exception(
+                    "Error forwarding the state change of %s to subscription %s",
+                    ", ".join(event_entity_ids),
+                    message_id_as_bytes.decode(),
+                )
+
+    @callback
+    def _async_forward_entity_change(self, event: Event[EventStateChangedData]) -> None:
+        """Forward an entity state changed event to websocket."""
+        entity_id = event.data["entity_id"]
+        allowed_by_user: dict[str, bool] = {}
+        messages_by_id: dict[bytes, bytes] = {}
+        # Sending a message can close a connection and unsubscribe it
+        for (
+            send_message,
+            entity_ids,
+            entity_filter,
+            user,
+            message_id_as_bytes,
+        ) in list(self._subscriptions.values()):
+            # An error for one subscription must not stop the others
+            try:
+                if (entity_ids and entity_id not in entity_ids) or (
+                    entity_filter and not entity_filter(entity_id)
+                ):
+                    continue
+                # We have to lookup the permissions again because the user
+                # might have changed since the subscription was created.
+                if (allowed := allowed_by_user.get(user.id)) is None:
+                    permissions = user.permissions
+                    allowed = allowed_by_user[user.id] = (
+                        user.is_admin
+                        or permissions.access_all_entities(POLICY_READ)
+                        or permissions.check_entity(entity_id, POLICY_READ)
+                    )
+                if not allowed:
+                    continue
+                if (message := messages_by_id.get(message_id_as_bytes)) is None:
+                    message = messages_by_id[message_id_as_bytes] = (
+                        messages.cached_state_diff_message(message_id_as_bytes, event)
+                    )
+                send_message(message)
+            except Exception:
+                _LOGGER.exception(
+                    "Error forwarding the state change of %s to subscription %s",
+                    entity_id,
+                    message_id_as_bytes.decode(),
+                )
+
+
+class _EntitySubscription(NamedTuple):
+    """A subscribe_entities subscription."""
+
+    send_message: Callable[[str | bytes | dict[str, Any]], None]
+    entity_ids: set[str] | None
+    entity_filter: Callable[[str], bool] | None
+    user: User
+    message_id_as_bytes: bytes
+
+
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+def _async_get_entity_subscriptions(hass: HomeAssistant) -> _EntitySubscriptions:
+    """Return the shared entity subscriptions."""
+    if (subscriptions := hass.data.get(ENTITY_SUBSCRIPTIONS)) is None:
+        subscriptions = hass.data[ENTITY_SUBSCRIPTIONS] = _EntitySubscriptions(hass)
+    return cast(_EntitySubscriptions, subscriptions)
 
 
 @callback
@@ -415,17 +564,9 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
-    )
+    connection.subscriptions[msg_id] = _async_get_entity_subscriptions(
+        hass
+    ).async_subscribe(connection, msg_id, entity_ids, entity_filter)
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
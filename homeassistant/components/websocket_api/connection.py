@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
 from aiohttp import web
@@ -36,6 +37,23 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+@dataclass(slots=True)
+class WriterStats:
+    """Totals of what the writer of a connection sent to the client.
+
+    The bytes are counted before compression since aiohttp does not
+    expose the size of the compressed frames.
+    """
+
+    messages_sent: int = 0
+    frames_sent: int = 0
+    bytes_sent: int = 0
+
+
+async def _async_no_writer_to_drain(max_pending: int) -> None:
+    """Return right away for connections without a writer."""
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -48,9 +66,13 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "coalesce_max_bytes",
+        "coalesce_max_delay",
         "supported_features",
         "handlers",
         "binary_handlers",
+        "async_wait_drained",
+        "writer_stats",
     )
 
     def __init__(
@@ -70,11 +92,19 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.coalesce_max_bytes = 0
+        self.coalesce_max_delay = 0.0
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        # Waits until at most the given number of messages are waiting to be
+        # written to the client, set by the WebSocketHandler once its writer runs
+        self.async_wait_drained: Callable[[int], Coroutine[Any, Any, None]] = (
+            _async_no_writer_to_drain
+        )
+        self.writer_stats = WriterStats()
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -85,6 +115,11 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.coalesce_max_bytes = int(features.get(const.FEATURE_COALESCE_MAX_BYTES, 0))
+        max_delay = features.get(const.FEATURE_COALESCE_MAX_DELAY, 0)
+        self.coalesce_max_delay = (
+            max(0, min(max_delay, const.MAX_COALESCE_DELAY)) / 1000
+        )
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -58,3 +58,11 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Clients on slow links can trade latency for fewer and larger frames,
+# which also compress better when permessage-deflate is negotiated
+FEATURE_COALESCE_MAX_BYTES = "coalesce_max_bytes"
+FEATURE_COALESCE_MAX_DELAY = "coalesce_max_delay"
+
+# Upper limit of the delay in milliseconds a client can ask
+# messages to be held back for to coalesce them
+MAX_COALESCE_DELAY: Final = 1000
@@ -45,6 +45,15 @@ if TYPE_CHECKING:
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
 
+def _pop_messages_up_to(message_queue: deque[bytes], max_bytes: int) -> list[bytes]:
+    """Pop the messages that fit in max_bytes when coalesced, at least one."""
+    messages = [message_queue.popleft()]
+    size = len(messages[0]) + 2
+    while message_queue and (size := size + len(message_queue[0]) + 1) <= max_bytes:
+        messages.append(message_queue.popleft())
+    return messages
+
+
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
 
@@ -84,6 +93,8 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_release_ready_handle",
+        "_drain_future",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -107,6 +118,8 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._release_ready_handle: asyncio.TimerHandle | None = None
+        self._drain_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -140,6 +153,7 @@ class WebSocketHandler:
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        stats = connection.writer_stats
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -160,22 +174,45 @@ class WebSocketHandler:
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
+                    stats.messages_sent += 1
+                    stats.frames_sent += 1
+                    stats.bytes_sent += len(message)
+                    if self._drain_future is not None:
+                        self._release_drain_future()
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
+                if max_bytes := connection.coalesce_max_bytes:
+                    messages = _pop_messages_up_to(message_queue, max_bytes)
+                else:
+                    messages = list(message_queue)
+                    message_queue.clear()
+                coalesced_messages = b"".join((b"[", b",".join(messages), b"]"))
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_bytes_text(coalesced_messages)
+                stats.messages_sent += len(messages)
+                stats.frames_sent += 1
+                stats.bytes_sent += len(coalesced_messages)
+                if self._drain_future is not None:
+                    self._release_drain_future()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
         except (RuntimeError, ConnectionResetError) as ex:
             debug("%s: Unexpected error in writer: %s", self.description, ex)
         finally:
-            debug("%s: Writer done", self.description)
-            # Clean up the peak checker when we shut down the writer
+            debug(
+                "%s: Writer done after sending %s messages in %s frames of %s bytes%s",
+                self.description,
+                stats.messages_sent,
+                stats.frames_sent,
+                stats.bytes_sent,
+                " before compression" if wsock.compress else "",
+            )
+            # Clean up the peak checker and the coalesce delay
+            # when we shut down the writer
             self._cancel_peak_checker()
+            self._cancel_release_ready_handle()
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -184,6 +221,13 @@ class WebSocketHandler:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
 
+    @callback
+    def _cancel_release_ready_handle(self) -> None:
+        """Cancel the release of the ready future after the coalesce delay."""
+        if self._release_ready_handle is not None:
+            self._release_ready_handle.cancel()
+            self._release_ready_handle = None
+
     @callback
     def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
         """Queue sending a message to the client.
@@ -222,7 +266,20 @@ class WebSocketHandler:
         if self._release_ready_queue_size == 0:
             # Try to coalesce more messages to reduce the number of writes
             self._release_ready_queue_size = queue_size_after_add
-            self._loop.call_soon(self._release_ready_future_or_reschedule)
+            if (connection := self._connection) and connection.coalesce_max_delay:
+                self._release_ready_handle = self._loop.call_later(
+                    connection.coalesce_max_delay, self._release_ready_future
+                )
+            else:
+                self._loop.call_soon(self._release_ready_future_or_reschedule)
+        elif (
+            queue_size_after_add == PENDING_MSG_MAX_FORCE_READY
+            and (connection := self._connection)
+            and connection.coalesce_max_delay
+        ):
+            # Do not wait for the delay to pass to avoid
+            # the coalesced messages from growing too large
+            self._release_ready_future()
 
         peak_checker_active = self._peak_checker_unsub is not None
 
@@ -236,6 +293,29 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    async def _async_wait_drained(self, max_pending: int) -> None:
+        """Wait until at most max_pending messages are waiting to be written.
+
+        Returns once the connection is closing since the messages
+        will not be written anymore.
+        """
+        while (
+            not self._closing
+            and (message_queue := self._message_queue) is not None
+            and len(message_queue) > max_pending
+        ):
+            if self._drain_future is None:
+                self._drain_future = self._loop.create_future()
+            await self._drain_future
+
+    @callback
+    def _release_drain_future(self) -> None:
+        """Wake up the waiters after messages were written or on close."""
+        if (drain_future := self._drain_future) is not None:
+            self._drain_future = None
+            if not drain_future.done():
+                drain_future.set_result(None)
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -262,6 +342,23 @@ class WebSocketHandler:
         if not ready_future.done():
             ready_future.set_result(queue_size)
 
+    @callback
+    def _release_ready_future(self) -> None:
+        """Release the ready future after the coalesce delay.
+
+        Also called to release it before the delay has passed, in which
+        case the pending release is cancelled so it does not cut the
+        delay of the next messages short.
+        """
+        self._cancel_release_ready_handle()
+        self._release_ready_queue_size = 0
+        if (
+            (ready_future := self._ready_future)
+            and not ready_future.done()
+            and (queue_size := len(self._message_queue))
+        ):
+            ready_future.set_result(queue_size)
+
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
@@ -288,6 +385,8 @@ class WebSocketHandler:
         """Cancel the connection."""
         self._closing = True
         self._cancel_peak_checker()
+        self._cancel_release_ready_handle()
+        self._release_drain_future()
         if self._handle_task is not None:
             self._handle_task.cancel()
         if self._writer_task is not None:
@@ -364,6 +463,7 @@ class WebSocketHandler:
             self._closing = True
             if self._ready_future and not self._ready_future.done():
                 self._ready_future.set_result(len(self._message_queue))
+            self._release_drain_future()
 
             await self._async_cleanup_writer_and_close(disconnect_warn, connection)
 
@@ -403,6 +503,7 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
+        connection.async_wait_drained = self._async_wait_drained
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -162,6 +162,50 @@ def cached_state_diff_message(
     )
 
 
+def state_diff_messages(
+    message_id_as_bytes: bytes, events: list[Event[EventStateChangedData]]
+) -> list[bytes]:
+    """Return the event messages with the state diffs of the events.
+
+    The diffs of the events are merged into as few messages as possible.
+    A new message is only started when an entity changes again since
+    the diffs of the same entity can not be merged.
+    """
+    if len(events) == 1:
+        return [cached_state_diff_message(message_id_as_bytes, events[0])]
+    messages: list[bytes] = []
+    merged: dict[str, Any] = {}
+    entity_ids: set[str] = set()
+    for event in events:
+        if (entity_id := event.data["entity_id"]) in entity_ids:
+            messages.append(_state_diff_message(message_id_as_bytes, merged))
+            merged = {}
+            entity_ids.clear()
+        entity_ids.add(entity_id)
+        for key, value in _state_diff_event(event).items():
+            if key == ENTITY_EVENT_REMOVE:
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged.setdefault(key, {}).update(value)
+    messages.append(_state_diff_message(message_id_as_bytes, merged))
+    return messages
+
+
+def _state_diff_message(message_id_as_bytes: bytes, event: dict[str, Any]) -> bytes:
+    """Serialize merged state diffs to an event message."""
+    return b"".join(
+        (
+            (
+                _message_to_json_bytes_or_none({"type": "event", "event": event})
+                or INVALID_JSON_PARTIAL_MESSAGE
+            )[:-1],
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
@@ -12,6 +12,7 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
@@ -39,6 +40,7 @@ from typing import (
     cast,
     overload,
 )
+import weakref
 
 from propcache import cached_property, under_cached_property
 from typing_extensions import TypeVar
@@ -1460,15 +1462,30 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_batch_listeners",
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        # event_type -> event data key -> event data value -> listeners
+        self._keyed_listeners: dict[
+            EventType[Any] | str,
+            dict[str, dict[Hashable, list[_FilterableJobType[Any]]]],
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._batch_listeners: dict[
+            EventType[Any] | str, list[HassJob[[list[Event[Any]]], Any]]
+        ] = {}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1484,7 +1501,16 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed in self._keyed_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + sum(
+                len(listeners)
+                for index in keyed.values()
+                for listeners in index.values()
+            )
+        for event_type, batch_listeners in self._batch_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + len(batch_listeners)
+        return counts
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1544,12 +1570,106 @@ class EventBus:
 
         This method must be run in the event loop.
         """
+        event = self._async_run_listeners(
+            event_type, event_data, origin, context, time_fired
+        )
+        if self._batch_listeners and (
+            batch_jobs := self._async_get_batch_jobs(event_type)
+        ):
+            if not event:
+                event = Event(event_type, event_data, origin, time_fired, context)
+            self._async_run_batch_jobs(batch_jobs, [event])
+
+    @callback
+    def async_fire_batch_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        events_data: Iterable[_DataT],
+        origin: EventOrigin = EventOrigin.local,
+        context: Context | None = None,
+        time_fired: float | None = None,
+    ) -> None:
+        """Fire events of the same type, for internal use only.
+
+        An event is fired to the regular listeners for every event data
+        while the batch listeners are called once with all the events.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        batch_jobs = self._async_get_batch_jobs(event_type)
+        events: list[Event[_DataT]] = []
+        for event_data in events_data:
+            event = self._async_run_listeners(
+                event_type, event_data, origin, context, time_fired
+            )
+            if batch_jobs:
+                events.append(
+                    event or Event(event_type, event_data, origin, time_fired, context)
+                )
+        if events:
+            self._async_run_batch_jobs(batch_jobs, events)
+
+    @callback
+    def _async_get_batch_jobs(
+        self, event_type: EventType[_DataT] | str
+    ) -> list[HassJob[[list[Event[Any]]], Any]]:
+        """Return the batch listeners of an event type."""
+        batch_listeners = self._batch_listeners
+        jobs = batch_listeners.get(event_type, EMPTY_LIST)
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL and (
+            match_all_jobs := batch_listeners.get(MATCH_ALL)
+        ):
+            return jobs + match_all_jobs
+        return jobs
+
+    @callback
+    def _async_run_batch_jobs(
+        self,
+        batch_jobs: list[HassJob[[list[Event[Any]]], Any]],
+        events: list[Event[Any]],
+    ) -> None:
+        """Run the batch listeners with the events."""
+        for job in batch_jobs:
+            try:
+                self._hass.async_run_hass_job(job, events)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
+    @callback
+    def _async_run_listeners(
+        self,
+        event_type: EventType[_DataT] | str,
+        event_data: _DataT | None,
+        origin: EventOrigin,
+        context: Context | None,
+        time_fired: float | None,
+    ) -> Event[_DataT] | None:
+        """Run the listeners of an event.
+
+        Returns the event if any listener ran.
+        """
         if self._debug:
             _LOGGER.debug(
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_data is not None and (keyed := self._keyed_listeners.get(event_type)):
+            # Only visit the keyed listeners whose dispatch key matches
+            # the event data instead of running every filter.
+            for data_key, index in keyed.items():
+                try:
+                    keyed_listeners = index.get(event_data.get(data_key))
+                except TypeError:
+                    # An unhashable value can never match a dispatch key
+                    continue
+                if keyed_listeners:
+                    listeners = listeners + keyed_listeners
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1578,6 +1698,7 @@ class EventBus:
                 self._hass.async_run_hass_job(job, event)
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
+        return event
 
     def listen(
         self,
@@ -1606,6 +1727,7 @@ class EventBus:
         listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[_DataT], bool] | None = None,
         run_immediately: bool | object = _SENTINEL,
+        dispatch_key: tuple[str, Hashable] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1616,6 +1738,15 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        An optional dispatch_key, a tuple of an event data key and a value,
+        indexes the listener so it is only considered for events where
+        event_data[key] == value. Firing an event only visits the listeners
+        indexed under the matching value, so the cost of a fire does not
+        grow with the number of keyed listeners for other values. If an
+        event_filter is also passed, it runs after the key has matched.
+        Keyed listeners are called after the non-keyed listeners of the
+        same event type.
+
         If run_immediately is passed:
           - callbacks will be run right away instead of using call_soon.
           - coroutine functions will be scheduled eagerly.
@@ -1636,12 +1767,36 @@ class EventBus:
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
         filterable_job = (HassJob(listener, f"listen {event_type}"), event_filter)
         if event_type == EVENT_STATE_REPORTED:
-            if not event_filter:
+            if not event_filter and not dispatch_key:
                 raise HomeAssistantError(
                     f"Event filter is required for event {event_type}"
                 )
+        if dispatch_key is not None:
+            if event_type == MATCH_ALL:
+                raise HomeAssistantError(
+                    f"Dispatch key is not supported for event {event_type}"
+                )
+            return self._async_listen_keyed_filterable_job(
+                event_type, dispatch_key, filterable_job
+            )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def _async_listen_keyed_filterable_job(
+        self,
+        event_type: EventType[_DataT] | str,
+        dispatch_key: tuple[str, Hashable],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type matching a dispatch key."""
+        data_key, value = dispatch_key
+        self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        ).setdefault(value, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, dispatch_key, filterable_job
+        )
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -1654,6 +1809,30 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type in batches.
+
+        To listen to all events specify the constant ``MATCH_ALL``
+        as event_type.
+
+        The listener is called once with all the events fired together
+        with async_fire_batch_internal, which all have the same event type,
+        and with a list of a single event for any other event. Batch
+        listeners are called after the regular listeners.
+
+        This method must be run in the event loop.
+        """
+        job: HassJob[[list[Event[_DataT]]], Any] = HassJob(
+            listener, f"listen batch {event_type}"
+        )
+        self._batch_listeners.setdefault(event_type, []).append(job)
+        return functools.partial(self._async_remove_batch_listener, event_type, job)
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1742,6 +1921,57 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_batch_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        job: HassJob[[list[Event[_DataT]]], Any],
+    ) -> None:
+        """Remove a batch listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            batch_listeners = self._batch_listeners[event_type]
+            batch_listeners.remove(job)
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown job listener %s", job)
+            return
+        # delete the empty list so the fire path can skip the batch listeners
+        if not batch_listeners:
+            del self._batch_listeners[event_type]
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        dispatch_key: tuple[str, Hashable],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        data_key, value = dispatch_key
+        try:
+            keyed = self._keyed_listeners[event_type]
+            index = keyed[data_key]
+            listeners = index[value]
+            listeners.remove(filterable_job)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+
+        # delete the empty containers so the fire path can skip them
+        if not listeners:
+            del index[value]
+            if not index:
+                del keyed[data_key]
+                if not keyed:
+                    del self._keyed_listeners[event_type]
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -2022,6 +2252,102 @@ class State:
         )
 
 
+class CompactState(State):
+    """State that keeps its times as timestamps.
+
+    Used by the state machine in compact mode. The datetimes are created
+    from the timestamps when they are accessed and are not kept, so the
+    state does not hold on to up to three datetime objects.
+    """
+
+    __slots__ = ("last_changed_timestamp", "last_reported_timestamp")
+
+    last_changed_timestamp: float  # type: ignore[assignment]
+    last_reported_timestamp: float  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        entity_id: str,
+        state: str,
+        attributes: Mapping[str, Any] | None = None,
+        last_changed: datetime.datetime | None = None,
+        last_reported: datetime.datetime | None = None,
+        last_updated: datetime.datetime | None = None,
+        context: Context | None = None,
+        validate_entity_id: bool | None = True,
+        state_info: StateInfo | None = None,
+        last_updated_timestamp: float | None = None,
+        last_changed_timestamp: float | None = None,
+    ) -> None:
+        """Initialize a new state.
+
+        The times can be passed as timestamps instead of datetimes.
+        """
+        self._cache: dict[str, Any] = {}
+        state = str(state)
+
+        if validate_entity_id and not valid_entity_id(entity_id):
+            raise InvalidEntityFormatError(
+                f"Invalid entity id encountered: {entity_id}. "
+                "Format should be <domain>.<object_id>"
+            )
+
+        validate_state(state)
+
+        self.entity_id = entity_id
+        self.state = state
+        if type(attributes) is not ReadOnlyDict:
+            self.attributes = ReadOnlyDict(attributes or {})
+        else:
+            self.attributes = attributes
+        if last_updated_timestamp is None and last_updated is not None:
+            last_updated_timestamp = last_updated.timestamp()
+        if last_reported is not None:
+            last_reported_timestamp = last_reported.timestamp()
+        else:
+            last_reported_timestamp = last_updated_timestamp or time.time()
+        if not last_updated_timestamp:
+            last_updated_timestamp = last_reported_timestamp
+        if last_changed_timestamp is None and last_changed is not None:
+            last_changed_timestamp = last_changed.timestamp()
+        self.last_updated_timestamp = last_updated_timestamp
+        self.last_changed_timestamp = last_changed_timestamp or last_updated_timestamp
+        self.last_reported_timestamp = last_reported_timestamp
+        self.context = context or Context()
+        self.state_info = state_info
+        self.domain, self.object_id = split_entity_id(self.entity_id)
+
+    @property
+    def last_changed(self) -> datetime.datetime:
+        """Last time the state was changed."""
+        return dt_util.utc_from_timestamp(self.last_changed_timestamp)
+
+    @last_changed.setter
+    def last_changed(self, value: datetime.datetime) -> None:
+        """Set the last time the state was changed."""
+        self.last_changed_timestamp = value.timestamp()
+
+    @property
+    def last_reported(self) -> datetime.datetime:
+        """Last time the state was reported."""
+        return dt_util.utc_from_timestamp(self.last_reported_timestamp)
+
+    @last_reported.setter
+    def last_reported(self, value: datetime.datetime) -> None:
+        """Set the last time the state was reported."""
+        self.last_reported_timestamp = value.timestamp()
+
+    @property
+    def last_updated(self) -> datetime.datetime:
+        """Last time the state or attributes were changed."""
+        return dt_util.utc_from_timestamp(self.last_updated_timestamp)
+
+    @last_updated.setter
+    def last_updated(self, value: datetime.datetime) -> None:
+        """Set the last time the state or attributes were changed."""
+        self.last_updated_timestamp = value.timestamp()
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
@@ -2067,7 +2393,15 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_compact",
+        "_interned_attributes",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2078,6 +2412,49 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._compact = False
+        self._interned_attributes: weakref.WeakValueDictionary[
+            int, ReadOnlyDict[str, Any]
+        ] = weakref.WeakValueDictionary()
+
+    @callback
+    def async_set_compact(self, compact: bool) -> None:
+        """Set if the states written from now on are kept in compact form.
+
+        Compact states keep their times as timestamps and share the
+        attributes with the other states that have identical attributes,
+        which lowers the memory used by installs with many entities at
+        the cost of some CPU time for every state written.
+
+        This method must be run in the event loop.
+        """
+        self._compact = compact
+        if not compact:
+            self._interned_attributes.clear()
+
+    @callback
+    def _async_intern_attributes(
+        self, attributes: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        """Return the attributes shared with the states with identical attributes.
+
+        Named attributes are almost always unique to their entity and are
+        not worth serializing, so they are kept as they are.
+        """
+        if ATTR_FRIENDLY_NAME in attributes:
+            return attributes
+        try:
+            key = hash(json_bytes(attributes))
+        except TypeError:
+            return attributes
+        interned = self._interned_attributes.get(key)
+        if interned is not None and interned == attributes:
+            return interned
+        if type(attributes) is not ReadOnlyDict:
+            attributes = ReadOnlyDict(attributes)
+        if interned is None:
+            self._interned_attributes[key] = attributes
+        return attributes
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2303,23 +2680,6 @@ class StateMachine:
 
         This method must be run in the event loop.
         """
-        # Most cases the key will be in the dict
-        # so we optimize for the happy path as
-        # python 3.11+ has near zero overhead for
-        # try when it does not raise an exception.
-        old_state: State | None
-        try:
-            old_state = self._states_data[entity_id]
-        except KeyError:
-            old_state = None
-            same_state = False
-            same_attr = False
-            last_changed = None
-        else:
-            same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
         # It is much faster to convert a timestamp to a utc datetime object
         # than converting a utc datetime object to a timestamp since cpython
         # does not have a fast path for handling the UTC timezone and has to do
@@ -2336,43 +2696,173 @@ class StateMachine:
         if context is None:
             context = Context(id=ulid_at_time(timestamp))
 
+        event_type, event_data = self._async_write_state(
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+            timestamp,
+            now,
+        )
+        self._bus.async_fire_internal(
+            event_type, event_data, context=context, time_fired=timestamp
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities, add entities if they do not exist.
+
+        states is an iterable of (entity_id, new_state, attributes) tuples.
+
+        All states are validated before any of them is written, and are all
+        written to the state machine before any event is fired, so listeners
+        always see the whole batch applied. The events of the batch share one
+        context and one time fired, which avoids creating a context for every
+        state. A regular event is still fired for every state, and the batch
+        listeners of state_changed get all of them in one call.
+
+        This method must be run in the event loop.
+        """
+        batch = [
+            (entity_id.lower(), str(new_state), attributes or {})
+            for entity_id, new_state, attributes in states
+        ]
+        states_data = self._states_data
+        for entity_id, new_state, _ in batch:
+            if entity_id not in states_data and not valid_entity_id(entity_id):
+                raise InvalidEntityFormatError(
+                    f"Invalid entity id encountered: {entity_id}. "
+                    "Format should be <domain>.<object_id>"
+                )
+            validate_state(new_state)
+
+        if timestamp is None:
+            timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+
+        write_state = self._async_write_state
+        events = [
+            write_state(
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                context,
+                None,
+                timestamp,
+                now,
+            )
+            for entity_id, new_state, attributes in batch
+        ]
+        bus = self._bus
+        state_changed_data: list[EventStateChangedData] = []
+        for event_type, event_data in events:
+            if event_type is EVENT_STATE_CHANGED:
+                state_changed_data.append(cast(EventStateChangedData, event_data))
+                continue
+            bus.async_fire_internal(
+                event_type, event_data, context=context, time_fired=timestamp
+            )
+        bus.async_fire_batch_internal(
+            EVENT_STATE_CHANGED,
+            state_changed_data,
+            context=context,
+            time_fired=timestamp,
+        )
+
+    @callback
+    def _async_write_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context,
+        state_info: StateInfo | None,
+        timestamp: float,
+        now: datetime.datetime,
+    ) -> tuple[EventType[Any], EventStateEventData]:
+        """Write the state of an entity and return the event to fire."""
+        # Most cases the key will be in the dict
+        # so we optimize for the happy path as
+        # python 3.11+ has near zero overhead for
+        # try when it does not raise an exception.
+        old_state: State | None
+        try:
+            old_state = self._states_data[entity_id]
+        except KeyError:
+            old_state = None
+            same_state = False
+            same_attr = False
+        else:
+            same_state = old_state.state == new_state and not force_update
+            same_attr = old_state.attributes == attributes
+
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
-            old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
-            # Avoid creating an EventStateReportedData
-            self._bus.async_fire_internal(  # type: ignore[misc]
-                EVENT_STATE_REPORTED,
-                {
-                    "entity_id": entity_id,
-                    "old_last_reported": old_last_reported,
-                    "new_state": old_state,
-                },
-                context=context,
-                time_fired=timestamp,
-            )
-            return
+            if type(old_state) is CompactState:
+                old_state.last_reported_timestamp = timestamp
+            else:
+                old_state.last_reported = now  # type: ignore[union-attr]
+                old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            state_reported_data: EventStateReportedData = {
+                "entity_id": entity_id,
+                "old_last_reported": old_last_reported,
+                "new_state": old_state,
+            }
+            return EVENT_STATE_REPORTED, state_reported_data
 
         if same_attr:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
 
-        # This is intentionally called with positional only arguments for performance
-        # reasons
-        state = State(
-            entity_id,
-            new_state,
-            attributes,
-            last_changed,
-            now,
-            now,
-            context,
-            old_state is None,
-            state_info,
-            timestamp,
-        )
+        state: State
+        # These are intentionally called with positional only arguments for
+        # performance reasons
+        if self._compact:
+            if not same_attr and attributes:
+                attributes = self._async_intern_attributes(attributes)
+            # Keep the entity_id of the old state instead of a new copy
+            if old_state is not None:
+                entity_id = old_state.entity_id
+            state = CompactState(
+                entity_id,
+                new_state,
+                attributes,
+                None,
+                None,
+                None,
+                context,
+                old_state is None,
+                state_info,
+                timestamp,
+                old_state.last_changed_timestamp if same_state else None,  # type: ignore[union-attr]
+            )
+        else:
+            state = State(
+                entity_id,
+                new_state,
+                attributes,
+                old_state.last_changed if same_state else None,  # type: ignore[union-attr]
+                now,
+                now,
+                context,
+                old_state is None,
+                state_info,
+                timestamp,
+            )
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
@@ -2381,12 +2871,7 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-            time_fired=timestamp,
-        )
+        return EVENT_STATE_CHANGED, state_changed_data
 
 
 class SupportsResponse(enum.StrEnum):
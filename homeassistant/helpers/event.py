@@ -75,6 +75,9 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TEMPLATE_DEPENDENCY_GRAPH: HassKey[_TemplateDependencyGraph] = HassKey(
+    "template_dependency_graph"
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -823,7 +826,11 @@ class _TrackStateChangeFiltered:
         if not entities:
             return
 
-        self._listeners[_ENTITIES_LISTENER] = _async_track_state_change_event(
+        self._listeners[_ENTITIES_LISTENER] = self._async_track_entities(entities)
+
+    @callback
+    def _async_track_entities(self, entities: set[str]) -> CALLBACK_TYPE:
+        return _async_track_state_change_event(
             self.hass, entities, self._action, self._action_as_hassjob.job_type
         )
 
@@ -880,6 +887,153 @@ def async_track_state_change_filtered(
     return tracker
 
 
+class _TrackTemplateStateChanges(_TrackStateChangeFiltered):
+    """Track the entities of templates in the template dependency graph."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        track_states: TrackStates,
+        action: Callable[[Event[EventStateChangedData]], Any],
+        graph: _TemplateDependencyGraph,
+    ) -> None:
+        """Handle removal / refresh of tracker init."""
+        super().__init__(hass, track_states, action)
+        self._graph = graph
+
+    @callback
+    def _async_track_entities(self, entities: set[str]) -> CALLBACK_TYPE:
+        return self._graph.async_track_entities(entities, self._action_as_hassjob)
+
+
+class _TemplateDependencyGraph:
+    """Track the entities referenced by the templates of all trackers.
+
+    Each entity gets a single state_changed listener shared by all the
+    trackers that reference it, instead of one per tracker. The trackers
+    are refreshed right away for every state change so none is missed
+    when a state changes more than once in the same loop iteration.
+
+    Identical templates that only depend on the states they read are
+    rendered once until one of the states changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the template dependency graph."""
+        self.hass = hass
+        self._entity_jobs: dict[
+            str, dict[HassJob[[Event[EventStateChangedData]], Any], None]
+        ] = {}
+        self._listeners: dict[str, CALLBACK_TYPE] = {}
+        self._renders: dict[str, RenderInfo] = {}
+        self.state_changes = 0
+        self.renders = 0
+        self.shared_renders = 0
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_clear_renders)
+
+    @callback
+    def async_track_entities(
+        self,
+        entities: set[str],
+        job: HassJob[[Event[EventStateChangedData]], Any],
+    ) -> CALLBACK_TYPE:
+        """Run the job when the state of one of the entities changes."""
+        for entity_id in entities:
+            if (jobs := self._entity_jobs.get(entity_id)) is None:
+                jobs = self._entity_jobs[entity_id] = {}
+                self._listeners[entity_id] = self.hass.bus.async_listen(
+                    EVENT_STATE_CHANGED,
+                    self._async_state_changed,
+                    dispatch_key=("entity_id", entity_id),
+                )
+            jobs[job] = None
+        return partial(self._async_untrack_entities, entities, job)
+
+    @callback
+    def _async_untrack_entities(
+        self,
+        entities: set[str],
+        job: HassJob[[Event[EventStateChangedData]], Any],
+    ) -> None:
+        """Stop running the job when the state of the entities changes."""
+        for entity_id in entities:
+            jobs = self._entity_jobs[entity_id]
+            del jobs[job]
+            if not jobs:
+                del self._entity_jobs[entity_id]
+                self._listeners.pop(entity_id)()
+
+    @callback
+    def _async_clear_renders(self, event: Event[EventStateChangedData]) -> None:
+        """Clear the shared renders since a state they may have read changed."""
+        if self._renders:
+            self._renders.clear()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Refresh the trackers of the entity that changed."""
+        entity_id = event.data["entity_id"]
+        if not (jobs := self._entity_jobs.get(entity_id)):
+            return
+        # The listener clearing the renders may run after this one
+        self._renders.clear()
+        renders = self.renders
+        for job in list(jobs):
+            try:
+                self.hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s", entity_id, job
+                )
+        self.state_changes += 1
+        _LOGGER.debug(
+            "Re-rendered %s templates for the state change of %s",
+            self.renders - renders,
+            entity_id,
+        )
+
+    @callback
+    def async_render_to_info(
+        self, template: Template, variables: TemplateVarsType
+    ) -> RenderInfo:
+        """Render the template or share the render of an identical template."""
+        if not template.depends_only_on_states(variables):
+            self.renders += 1
+            return template.async_render_to_info(variables)
+        if (info := self._renders.get(template.template)) is not None:
+            self.shared_renders += 1
+            return info
+        self.renders += 1
+        info = self._renders[template.template] = template.async_render_to_info(
+            variables
+        )
+        return info
+
+
+@callback
+def _async_get_template_dependency_graph(
+    hass: HomeAssistant,
+) -> _TemplateDependencyGraph:
+    """Return the template dependency graph."""
+    if (graph := hass.data.get(_TEMPLATE_DEPENDENCY_GRAPH)) is None:
+        graph = hass.data[_TEMPLATE_DEPENDENCY_GRAPH] = _TemplateDependencyGraph(hass)
+    return graph
+
+
+@callback
+def async_get_template_render_stats(hass: HomeAssistant) -> dict[str, float]:
+    """Return how many templates were re-rendered on state changes."""
+    graph = _async_get_template_dependency_graph(hass)
+    return {
+        "state_changes": graph.state_changes,
+        "renders": graph.renders,
+        "shared_renders": graph.shared_renders,
+        "renders_per_state_change": (
+            graph.renders / graph.state_changes if graph.state_changes else 0
+        ),
+    }
+
+
 @callback
 @bind_hass
 def async_track_template(
@@ -1003,6 +1157,7 @@ class TrackTemplateResultInfo:
             track_template_.template.hass = hass
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._graph = _async_get_template_dependency_graph(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -1059,9 +1214,13 @@ class TrackTemplateResultInfo:
                 else:
                     log_fn(logging.ERROR, str(info.exception))
 
-        self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+        self._track_state_changes = _TrackTemplateStateChanges(
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._refresh,
+            self._graph,
         )
+        self._track_state_changes.async_setup()
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1170,8 +1329,8 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._graph.async_render_to_info(
+            template, track_template_.variables
         )
 
         try:
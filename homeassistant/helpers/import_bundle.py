@@ -0,0 +1,125 @@
+"""Preload the modules of the integrations imported by the previous start."""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import sys
+import time
+from typing import TypedDict
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, __version__
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.loader import (
+    DATA_IMPORT_TIMES,
+    PACKAGE_BUILTIN,
+    PACKAGE_CUSTOM_COMPONENTS,
+    IntegrationNotLoaded,
+    async_get_import_times,
+    async_get_loaded_integration,
+)
+
+from .storage import Store
+
+STORAGE_KEY = "core.import_bundle"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ImportBundleData(TypedDict):
+    """Data of the import bundle."""
+
+    ha_version: str
+    modules: list[str]
+
+
+async def async_setup(hass: HomeAssistant) -> None:
+    """Preload the import bundle and record a new one once started.
+
+    The bundle is the list of the integration modules that were imported
+    by the previous start, in the order they were imported. Its modules
+    are imported in the import executor while Home Assistant starts so
+    the loader finds most of them imported when it needs them.
+    """
+    store = Store[ImportBundleData](hass, STORAGE_VERSION, STORAGE_KEY, private=True)
+    if (data := await store.async_load()) and data["ha_version"] == __version__:
+        hass.async_create_background_task(
+            _async_preload(hass, data["modules"]), "import bundle preload"
+        )
+
+    @callback
+    def _async_save_bundle(event: Event) -> None:
+        """Save the modules imported until Home Assistant started."""
+        modules = [
+            module
+            for module in async_get_import_times(hass)
+            if _async_can_preload(hass, module)
+        ]
+        store.async_delay_save(
+            lambda: {"ha_version": __version__, "modules": modules}, SAVE_DELAY
+        )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_bundle)
+
+
+@callback
+def _async_can_preload(hass: HomeAssistant, module: str) -> bool:
+    """Return if the module belongs to an integration that can be preloaded.
+
+    Integrations that do not allow being imported in the executor must
+    be imported in the event loop.
+    """
+    if module.startswith(f"{PACKAGE_BUILTIN}."):
+        domain = module.split(".")[2]
+    elif module.startswith(f"{PACKAGE_CUSTOM_COMPONENTS}."):
+        domain = module.split(".")[1]
+    else:
+        return False
+    try:
+        integration = async_get_loaded_integration(hass, domain)
+    except IntegrationNotLoaded:
+        return False
+    return integration.import_executor and (
+        module == integration.pkg_path or module.startswith(f"{integration.pkg_path}.")
+    )
+
+
+async def _async_preload(hass: HomeAssistant, modules: list[str]) -> None:
+    """Import the modules in the import executor.
+
+    The modules are imported one job at a time so the imports of the
+    loader only wait for the module being preloaded, and all imports
+    run in the same thread to avoid deadlocks on the import locks.
+    """
+    import_times = hass.data[DATA_IMPORT_TIMES]
+    start = time.perf_counter()
+    preloaded = 0
+    for module in modules:
+        if await hass.async_add_import_executor_job(
+            _preload_module, module, import_times
+        ):
+            preloaded += 1
+    _LOGGER.debug(
+        "Preloaded %s of %s modules in %.2fs",
+        preloaded,
+        len(modules),
+        time.perf_counter() - start,
+    )
+
+
+def _preload_module(module: str, import_times: dict[str, float]) -> bool:
+    """Import a module and record how long the import took."""
+    if module in sys.modules:
+        return True
+    start = time.perf_counter()
+    try:
+        importlib.import_module(module)
+    except Exception:  # noqa: BLE001
+        # The loader imports the module again when it is needed
+        # and handles the error there
+        _LOGGER.debug("Failed to preload %s", module, exc_info=True)
+        return False
+    import_times[module] = time.perf_counter() - start
+    return True
@@ -5,7 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 import logging
-from typing import Any, Self, cast
+from typing import Any, NamedTuple, Self, cast
 
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
@@ -17,7 +17,7 @@ from homeassistant.util.json import json_loads
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -42,7 +42,8 @@ class ExtraStoredData(ABC):
     def as_dict(self) -> dict[str, Any]:
         """Return a dict representation of the extra data.
 
-        Must be serializable by Home Assistant's JSONEncoder.
+        Must be serializable by Home Assistant's JSONEncoder and must not
+        be modified once it has been returned.
         """
 
 
@@ -58,6 +59,15 @@ class RestoredExtraData(ExtraStoredData):
         return self.json_dict
 
 
+class _DumpedState(NamedTuple):
+    """The JSON of a stored state from the previous dump."""
+
+    state: State
+    extra_data: dict[str, Any] | None
+    # The JSON of the stored state up to the value of last_seen
+    json_prefix: bytes
+
+
 class StoredState:
     """Object to represent a stored state."""
 
@@ -123,6 +133,7 @@ class RestoreStateData:
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._dumped_states: dict[str, _DumpedState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -198,16 +209,66 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_get_dump_items(self) -> list[Any]:
+        """Return the stored states to save, as returned by async_get_stored_states.
+
+        The JSON of the stored states of the registered entities is kept
+        between dumps and is only serialized again when the state or the
+        extra data of the entity changed, since only the value of
+        last_seen changes for the others.
+        """
+        now = dt_util.utcnow()
+        last_seen_json = json_bytes(now) + b"}"
+        get_state = self.hass.states.get
+        dumped_states = self._dumped_states
+        items: list[Any] = []
+
+        for entity_id, entity in self.entities.items():
+            if (state := get_state(entity_id)) is None:
+                continue
+            extra_data = entity.extra_restore_state_data
+            extra_data_dict = extra_data.as_dict() if extra_data else None
+            if (
+                (dumped := dumped_states.get(entity_id)) is None
+                or dumped.state is not state
+                or dumped.extra_data != extra_data_dict
+            ):
+                if state.attributes.get(ATTR_RESTORED):
+                    continue
+                dumped = dumped_states[entity_id] = _DumpedState(
+                    state,
+                    extra_data_dict,
+                    b'{"state":'
+                    + state.as_dict_json
+                    + b',"extra_data":'
+                    + json_bytes(extra_data_dict)
+                    + b',"last_seen":',
+                )
+            items.append(json_fragment(dumped.json_prefix + last_seen_json))
+
+        expiration_time = now - STATE_EXPIRATION
+
+        for entity_id, stored_state in self.last_states.items():
+            # Don't save old states that have entities in the current run
+            if (state := get_state(entity_id)) is not None and not state.attributes.get(
+                ATTR_RESTORED
+            ):
+                continue
+
+            # Don't save old states that have expired
+            if stored_state.last_seen < expiration_time:
+                continue
+
+            items.append(stored_state.as_dict())
+
+        return items
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(self._async_get_dump_items())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -266,6 +327,7 @@ class RestoreStateData:
             )
 
         del self.entities[entity_id]
+        self._dumped_states.pop(entity_id, None)
 
 
 class RestoreEntity(Entity):
@@ -12,6 +12,7 @@ import logging
 import os
 from pathlib import Path
 from typing import Any
+import zlib
 
 from propcache import cached_property
 
@@ -32,7 +33,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
@@ -49,6 +50,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the snapshot once it grows
+# above this fraction of the size of the snapshot
+JOURNAL_COMPACT_RATIO = 0.5
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -227,6 +233,159 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+type _JournalChunks = dict[str | None, bytes | list[bytes]]
+type _JournalItems = dict[str | None, list[Any]]
+
+
+def _journal_list_chunks(
+    items: list[Any], old_items: list[Any] | None, old_chunks: Any
+) -> list[bytes]:
+    """Serialize the items of a list.
+
+    The registries keep the serialized entries as JSON fragments that
+    are only replaced when an entry changes, so the chunk of a fragment
+    that is still the same object is reused instead of serialized again.
+    """
+    if old_items is None or type(old_chunks) is not list:
+        return [json_helper.json_bytes(item) for item in items]
+    json_fragment = json_helper.json_fragment
+    chunks = [
+        old_chunk
+        if item is old_item and type(item) is json_fragment
+        else json_helper.json_bytes(item)
+        for item, old_item, old_chunk in zip(items, old_items, old_chunks, strict=False)
+    ]
+    chunks.extend(json_helper.json_bytes(item) for item in items[len(chunks) :])
+    return chunks
+
+
+def _journal_chunks(
+    data: Any, old_chunks: _JournalChunks, old_items: _JournalItems
+) -> tuple[_JournalChunks, _JournalItems]:
+    """Serialize the stored data in chunks that are journaled separately.
+
+    Lists are split in their items since the registries keep their
+    entries in lists and only a few of them change between saves.
+    The items of a list at the root are stored under the None key.
+
+    Returns the chunks and the items of the lists they were
+    serialized from.
+    """
+    if type(data) is list:
+        data = {None: data}
+    chunks: _JournalChunks = {}
+    items: _JournalItems = {}
+    for key, value in data.items():
+        if type(value) is list:
+            chunks[key] = _journal_list_chunks(
+                value, old_items.get(key), old_chunks.get(key)
+            )
+            # Copy the list since the caller may change it in place
+            items[key] = value.copy()
+        else:
+            chunks[key] = json_helper.json_bytes(value)
+    return chunks, items
+
+
+def _journal_ops(old_chunks: _JournalChunks, chunks: _JournalChunks) -> list[Any]:
+    """Return the operations that change the old chunks into the new ones."""
+    ops: list[Any] = [["del", key] for key in old_chunks if key not in chunks]
+    for key, chunk in chunks.items():
+        old_chunk = old_chunks.get(key)
+        if chunk == old_chunk:
+            continue
+        if type(chunk) is list and type(old_chunk) is list:
+            ops.extend(
+                ["item", key, idx, json_helper.json_fragment(item)]
+                for idx, (item, old_item) in enumerate(
+                    zip(chunk, old_chunk, strict=False)
+                )
+                if item is not old_item and item != old_item
+            )
+            ops.extend(
+                ["item", key, idx, json_helper.json_fragment(chunk[idx])]
+                for idx in range(len(old_chunk), len(chunk))
+            )
+            if len(chunk) < len(old_chunk):
+                ops.append(["len", key, len(chunk)])
+        elif type(chunk) is list:
+            ops.append(
+                ["set", key, json_helper.json_fragment(b"[" + b",".join(chunk) + b"]")]
+            )
+        else:
+            ops.append(["set", key, json_helper.json_fragment(chunk)])
+    return ops
+
+
+def _apply_journal_ops(data: Any, ops: list[Any]) -> None:
+    """Apply the journaled operations to the stored data."""
+    for op in ops:
+        kind, key = op[0], op[1]
+        if kind == "set":
+            data[key] = op[2]
+        elif kind == "del":
+            del data[key]
+        else:
+            items = data if key is None else data[key]
+            if kind == "item":
+                if op[2] == len(items):
+                    items.append(op[3])
+                else:
+                    items[op[2]] = op[3]
+            else:
+                del items[op[2] :]
+
+
+def _load_journaled_json(path: str) -> json_util.JsonValueType:
+    """Load the snapshot and replay the journal written since.
+
+    The first line of the journal holds the checksum of the snapshot
+    it applies to so a journal is ignored if the snapshot was replaced
+    without it, like after a crash during compaction. Each following
+    line holds the operations of a save. A line that was not completely
+    written before a crash is ignored.
+    """
+    try:
+        with open(path, mode="rb") as fdesc:
+            snapshot = fdesc.read()
+        data = json_util.json_loads(snapshot)
+    except FileNotFoundError:
+        _LOGGER.debug("JSON file not found: %s", path)
+        return {}
+    except json_util.JSON_DECODE_EXCEPTIONS as error:
+        _LOGGER.exception("Could not parse JSON content: %s", path)
+        raise HomeAssistantError(f"Error while loading {path}: {error}") from error
+    except OSError as error:
+        _LOGGER.exception("JSON file reading failed: %s", path)
+        raise HomeAssistantError(f"Error while loading {path}: {error}") from error
+
+    try:
+        with open(f"{path}{JOURNAL_SUFFIX}", mode="rb") as fdesc:
+            lines = fdesc.read().split(b"\n")
+    except FileNotFoundError:
+        return data
+
+    try:
+        header = json_util.json_loads_object(lines[0])
+    except (*json_util.JSON_DECODE_EXCEPTIONS, ValueError):
+        header = {}
+    if header.get("snapshot") != zlib.crc32(snapshot) or type(data) is not dict:
+        _LOGGER.debug("Ignoring journal of a different snapshot: %s", path)
+        return data
+
+    replayed = 0
+    for line in lines[1:]:
+        try:
+            ops = json_util.json_loads_array(line)
+        except (*json_util.JSON_DECODE_EXCEPTIONS, ValueError):
+            # The end of the journal or a save interrupted by a crash
+            break
+        _apply_journal_ops(data["data"], ops)
+        replayed += 1
+    _LOGGER.debug("Replayed %s saves from the journal of %s", replayed, path)
+    return data
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -242,8 +401,19 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal is True, saves append the changes since the previous
+        save to a journal next to the file, which is compacted into the
+        file once it grows too large. This avoids rewriting large files
+        where only a small part changes between saves. The journal is
+        also compacted when Home Assistant does its final write, but until
+        then the file alone does not hold the journaled changes: anything
+        reading the file directly, like an older version of Home Assistant
+        after a crash, misses them.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -252,6 +422,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._data: dict[str, Any] | None = None
         self._delay_handle: asyncio.TimerHandle | None = None
         self._unsub_final_write_listener: CALLBACK_TYPE | None = None
+        self._unsub_compact_journal_listener: CALLBACK_TYPE | None = None
         self._write_lock = asyncio.Lock()
         self._load_future: asyncio.Future[_T | None] | None = None
         self._encoder = encoder
@@ -259,6 +430,17 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        # Journaling is not supported with the slow path of custom encoders
+        self._journal = journal and encoder in (None, JSONEncoder)
+        self._journal_chunks: _JournalChunks | None = None
+        self._journal_items: _JournalItems = {}
+        self._journal_versions: tuple[int, int] | None = None
+        self._journal_size = 0
+        self._snapshot_size = 0
+        # If the journal holds changes that are not in the file
+        self._journal_changed = False
+        # Set once the journal is compacted for the final write
+        self._journal_compact = False
 
     @cached_property
     def path(self):
@@ -322,14 +504,16 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
-        elif cache := self._manager.async_fetch(self.key):
+        # The cache only holds the snapshot without the journal
+        elif not self._journal and (cache := self._manager.async_fetch(self.key)):
             exists, data = cache
             if not exists:
                 return None
         else:
             try:
                 data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                    _load_journaled_json if self._journal else json_util.load_json,
+                    self.path,
                 )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
@@ -493,6 +677,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
                 self._async_callback_final_write,
             )
 
+    @callback
+    def _async_ensure_compact_journal_listener(self) -> None:
+        """Ensure that the journal is compacted into the file when we quit."""
+        if self._unsub_compact_journal_listener is None:
+            self._unsub_compact_journal_listener = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE,
+                self._async_callback_compact_journal,
+            )
+
     @callback
     def _async_cleanup_final_write_listener(self) -> None:
         """Clean up a stop listener."""
@@ -520,6 +713,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._unsub_final_write_listener = None
         await self._async_handle_write_data()
 
+    async def _async_callback_compact_journal(self, _event: Event) -> None:
+        """Compact the journal because Home Assistant is in final write state."""
+        self._unsub_compact_journal_listener = None
+        # Saves from now on write the whole file
+        self._journal_compact = True
+        async with self._write_lock:
+            if not self._journal_changed:
+                # A save already wrote the whole file
+                return
+            try:
+                await self.hass.async_add_executor_job(self._compact_journal, self.path)
+            except HomeAssistantError as err:
+                _LOGGER.error("Error compacting the journal of %s: %s", self.key, err)
+
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
         async with self._write_lock:
@@ -541,6 +748,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
+            else:
+                if self._journal_changed:
+                    self._async_ensure_compact_journal_listener()
 
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
@@ -552,6 +762,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if (
+            self._journal
+            and not self._journal_compact
+            and self._write_journal(path, data)
+        ):
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +777,84 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if self._journal:
+            self._reset_journal(path, data)
+
+    def _write_journal(self, path: str, data: dict) -> bool:
+        """Append the changes since the previous save to the journal.
+
+        Returns False if the journal needs to be compacted by writing
+        the whole data.
+        """
+        if (old_chunks := self._journal_chunks) is None or self._journal_versions != (
+            data["version"],
+            data["minor_version"],
+        ):
+            return False
+        try:
+            chunks, items = _journal_chunks(
+                data["data"], old_chunks, self._journal_items
+            )
+        except TypeError:
+            # Let the full write report the data that can't be serialized
+            return False
+        if (None in chunks) is not (None in old_chunks):
+            return False
+        if not (ops := _journal_ops(old_chunks, chunks)):
+            _LOGGER.debug("Data for %s did not change", self.key)
+            self._journal_chunks = chunks
+            self._journal_items = items
+            return True
+        line = json_helper.json_bytes(ops) + b"\n"
+        if self._journal_size + len(line) > self._snapshot_size * JOURNAL_COMPACT_RATIO:
+            return False
+
+        _LOGGER.debug("Journaling %s changes for %s to %s", len(ops), self.key, path)
+        try:
+            with open(f"{path}{JOURNAL_SUFFIX}", mode="ab") as fdesc:
+                fdesc.write(line)
+                if self._atomic_writes:
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+        except OSError as error:
+            _LOGGER.exception("Saving file failed: %s%s", path, JOURNAL_SUFFIX)
+            self._journal_chunks = None
+            raise WriteError(error) from error
+        self._journal_chunks = chunks
+        self._journal_items = items
+        self._journal_size += len(line)
+        self._journal_changed = True
+        return True
+
+    def _reset_journal(self, path: str, data: dict) -> None:
+        """Start a new journal for the snapshot that was written."""
+        self._journal_chunks = None
+        with open(path, mode="rb") as fdesc:
+            snapshot = fdesc.read()
+        header = json_helper.json_bytes({"snapshot": zlib.crc32(snapshot)}) + b"\n"
+        write_file = write_utf8_file_atomic if self._atomic_writes else write_utf8_file
+        write_file(f"{path}{JOURNAL_SUFFIX}", header, self._private, mode="wb")
+        self._journal_chunks, self._journal_items = _journal_chunks(
+            data["data"], {}, {}
+        )
+        self._journal_versions = (data["version"], data["minor_version"])
+        self._journal_size = len(header)
+        self._snapshot_size = len(snapshot)
+        self._journal_changed = False
+
+    def _compact_journal(self, path: str) -> None:
+        """Write the file with the journaled changes and start a new journal."""
+        data = _load_journaled_json(path)
+        assert isinstance(data, dict)
+        _LOGGER.debug("Compacting the journal of %s into %s", self.key, path)
+        json_helper.save_json(
+            path,
+            data,
+            self._private,
+            encoder=self._encoder,
+            atomic_writes=self._atomic_writes,
+        )
+        self._reset_journal(path, data)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -573,3 +868,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal:
+            self._journal_chunks = None
+            self._journal_changed = False
+            if self._unsub_compact_journal_listener is not None:
+                self._unsub_compact_journal_listener()
+                self._unsub_compact_journal_listener = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{JOURNAL_SUFFIX}"
+                )
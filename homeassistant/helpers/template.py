@@ -15,6 +15,7 @@ from functools import cache, lru_cache, partial, wraps
 import json
 import logging
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -163,6 +164,7 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+FAST_RENDER_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
@@ -518,6 +520,7 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_fast_render",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -550,6 +553,7 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._fast_render: _FastRender | None = None
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -639,8 +643,16 @@ class Template:
         if variables is not None:
             kwargs.update(variables)
 
+        result: Any = _SENTINEL
+        fast_render = self._fast_render
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            # Variables shadow the globals so only use the fast path
+            # when none of the functions it calls is overridden
+            if fast_render is not None and fast_render.names.isdisjoint(kwargs):
+                result = _fast_render_with_context(self.template, fast_render)
+                render_result = str(result)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -654,8 +666,28 @@ class Template:
         if not parse_result or self.hass and self.hass.config.legacy_templates:
             return render_result
 
+        # Numbers and booleans returned by the fast path are what parsing
+        # their rendered string would return, so skip parsing them again
+        if (
+            (result_type := type(result)) is int
+            or result_type is bool
+            or (result_type is float and _IS_NUMERIC.match(render_result))
+        ):
+            return result
+
         return self._parse_result(render_result)
 
+    def depends_only_on_states(self, variables: TemplateVarsType = None) -> bool:
+        """Return if rendering only depends on the states it reads.
+
+        This is the case for the templates rendered without Jinja when the
+        variables do not shadow any of the functions they call, so the render
+        can be shared with identical templates until one of the states changes.
+        """
+        return (fast_render := self._fast_render) is not None and (
+            not variables or fast_render.names.isdisjoint(variables)
+        )
+
     def _parse_result(self, render_result: str) -> Any:
         """Parse the result."""
         try:
@@ -861,6 +893,8 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        if not limited:
+            self._fast_render = env.get_fast_render(self.template)
 
         return self._compiled
 
@@ -2745,6 +2779,214 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+def _fast_render_with_context(template_str: str, fast_render: _FastRender) -> Any:
+    """Store template being rendered in a ContextVar to aid error handling."""
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        return fast_render.render()
+
+
+class _FastRenderUnsupported(Exception):
+    """The template uses syntax that can only be rendered by Jinja."""
+
+
+class _FastRender:
+    """A template compiled to a Python closure that bypasses Jinja.
+
+    Only templates that are a single expression built from constants,
+    state lookups, arithmetic, comparisons and the number filters are
+    compiled. They make up the vast majority of the templates and
+    rendering them with Jinja is mostly overhead.
+    """
+
+    __slots__ = ("names", "render")
+
+    def __init__(self, render: Callable[[], Any], names: frozenset[str]) -> None:
+        """Initialize the fast render."""
+        self.render = render
+        # The global names a variable passed to the render would shadow
+        self.names = names
+
+
+_FAST_RENDER_BINARY_OPERATORS: dict[
+    type[jinja2.nodes.Node], Callable[[Any, Any], Any]
+] = {
+    jinja2.nodes.Add: operator.add,
+    jinja2.nodes.Sub: operator.sub,
+    jinja2.nodes.Mul: operator.mul,
+    jinja2.nodes.Div: operator.truediv,
+    jinja2.nodes.FloorDiv: operator.floordiv,
+}
+_FAST_RENDER_UNARY_OPERATORS: dict[type[jinja2.nodes.Node], Callable[[Any], Any]] = {
+    jinja2.nodes.Neg: operator.neg,
+    jinja2.nodes.Pos: operator.pos,
+    jinja2.nodes.Not: operator.not_,
+}
+_FAST_RENDER_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "in": lambda left, right: left in right,
+    "notin": lambda left, right: left not in right,
+}
+_FAST_RENDER_FILTERS = ("float", "int", "round")
+
+
+def _compile_fast_render(
+    hass: HomeAssistant, env: TemplateEnvironment, template_str: str
+) -> _FastRender | None:
+    """Compile a template to a closure or return None if Jinja is needed."""
+    try:
+        template = env.parse(template_str)
+    except jinja2.TemplateError:
+        return None
+    if (
+        len(template.body) != 1
+        or type(output := template.body[0]) is not jinja2.nodes.Output
+        or len(output.nodes) != 1
+    ):
+        return None
+    functions: dict[str, Callable[..., Any]] = {
+        "states": env.globals["states"],  # type: ignore[dict-item]
+        "state_attr": partial(state_attr, hass),
+        "is_state": partial(is_state, hass),
+        "is_state_attr": partial(is_state_attr, hass),
+        "has_value": partial(has_value, hass),
+    }
+    filters = {name: env.filters[name] for name in _FAST_RENDER_FILTERS}
+    names: set[str] = set()
+    try:
+        render = _compile_fast_node(output.nodes[0], functions, filters, names)
+    except _FastRenderUnsupported:
+        return None
+    return _FastRender(render, frozenset(names))
+
+
+def _compile_fast_call(
+    function: Callable[..., Any],
+    node: jinja2.nodes.Call | jinja2.nodes.Filter,
+    value: Callable[[], Any] | None,
+    functions: dict[str, Callable[..., Any]],
+    filters: dict[str, Callable[..., Any]],
+    names: set[str],
+) -> Callable[[], Any]:
+    """Compile a call of a function or a filter of a value."""
+    if node.dyn_args is not None or node.dyn_kwargs is not None:
+        raise _FastRenderUnsupported
+    keywords: list[jinja2.nodes.Keyword] = []
+    for keyword in node.kwargs:
+        if not isinstance(keyword, jinja2.nodes.Keyword):
+            raise _FastRenderUnsupported
+        keywords.append(keyword)
+
+    # Almost all the arguments are constants, bind them once
+    # instead of calling a closure for each of them
+    if all(
+        isinstance(arg, jinja2.nodes.Const)
+        for arg in [*node.args, *(keyword.value for keyword in keywords)]
+    ):
+        const_args = tuple(arg.value for arg in node.args)  # type: ignore[attr-defined]
+        const_kwargs = {keyword.key: keyword.value.value for keyword in keywords}  # type: ignore[attr-defined]
+        if value is None:
+            return partial(function, *const_args, **const_kwargs)
+        if not const_args and not const_kwargs:
+            return lambda: function(value())
+        return lambda: function(value(), *const_args, **const_kwargs)
+
+    args = [] if value is None else [value]
+    args.extend(_compile_fast_node(arg, functions, filters, names) for arg in node.args)
+    kwargs = {
+        keyword.key: _compile_fast_node(keyword.value, functions, filters, names)
+        for keyword in keywords
+    }
+    return lambda: function(
+        *[arg() for arg in args], **{key: arg() for key, arg in kwargs.items()}
+    )
+
+
+def _compile_fast_node(  # noqa: C901
+    node: jinja2.nodes.Node,
+    functions: dict[str, Callable[..., Any]],
+    filters: dict[str, Callable[..., Any]],
+    names: set[str],
+) -> Callable[[], Any]:
+    """Compile an expression node to a closure.
+
+    Raises _FastRenderUnsupported for nodes outside of the supported subset.
+    """
+    if isinstance(node, jinja2.nodes.Const):
+        value = node.value
+        return lambda: value
+
+    if isinstance(node, jinja2.nodes.List):
+        items = [
+            _compile_fast_node(item, functions, filters, names) for item in node.items
+        ]
+        return lambda: [item() for item in items]
+
+    if isinstance(node, jinja2.nodes.BinExpr):
+        left = _compile_fast_node(node.left, functions, filters, names)
+        right = _compile_fast_node(node.right, functions, filters, names)
+        if isinstance(node, jinja2.nodes.And):
+            return lambda: left() and right()
+        if isinstance(node, jinja2.nodes.Or):
+            return lambda: left() or right()
+        if (operation := _FAST_RENDER_BINARY_OPERATORS.get(type(node))) is None:
+            raise _FastRenderUnsupported
+        return lambda: operation(left(), right())
+
+    if isinstance(node, jinja2.nodes.UnaryExpr):
+        if (unary := _FAST_RENDER_UNARY_OPERATORS.get(type(node))) is None:
+            raise _FastRenderUnsupported
+        operand = _compile_fast_node(node.node, functions, filters, names)
+        return lambda: unary(operand())
+
+    if isinstance(node, jinja2.nodes.Compare):
+        first = _compile_fast_node(node.expr, functions, filters, names)
+        comparisons: list[tuple[Callable[[Any, Any], Any], Callable[[], Any]]] = []
+        for operand_node in node.ops:
+            if (compare := _FAST_RENDER_COMPARE_OPERATORS.get(operand_node.op)) is None:
+                raise _FastRenderUnsupported
+            comparisons.append(
+                (
+                    compare,
+                    _compile_fast_node(operand_node.expr, functions, filters, names),
+                )
+            )
+
+        def _compare() -> Any:
+            # Chain the comparisons like Python and Jinja do
+            left = first()
+            result: Any = True
+            for compare, operand in comparisons:
+                right = operand()
+                if not (result := compare(left, right)):
+                    return result
+                left = right
+            return result
+
+        return _compare
+
+    if isinstance(node, jinja2.nodes.Call):
+        if not isinstance(node.node, jinja2.nodes.Name) or (
+            (function := functions.get(node.node.name)) is None
+        ):
+            raise _FastRenderUnsupported
+        names.add(node.node.name)
+        return _compile_fast_call(function, node, None, functions, filters, names)
+
+    if isinstance(node, jinja2.nodes.Filter):
+        if node.node is None or (filter_ := filters.get(node.name)) is None:
+            raise _FastRenderUnsupported
+        filtered = _compile_fast_node(node.node, functions, filters, names)
+        return _compile_fast_call(filter_, node, filtered, functions, filters, names)
+
+    raise _FastRenderUnsupported
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2867,6 +3109,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self.fast_render_cache: LRU[str, _FastRender | None] = LRU(
+            FAST_RENDER_CACHE_SIZE
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3223,5 +3468,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache[source] = compiled
         return compiled
 
+    def get_fast_render(self, source: str) -> _FastRender | None:
+        """Return the template compiled to a closure if it does not need Jinja."""
+        if self.hass is None:
+            return None
+        try:
+            return self.fast_render_cache[source]
+        except KeyError:
+            pass
+        fast_render = _compile_fast_render(self.hass, self, source)
+        self.fast_render_cache[source] = fast_render
+        return fast_render
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
@@ -15,6 +15,7 @@ import importlib
 import logging
 import os
 import pathlib
+import stat
 import sys
 import time
 from types import ModuleType
@@ -29,7 +30,7 @@ from propcache import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -49,6 +50,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -132,6 +134,13 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_IMPORT_TIMES: HassKey[dict[str, float]] = HassKey("import_times")
+DATA_MANIFEST_INDEX: HassKey[
+    _ManifestIndex | None | asyncio.Future[_ManifestIndex | None]
+] = HassKey("manifest_index")
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -270,6 +279,22 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMES] = {}
+
+
+def _is_imported(name: str) -> bool:
+    """Return if a module is imported and done initializing.
+
+    Modules preloaded from the import bundle can be in sys.modules while
+    another thread is still importing them. Importing them in the event
+    loop would then block it until the import is done.
+    """
+    module = sys.modules.get(name)
+    return (
+        module is not None
+        and getattr(getattr(module, "__spec__", None), "_initializing", False)
+        is not True
+    )
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -283,6 +308,118 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class _ManifestIndex:
+    """Persisted index of the manifests and files of the integrations.
+
+    Resolving an integration reads and parses its manifest and lists the
+    files of its directory to know which platforms it has. The index keeps
+    both so they do not have to be read again on the next start.
+
+    An entry is only used while the modification time and size of the
+    manifest and the modification time of the integration directory are
+    unchanged. The whole index is dropped when Home Assistant is updated.
+    """
+
+    def __init__(
+        self, store: Store[dict[str, Any]], entries: dict[str, dict[str, Any]]
+    ) -> None:
+        """Initialize the index."""
+        self._store = store
+        self._entries = entries
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, file_path: pathlib.Path, stat_key: list[int]
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and top level files of an integration.
+
+        Returns None if the integration is not indexed or has changed.
+
+        This method is thread-safe.
+        """
+        entry = self._entries.get(str(file_path))
+        if entry is None or entry["stat"] != stat_key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        files: list[str] | None = entry["files"]
+        # The integration adds keys to its manifest
+        return (
+            cast(Manifest, entry["manifest"].copy()),
+            None if files is None else set(files),
+        )
+
+    def set(
+        self,
+        file_path: pathlib.Path,
+        stat_key: list[int],
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Index the manifest and top level files of an integration.
+
+        This method is thread-safe.
+        """
+        self._entries[str(file_path)] = {
+            "stat": stat_key,
+            "manifest": manifest.copy(),
+            "files": None if top_level_files is None else sorted(top_level_files),
+        }
+        self._dirty = True
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule saving the index if integrations were indexed."""
+        if self._dirty:
+            self._dirty = False
+            self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the index to store."""
+        return {"ha_version": __version__, "entries": self._entries.copy()}
+
+
+async def _async_get_manifest_index(hass: HomeAssistant) -> _ManifestIndex | None:
+    """Return the manifest index, loading it on first use.
+
+    Returns None if there is no config dir to store the index.
+    """
+    index_or_future = hass.data.get(DATA_MANIFEST_INDEX, UNDEFINED)
+    if isinstance(index_or_future, asyncio.Future):
+        return await index_or_future
+    if index_or_future is not UNDEFINED:
+        return index_or_future
+
+    if not hass.config.config_dir:
+        hass.data[DATA_MANIFEST_INDEX] = None
+        return None
+
+    future = hass.data[DATA_MANIFEST_INDEX] = hass.loop.create_future()
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store = Store[dict[str, Any]](
+        hass,
+        MANIFEST_INDEX_STORAGE_VERSION,
+        MANIFEST_INDEX_STORAGE_KEY,
+        atomic_writes=True,
+    )
+    entries: dict[str, dict[str, Any]] = {}
+    try:
+        data = await store.async_load()
+    except Exception:
+        _LOGGER.exception("Error loading the manifest index")
+    else:
+        if data and data["ha_version"] == __version__:
+            entries = data["entries"]
+    index = hass.data[DATA_MANIFEST_INDEX] = _ManifestIndex(store, entries)
+    future.set_result(index)
+    return index
+
+
 def _get_custom_components(hass: HomeAssistant) -> dict[str, Integration]:
     """Return list of custom integrations."""
     if hass.config.recovery_mode or hass.config.safe_mode:
@@ -300,10 +437,13 @@ def _get_custom_components(hass: HomeAssistant) -> dict[str, Integration]:
         if entry.is_dir()
     ]
 
+    # The index is loaded before this runs in the executor
+    index = hass.data.get(DATA_MANIFEST_INDEX)
     integrations = _resolve_integrations_from_root(
         hass,
         custom_components,
         [comp.name for comp in dirs],
+        index if isinstance(index, _ManifestIndex) else None,
     )
     return {
         integration.domain: integration
@@ -321,7 +461,10 @@ async def async_get_custom_components(
     if comps_or_future is None:
         future = hass.data[DATA_CUSTOM_COMPONENTS] = hass.loop.create_future()
 
+        index = await _async_get_manifest_index(hass)
         comps = await hass.async_add_executor_job(_get_custom_components, hass)
+        if index is not None:
+            index.async_schedule_save()
 
         hass.data[DATA_CUSTOM_COMPONENTS] = comps
         future.set_result(comps)
@@ -649,33 +792,65 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        index: _ManifestIndex | None = None,
     ) -> Integration | None:
-        """Resolve an integration from a root module."""
-        for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
+        """Resolve an integration from a root module.
 
-            if not manifest_path.is_file():
-                continue
+        If an index is passed, the manifest and top level files are
+        taken from it while the integration is unchanged.
+        """
+        for base in root_module.__path__:
+            file_path = pathlib.Path(base) / domain
+            manifest_path = file_path / "manifest.json"
+
+            if index is None:
+                if not manifest_path.is_file():
+                    continue
+                stat_key = None
+                indexed = None
+            else:
+                try:
+                    manifest_stat = os.stat(manifest_path)
+                    dir_stat = os.stat(file_path)
+                except OSError:
+                    continue
+                if not stat.S_ISREG(manifest_stat.st_mode):
+                    continue
+                stat_key = [
+                    manifest_stat.st_mtime_ns,
+                    manifest_stat.st_size,
+                    dir_stat.st_mtime_ns,
+                ]
+                indexed = index.get(file_path, stat_key)
+
+            if indexed:
+                manifest, top_level_files = indexed
+            else:
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if index is not None and stat_key is not None:
+                    index.set(file_path, stat_key, manifest, top_level_files)
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -769,6 +944,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_times = hass.data[DATA_IMPORT_TIMES]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -995,8 +1171,8 @@ class Integration:
         # Some integrations fail on import because they call functions incorrectly.
         # So we do it before validating config to catch these errors.
         load_executor = self.import_executor and (
-            self.pkg_path not in sys.modules
-            or (self.config_flow and f"{self.pkg_path}.config_flow" not in sys.modules)
+            not _is_imported(self.pkg_path)
+            or (self.config_flow and not _is_imported(f"{self.pkg_path}.config_flow"))
         )
         if not load_executor:
             comp = self._get_component()
@@ -1070,9 +1246,7 @@ class Integration:
         cache = self._cache
         domain = self.domain
         try:
-            cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
-            )
+            cache[domain] = cast(ComponentProtocol, self._import_module(self.pkg_path))
         except ImportError:
             raise
         except RuntimeError as err:
@@ -1133,7 +1307,7 @@ class Integration:
             if (
                 self.import_executor
                 and full_name not in self.hass.config.components
-                and f"{self.pkg_path}.{platform_name}" not in sys.modules
+                and not _is_imported(f"{self.pkg_path}.{platform_name}")
             ):
                 load_executor_platforms.append(platform_name)
             else:
@@ -1300,7 +1474,24 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._import_module(f"{self.pkg_path}.{platform_name}")
+
+    def _import_module(self, name: str) -> ModuleType:
+        """Import a module and record how long the import took.
+
+        The time includes importing the modules it depends on that
+        were not imported yet. Modules that were already imported
+        are not recorded.
+
+        This method must be thread-safe as it's called from the executor
+        and the event loop.
+        """
+        if name in sys.modules:
+            return importlib.import_module(name)
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self._import_times[name] = time.perf_counter() - start
+        return module
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -1322,13 +1513,18 @@ def _version_blocked(
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: Iterable[str],
+    index: _ManifestIndex | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, index
+            )
         except Exception:
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -1337,6 +1533,15 @@ def _resolve_integrations_from_root(
     return integrations
 
 
+@callback
+def async_get_import_times(hass: HomeAssistant) -> dict[str, float]:
+    """Return how long importing the modules of the integrations took.
+
+    Only the modules imported since the loader was set up are included.
+    """
+    return hass.data[DATA_IMPORT_TIMES].copy()
+
+
 @callback
 def async_get_loaded_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration which is already loaded.
@@ -1414,9 +1619,12 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        index = await _async_get_manifest_index(hass)
         integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, needed
+            _resolve_integrations_from_root, hass, components, needed, index
         )
+        if index is not None:
+            index.async_schedule_save()
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -55,6 +55,9 @@ class RuntimeConfig:
 
     safe_mode: bool = False
 
+    import_bundle: bool = False
+    compact_states: bool = False
+
 
 class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
     """Event loop policy for Home Assistant."""
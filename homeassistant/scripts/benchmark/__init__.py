@@ -6,17 +6,27 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+import gc
 import logging
+import os
+import tempfile
+import time
 from timeit import default_timer as timer
+from typing import Any
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
-from homeassistant.helpers.entityfilter import convert_include_exclude_filter
+from homeassistant.helpers.entityfilter import (
+    INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
+    convert_include_exclude_filter,
+)
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -116,6 +126,190 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+async def _fire_events_with_many_listeners(hass, keyed):
+    """Fire 100k state changed events at 10k entity filtered listeners."""
+    count = 0
+    listeners = 10**4
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listeners):
+        entity_id = f"light.kitchen{idx}"
+        if keyed:
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED, listener, dispatch_key=("entity_id", entity_id)
+            )
+            continue
+
+        @core.callback
+        def event_filter(event_data, entity_id=entity_id):
+            """Filter event."""
+            return event_data["entity_id"] == entity_id
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter=event_filter)
+
+    event_data = [
+        {
+            "entity_id": f"light.kitchen{idx}",
+            "old_state": None,
+            "new_state": None,
+        }
+        for idx in range(100)
+    ]
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data[idx % 100])
+
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+
+    assert count == events_to_fire
+
+    print(f"{events_to_fire / runtime:.0f} events/sec")
+    return runtime
+
+
+@benchmark
+async def fire_events_with_many_filtered_listeners(hass):
+    """Fire 100k events at 10k listeners that each filter on entity_id."""
+    return await _fire_events_with_many_listeners(hass, keyed=False)
+
+
+@benchmark
+async def fire_events_with_many_keyed_listeners(hass):
+    """Fire 100k events at 10k listeners indexed by an entity_id dispatch key."""
+    return await _fire_events_with_many_listeners(hass, keyed=True)
+
+
+async def _set_state_bursts(hass, batched):
+    """Write 1000 bursts of 200 state updates."""
+    count = 0
+    bursts = 1000
+    burst_size = 200
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+
+    entity_ids = [f"sensor.bridge{idx}" for idx in range(burst_size)]
+
+    start = timer()
+
+    for burst in range(bursts):
+        value = str(burst)
+        if batched:
+            hass.states.async_set_many(
+                [(entity_id, value, None) for entity_id in entity_ids]
+            )
+            continue
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, value)
+
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+
+    assert count == bursts * burst_size
+
+    print(f"{count / runtime:.0f} states/sec")
+    return runtime
+
+
+@benchmark
+async def set_state_bursts(hass):
+    """Write bursts of 200 states one at a time."""
+    return await _set_state_bursts(hass, batched=False)
+
+
+@benchmark
+async def set_many_state_bursts(hass):
+    """Write bursts of 200 states with async_set_many."""
+    return await _set_state_bursts(hass, batched=True)
+
+
+def _rss_mib() -> float:
+    """Return the resident set size of the process in MiB.
+
+    Only supported on Linux.
+    """
+    with open("/proc/self/statm", encoding="ascii") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+async def _states_memory(hass, compact, named):
+    """Build 50k states and report how much the RSS grew."""
+    entities = 50000
+    hass.states.async_set_compact(compact)
+    gc.collect()
+    rss_before = _rss_mib()
+
+    start = timer()
+
+    for idx in range(entities):
+        # Most installs have many entities of the same few kinds
+        # and only some of them are named unless named is set
+        kind = idx % 10
+        attributes: dict[str, Any] = {
+            "device_class": ("power", "energy", "temperature", "humidity", "motion")[
+                kind % 5
+            ],
+            "unit_of_measurement": ("W", "kWh", "°C", "%", None)[kind % 5],
+            "state_class": "measurement",
+        }
+        if named or kind < 3:
+            attributes["friendly_name"] = f"Sensor {idx}"
+        entity_id = f"sensor.memory_{idx}"
+        hass.states.async_set(entity_id, "0", attributes)
+        hass.states.async_set(entity_id, str(idx), attributes)
+
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+
+    gc.collect()
+    rss_grown = _rss_mib() - rss_before
+    print(
+        f"RSS grew by {rss_grown:.1f} MiB ({rss_grown * 2**20 / entities:.0f} B/state)"
+    )
+    return runtime
+
+
+@benchmark
+async def states_memory(hass):
+    """Build 50k states and report the RSS used."""
+    return await _states_memory(hass, compact=False, named=False)
+
+
+@benchmark
+async def compact_states_memory(hass):
+    """Build 50k compact states and report the RSS used."""
+    return await _states_memory(hass, compact=True, named=False)
+
+
+@benchmark
+async def named_states_memory(hass):
+    """Build 50k named states and report the RSS used."""
+    return await _states_memory(hass, compact=False, named=True)
+
+
+@benchmark
+async def compact_named_states_memory(hass):
+    """Build 50k named compact states and report the RSS used."""
+    return await _states_memory(hass, compact=True, named=True)
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +502,1056 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+def _insert_recorder_states(bulk):
+    """Insert 100k states into the recorder database in commits of 500 states.
+
+    Set RECORDER_BENCHMARK_DB_URL to run against MariaDB or PostgreSQL
+    instead of a temporary SQLite database.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.bulk_insert import BulkInsertManager
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import (
+        SCHEMA_VERSION,
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    states_to_insert = 10**5
+    commit_size = 500
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_url = os.environ.get(
+            "RECORDER_BENCHMARK_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+        )
+        engine = create_engine(db_url)
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        bulk_insert_manager = BulkInsertManager()
+        bulk_insert_manager.activate(engine, SCHEMA_VERSION)
+        if bulk and not bulk_insert_manager.active:
+            print(f"{engine.dialect.name} does not support bulk inserts")
+
+        with Session(engine) as session:
+            states_meta = [
+                StatesMeta(entity_id=f"sensor.power{idx}") for idx in range(100)
+            ]
+            session.add_all(states_meta)
+            session.commit()
+            metadata_ids = [row.metadata_id for row in states_meta]
+
+        start = timer()
+
+        with Session(engine, expire_on_commit=False) as session:
+            old_states = {}
+            for commit_start in range(0, states_to_insert, commit_size):
+                for idx in range(commit_start, commit_start + commit_size):
+                    metadata_id = metadata_ids[idx % 100]
+                    state = States(
+                        state=str(idx),
+                        last_updated_ts=1700000000.0 + idx,
+                        origin_idx=0,
+                        metadata_id=metadata_id,
+                        old_state=old_states.get(metadata_id),
+                    )
+                    old_states[metadata_id] = state
+                    if idx % 10 == 0:
+                        state.state_attributes = StateAttributes(
+                            hash=idx, shared_attrs=f'{{"idx":{idx}}}'
+                        )
+                        if bulk:
+                            bulk_insert_manager.add_state_attributes(
+                                state.state_attributes
+                            )
+                    if bulk:
+                        bulk_insert_manager.add_state(state)
+                    else:
+                        session.add(state)
+                if bulk:
+                    bulk_insert_manager.insert(session)
+                session.commit()
+                bulk_insert_manager.clear()
+
+        runtime = timer() - start
+        engine.dispose()
+
+    print(f"{states_to_insert / runtime:.0f} states/sec")
+    return runtime
+
+
+@benchmark
+async def recorder_orm_inserts(hass):
+    """Insert states into the recorder database with the ORM unit of work."""
+    return await hass.async_add_executor_job(_insert_recorder_states, False)
+
+
+@benchmark
+async def recorder_bulk_inserts(hass):
+    """Insert states into the recorder database with the bulk insert manager."""
+    return await hass.async_add_executor_job(_insert_recorder_states, True)
+
+
+def _purge_recorder_states():
+    """Purge the older half of the states of a SQLite recorder database.
+
+    The database has 1M states of 2k entities by default, set
+    RECORDER_BENCHMARK_STATES to purge a larger database.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import random
+
+    # pylint: disable-next=import-outside-toplevel
+    from types import SimpleNamespace
+
+    # pylint: disable-next=import-outside-toplevel
+    from unittest.mock import Mock
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine, event, insert
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import purge
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.const import SupportedDialect
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.models import (
+        DatabaseEngine,
+        DatabaseOptimizer,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.table_managers.recent_states import (
+        RecentStatesManager,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.table_managers.states import StatesManager
+
+    states_to_insert = int(os.environ.get("RECORDER_BENCHMARK_STATES", 10**6))
+    entities = 2000
+    commit_size = 10**5
+    start_ts = 1700000000.0
+    rnd = random.Random(1)
+
+    def _create_engine(path):
+        engine = create_engine(f"sqlite:///{path}")
+
+        @event.listens_for(engine, "connect")
+        def _setup_connection(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA cache_size = -16384")
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+
+        return engine
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = _create_engine(f"{tmp_dir}/benchmark.db")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                insert(StatesMeta),
+                [
+                    {"metadata_id": idx + 1, "entity_id": f"sensor.power{idx}"}
+                    for idx in range(entities)
+                ],
+            )
+            old_state_ids = {}
+            attributes_ids = {}
+            attributes = []
+            states = []
+            for state_id in range(1, states_to_insert + 1):
+                metadata_id = rnd.randrange(entities) + 1
+                # The attributes change with 5% of the states
+                if metadata_id not in attributes_ids or rnd.random() < 0.05:
+                    attributes_id = attributes_ids[metadata_id] = state_id
+                    attributes.append(
+                        {
+                            "attributes_id": attributes_id,
+                            "hash": attributes_id,
+                            "shared_attrs": f'{{"unit_of_measurement":"W",'
+                            f'"friendly_name":"Power {metadata_id}",'
+                            f'"idx":{attributes_id}}}',
+                        }
+                    )
+                states.append(
+                    {
+                        "state_id": state_id,
+                        "state": str(state_id % 100),
+                        "last_updated_ts": start_ts + state_id,
+                        "origin_idx": 0,
+                        "metadata_id": metadata_id,
+                        "old_state_id": old_state_ids.get(metadata_id),
+                        "attributes_id": attributes_ids[metadata_id],
+                    }
+                )
+                old_state_ids[metadata_id] = state_id
+                if len(states) == commit_size or state_id == states_to_insert:
+                    conn.execute(insert(StateAttributes), attributes)
+                    conn.execute(insert(States), states)
+                    attributes.clear()
+                    states.clear()
+        engine.dispose()
+
+        purge_before = dt_util.utc_from_timestamp(start_ts + states_to_insert / 2)
+        # Only what purging the states uses from the recorder
+        instance = SimpleNamespace(
+            dialect_name=SupportedDialect.SQLITE,
+            use_legacy_events_index=False,
+            get_session=lambda: Session(engine),
+            max_bind_vars=998,
+            database_engine=DatabaseEngine(
+                SupportedDialect.SQLITE, DatabaseOptimizer(False), 998, None
+            ),
+            states_manager=StatesManager(),
+            recent_states_manager=RecentStatesManager(),
+            state_attributes_manager=Mock(),
+        )
+        runtime = timer()
+        while True:
+            with Session(engine) as session:
+                # pylint: disable-next=protected-access
+                more = purge._purge_states_and_attributes_ids(  # noqa: SLF001
+                    instance,
+                    session,
+                    purge.DEFAULT_STATES_BATCHES_PER_PURGE,
+                    purge_before,
+                )
+                session.commit()
+            if not more:
+                break
+        runtime = timer() - runtime
+        engine.dispose()
+
+    print(f"{states_to_insert // 2 / runtime:.0f} states/sec purged")
+    return runtime
+
+
+@benchmark
+async def recorder_purge(hass):
+    """Purge the older half of a large SQLite recorder database."""
+    return await hass.async_add_executor_job(_purge_recorder_states)
+
+
+@benchmark
+async def compile_sensor_statistics(hass):
+    """Compile the 5-minute mean, min and max of 5k sensors with 60 states each."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor.recorder import (
+        _entity_history_to_float_and_state,
+        _time_weighted_average_min_max,
+    )
+
+    sensors = 5000
+    states_per_sensor = 60
+    end = dt_util.utcnow()
+    start = end - timedelta(minutes=5)
+    histories = [
+        [
+            core.State(
+                f"sensor.power{sensor}",
+                str(sensor + idx % 7),
+                {"unit_of_measurement": "W", "state_class": "measurement"},
+                last_updated=start + timedelta(seconds=5 * idx),
+            )
+            for idx in range(states_per_sensor)
+        ]
+        for sensor in range(sensors)
+    ]
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+
+    runtime = timer()
+    for history in histories:
+        _time_weighted_average_min_max(
+            _entity_history_to_float_and_state(history), start_ts, end_ts
+        )
+    runtime = timer() - runtime
+
+    print(f"{sensors} sensors x {states_per_sensor} states: {runtime * 1000:.0f} ms")
+    return runtime
+
+
+@benchmark
+async def render_templates(hass):
+    """Render a simple state template 100k times with and without Jinja."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    renders = 10**5
+    template_str = "{{ (states('sensor.power') | float * 2) | round(1) }}"
+    hass.states.async_set("sensor.power", "42.5")
+
+    fast_template = Template(template_str, hass)
+    jinja_template = Template(template_str, hass)
+    jinja_template.async_render()
+    # Force rendering through Jinja to compare with the fast path
+    jinja_template._fast_render = None  # noqa: SLF001
+
+    jinja_runtime = timer()
+    for _ in range(renders):
+        jinja_template.async_render()
+    jinja_runtime = timer() - jinja_runtime
+
+    runtime = timer()
+    for _ in range(renders):
+        fast_template.async_render()
+    runtime = timer() - runtime
+
+    assert fast_template.async_render() == jinja_template.async_render() == 85.0
+    print(f"jinja: {renders / jinja_runtime:.0f} renders/sec")
+    print(f"fast: {renders / runtime:.0f} renders/sec")
+    return runtime
+
+
+async def _save_registry(hass, journal):
+    """Save a registry of 10k entries 200 times changing one entry per save."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import storage
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.json import json_bytes, json_fragment
+
+    entries = 10**4
+    saves = 200
+    data = {
+        "entities": [
+            json_fragment(
+                json_bytes(
+                    {
+                        "entity_id": f"sensor.power{idx}",
+                        "platform": "benchmark",
+                        "unique_id": f"power{idx}",
+                        "name": None,
+                        "options": {"sensor": {"suggested_display_precision": 1}},
+                    }
+                )
+            )
+            for idx in range(entries)
+        ]
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        store = storage.Store(hass, 1, "benchmark.registry", journal=journal)
+        await store.async_save(data)
+
+        def _written():
+            return sum(
+                os.path.getsize(path)
+                for path in (store.path, f"{store.path}{storage.JOURNAL_SUFFIX}")
+                if os.path.exists(path)
+            )
+
+        start_written = await hass.async_add_executor_job(_written)
+        written = 0
+        runtime = timer()
+        for save in range(saves):
+            data["entities"][save] = json_fragment(
+                json_bytes({"entity_id": f"sensor.power{save}", "name": "Power"})
+            )
+            await store.async_save(data)
+            size = await hass.async_add_executor_job(_written)
+            # A compacted snapshot is rewritten as a whole
+            written += size - start_written if size > start_written else size
+            start_written = size
+        runtime = timer() - runtime
+
+    print(f"{written / saves / 1024:.1f} KiB written per save")
+    print(f"{runtime / saves * 1000:.2f} ms per save")
+    return runtime
+
+
+@benchmark
+async def save_registry(hass):
+    """Save a large registry rewriting the whole file."""
+    return await _save_registry(hass, False)
+
+
+@benchmark
+async def save_registry_journal(hass):
+    """Save a large registry appending the changes to a journal."""
+    return await _save_registry(hass, True)
+
+
+@benchmark
+async def restore_state_dump(hass):
+    """Dump the restore state of 10k entities with 1% of them changing."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import restore_state
+
+    entities = 10000
+    changes = 100
+    dumps = 20
+
+    class _Entity:
+        """Entity with extra data like the sensors have."""
+
+        def __init__(self, idx):
+            self.idx = idx
+            self.value = 0
+
+        @property
+        def extra_restore_state_data(self):
+            if self.idx % 2:
+                return None
+            return restore_state.RestoredExtraData(
+                {
+                    "native_value": self.value,
+                    "native_unit_of_measurement": "W",
+                }
+            )
+
+    data = restore_state.RestoreStateData(hass)
+    for idx in range(entities):
+        entity_id = f"sensor.restore_{idx}"
+        data.entities[entity_id] = _Entity(idx)
+        hass.states.async_set(
+            entity_id,
+            "0",
+            {"unit_of_measurement": "W", "friendly_name": f"Restore {idx}"},
+        )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        await data.async_dump_states()
+        cpu_time = 0.0
+        runtime = timer()
+        for dump in range(dumps):
+            for idx in range(dump * changes, (dump + 1) * changes):
+                entity_id = f"sensor.restore_{idx}"
+                data.entities[entity_id].value = dump + 1
+                hass.states.async_set(entity_id, str(dump + 1))
+            start = time.process_time()
+            await data.async_dump_states()
+            cpu_time += time.process_time() - start
+        runtime = timer() - runtime
+
+    print(f"{cpu_time / dumps * 1000:.2f} ms CPU time per dump")
+    return runtime
+
+
+def _subscribe_entities_clients(hass, entity_ids, clients):
+    """Subscribe websocket clients to the entities and return what they are sent."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import RefreshToken, User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.permissions import PolicyPermissions
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api import commands, const
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+
+    hass.data[const.DOMAIN] = {}
+    # The dashboards are opened by 5 users and one of them can't see all entities
+    users = [
+        User(name=f"user{idx}", perm_lookup=None, is_owner=idx > 0) for idx in range(5)
+    ]
+    users[0].permissions = PolicyPermissions(
+        {"entities": {"entity_ids": dict.fromkeys(entity_ids[::2], True)}}, None
+    )
+    sent = []
+    for client in range(clients):
+        user = users[client % len(users)]
+        connection = ActiveConnection(
+            logging.getLogger(__name__),
+            hass,
+            sent.append,
+            user,
+            RefreshToken(user, None, None),
+        )
+        commands.handle_subscribe_entities(
+            hass,
+            connection,
+            {
+                "id": 1,
+                "type": "subscribe_entities",
+                **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA({}),
+            },
+        )
+    sent.clear()
+    return sent
+
+
+@benchmark
+async def subscribe_entities(hass):
+    """Forward 10k state changes to 30 websocket subscribe_entities clients."""
+    clients = 30
+    state_changes = 10**4
+    entity_ids = [f"sensor.power{idx}" for idx in range(100)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0", {"unit_of_measurement": "W"})
+    sent = _subscribe_entities_clients(hass, entity_ids, clients)
+
+    runtime = timer()
+    for idx in range(state_changes):
+        hass.states.async_set(
+            entity_ids[idx % 100], str(idx), {"unit_of_measurement": "W"}
+        )
+    runtime = timer() - runtime
+
+    print(f"{len(sent) / state_changes:.1f} messages per state change")
+    print(f"{runtime / state_changes * 10**6:.1f} µs per state change")
+    return runtime
+
+
+async def _subscribe_entities_bursts(hass, batched):
+    """Forward 50 bursts of 200 state changes to 30 subscribe_entities clients."""
+    clients = 30
+    bursts = 50
+    burst_size = 200
+    entity_ids = [f"sensor.bridge{idx}" for idx in range(burst_size)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0", {"unit_of_measurement": "W"})
+    sent = _subscribe_entities_clients(hass, entity_ids, clients)
+    attributes = {"unit_of_measurement": "W"}
+
+    runtime = timer()
+    for burst in range(bursts):
+        value = str(burst)
+        if batched:
+            hass.states.async_set_many(
+                [(entity_id, value, attributes) for entity_id in entity_ids]
+            )
+            continue
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, value, attributes)
+    runtime = timer() - runtime
+
+    state_changes = bursts * burst_size
+    print(f"{len(sent) / bursts:.0f} messages per burst")
+    print(f"{state_changes / runtime:.0f} states/sec")
+    return runtime
+
+
+@benchmark
+async def subscribe_entities_bursts(hass):
+    """Forward bursts of 200 states written one at a time."""
+    return await _subscribe_entities_bursts(hass, batched=False)
+
+
+@benchmark
+async def subscribe_entities_set_many_bursts(hass):
+    """Forward bursts of 200 states written with async_set_many."""
+    return await _subscribe_entities_bursts(hass, batched=True)
+
+
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match 10k MQTT messages against 10 to 1000 wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, WildcardSubscriptions
+
+    messages = 10**4
+    job = core.HassJob(lambda msg: None)
+    runtime = 0.0
+    for devices in (10, 100, 1000):
+        topic_filters = [
+            *(f"zigbee2mqtt/device{idx}/+" for idx in range(devices // 2)),
+            *(f"tasmota/discovery/+/device{idx}/#" for idx in range(devices // 2)),
+        ]
+        topics = [
+            f"zigbee2mqtt/device{idx % devices}/state"
+            if idx % 2
+            else f"tasmota/discovery/{idx}/device{idx % devices}/config"
+            for idx in range(messages)
+        ]
+
+        # Every wildcard subscription used to have its own matcher
+        matchers = []
+        for topic_filter in topic_filters:
+            matcher = MQTTMatcher()
+            matcher[topic_filter] = True
+            matchers.append(matcher)
+        scan_runtime = timer()
+        for topic in topics:
+            for matcher in matchers:
+                next(matcher.iter_match(topic), False)
+        scan_runtime = timer() - scan_runtime
+
+        subscriptions = WildcardSubscriptions()
+        for topic_filter in topic_filters:
+            subscriptions.add(Subscription(topic_filter, False, job))
+        trie_runtime = timer()
+        for topic in topics:
+            subscriptions.match(topic)
+        trie_runtime = timer() - trie_runtime
+        runtime += trie_runtime
+
+        print(
+            f"{devices} subscriptions: {messages / scan_runtime:.0f} msgs/sec scan, "
+            f"{messages / trie_runtime:.0f} msgs/sec trie"
+        )
+    return runtime
+
+
+@benchmark
+async def add_discovered_entities(hass):
+    """Add 3000 entities one by one and at once like a burst of discoveries."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        device_registry as dr,
+        entity_platform,
+        entity_registry as er,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity import Entity
+
+    logging.getLogger("homeassistant.helpers.entity_registry").setLevel(logging.WARNING)
+    entities_to_add = 3000
+    runtime = 0.0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        for batched in (False, True):
+            platform = entity_platform.EntityPlatform(
+                hass=hass,
+                logger=logging.getLogger(__name__),
+                domain="sensor",
+                platform_name="batched" if batched else "one_by_one",
+                platform=None,
+                scan_interval=timedelta(seconds=30),
+                entity_namespace=None,
+            )
+            entities = []
+            for idx in range(entities_to_add):
+                entity = Entity()
+                entity._attr_name = f"Power {idx}"  # noqa: SLF001
+                entity._attr_should_poll = False  # noqa: SLF001
+                entity._attr_unique_id = f"{platform.platform_name}_{idx}"  # noqa: SLF001
+                entities.append(entity)
+
+            start = timer()
+            if batched:
+                await platform.async_add_entities(entities)
+            else:
+                await asyncio.gather(
+                    *(platform.async_add_entities([entity]) for entity in entities)
+                )
+            runtime = timer() - start
+            print(
+                f"{'at once' if batched else 'one by one'}: "
+                f"{entities_to_add / runtime:.0f} entities/sec"
+            )
+        await hass.async_stop(force=True)
+    return runtime
+
+
+BOOTSTRAP_CONFIG: dict[str, Any] = {
+    "automation": [],
+    "counter": {},
+    "group": {},
+    "input_boolean": {},
+    "input_button": {},
+    "input_datetime": {},
+    "input_number": {},
+    "input_select": {},
+    "input_text": {},
+    "scene": [],
+    "schedule": {},
+    "script": {},
+    "sun": {},
+    "template": [],
+    "timer": {},
+    "zone": {},
+}
+
+
+@benchmark
+async def bootstrap_stages(hass):
+    """Bootstrap Home Assistant and report the time spent in each stage.
+
+    The setups on the critical path of the startup are reported as well.
+
+    The config dir is kept between the runs so the first run starts
+    cold and the following runs use the manifest index it stored.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import bootstrap, loader
+
+    config_dir = os.path.join(tempfile.gettempdir(), "hass-benchmark-bootstrap")
+    os.makedirs(config_dir, exist_ok=True)
+    hass.config.config_dir = config_dir
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+
+    timings: dict[str, float] = {}
+
+    def _timed(name, func):
+        async def _wrapper(*args, **kwargs):
+            start = timer()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                timings[name] = timer() - start
+
+        return _wrapper
+
+    wrapped = {
+        "async_load_base_functionality": "base functionality",
+        "_async_resolve_domains_to_setup": "resolve integrations",
+        "_async_set_up_integrations": "set up integrations (incl. resolving)",
+    }
+    originals = {attr: getattr(bootstrap, attr) for attr in wrapped}
+    for attr, name in wrapped.items():
+        setattr(bootstrap, attr, _timed(name, originals[attr]))
+    start = timer()
+    try:
+        await bootstrap.async_from_config_dict(
+            {"homeassistant": {}, **BOOTSTRAP_CONFIG}, hass
+        )
+    finally:
+        for attr, func in originals.items():
+            setattr(bootstrap, attr, func)
+    runtime = timer() - start
+
+    for stage, stage_runtime in timings.items():
+        print(f"{stage}: {stage_runtime:.3f}s")
+    print("critical path:")
+    for step in hass.data[bootstrap.DATA_SETUP_CRITICAL_PATH]:
+        print(
+            f"  {step.domain}: waited {step.wait_time:.3f}s, ran {step.run_time:.3f}s"
+        )
+    if index := hass.data.get(loader.DATA_MANIFEST_INDEX):
+        print(f"manifest index: {index.hits} hits, {index.misses} misses")
+    await hass.async_stop(force=True)
+    return runtime
+
+
+@benchmark
+async def prometheus_scrape(hass):
+    """Scrape the Prometheus metrics of 1k to 12k sensors with 1% of them changing."""
+    # pylint: disable-next=import-outside-toplevel
+    import prometheus_client
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.prometheus import PrometheusMetrics
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity_values import EntityValues
+
+    scrapes = 20
+    runtime = timer()
+    for entities in (1000, 4000, 12000):
+        metrics = PrometheusMetrics(
+            lambda entity_id: True,
+            "homeassistant",
+            hass.config.units.temperature_unit,
+            EntityValues({}, {}, {}),
+            None,
+            None,
+        )
+        states = [
+            core.State(
+                f"sensor.scrape_{idx}",
+                "0",
+                {
+                    "unit_of_measurement": "W",
+                    "friendly_name": f"Scrape {idx}",
+                    "battery_level": 50,
+                },
+            )
+            for idx in range(entities)
+        ]
+        for state in states:
+            metrics.handle_state(state)
+        registry = prometheus_client.CollectorRegistry(auto_describe=True)
+        for metric in metrics._metrics.values():  # noqa: SLF001
+            registry.register(metric)
+        metrics.exposition.generate_latest()
+
+        timings = {"registry": 0.0, "exposition": 0.0}
+        for scrape in range(scrapes):
+            for state in states[::100]:
+                metrics.handle_state(
+                    core.State(state.entity_id, str(scrape + 1), state.attributes)
+                )
+            start = timer()
+            prometheus_client.generate_latest(registry)
+            timings["registry"] += timer() - start
+            start = timer()
+            metrics.exposition.generate_latest()
+            timings["exposition"] += timer() - start
+
+        print(
+            f"{entities} entities: "
+            + ", ".join(
+                f"{name} {timing / scrapes * 1000:.2f} ms"
+                for name, timing in timings.items()
+            )
+            + " per scrape"
+        )
+    return timer() - runtime
+
+
+@benchmark
+async def influxdb_export(hass):
+    """Export 50k state changes of 1k sensors to a stub InfluxDB server."""
+    # pylint: disable-next=import-outside-toplevel
+    from aiohttp import web
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import influxdb
+
+    events = 50000
+    received = 0
+    requests = 0
+    done = asyncio.Event()
+
+    async def _write(request):
+        nonlocal received, requests
+        received += (await request.read()).count(b"\n")
+        requests += 1
+        if received >= events:
+            done.set()
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_post("/write", _write)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    conf = influxdb.INFLUX_SCHEMA({"host": "127.0.0.1", "port": runner.addresses[0][1]})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        influx = await hass.async_add_executor_job(influxdb.get_influx_connection, conf)
+        thread = await hass.async_add_executor_job(
+            influxdb.InfluxThread,
+            hass,
+            influx,
+            influxdb._generate_event_to_line(conf),  # noqa: SLF001
+            0,
+        )
+        thread.start()
+        start = timer()
+        for idx in range(events):
+            hass.states.async_set(
+                f"sensor.influx_{idx % 1000}",
+                str(idx),
+                {"unit_of_measurement": "W", "friendly_name": f"Influx {idx % 1000}"},
+            )
+        await done.wait()
+        runtime = timer() - start
+        thread.queue.put(None)
+        await hass.async_add_executor_job(thread.join)
+        influx.close()
+
+    await runner.cleanup()
+    print(f"{events / runtime:.0f} events/s written in {requests} requests")
+    return runtime
+
+
+@benchmark
+async def conversation_recognize_after_churn(hass):
+    """Recognize a command after each of 50 entity changes with 8k exposed lights."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import bootstrap, config_entries, loader
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.conversation import ConversationInput, default_agent
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.setup import async_setup_component
+
+    entities = 8000
+    changes = 50
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        await async_setup_component(hass, "homeassistant", {})
+        for idx in range(entities):
+            hass.states.async_set(
+                f"light.churn_{idx}", "off", {"friendly_name": f"Churn {idx}"}
+            )
+        agent = default_agent.DefaultAgent(hass, {})
+
+        def _command(text):
+            return ConversationInput(
+                text=text,
+                context=core.Context(),
+                conversation_id=None,
+                device_id=None,
+                language="en",
+                agent_id=None,
+            )
+
+        start = timer()
+        await agent.async_recognize_intent(_command("turn on churn 1"))
+        print(f"first command: {(timer() - start) * 1000:.1f} ms")
+
+        runtime = timer()
+        timings = {"changed entity": 0.0, "other entity": 0.0}
+        for change in range(changes):
+            hass.states.async_remove(f"light.churn_{change}")
+            hass.states.async_set(
+                f"light.churn_new_{change}",
+                "off",
+                {"friendly_name": f"Churn new {change}"},
+            )
+            start = timer()
+            await agent.async_recognize_intent(_command(f"turn on churn new {change}"))
+            timings["changed entity"] += timer() - start
+            start = timer()
+            await agent.async_recognize_intent(_command("turn on churn 7999"))
+            timings["other entity"] += timer() - start
+        runtime = timer() - runtime
+
+        print(
+            ", ".join(
+                f"{name} {timing / changes * 1000:.1f} ms"
+                for name, timing in timings.items()
+            )
+            + " per command after a change"
+        )
+        await hass.async_stop(force=True)
+    return runtime
+
+
+@benchmark
+async def backup_create(hass):
+    """Back up a synthetic config dir with a 256MB database twice.
+
+    The database grows and a few of its pages change between the backups,
+    like they do between two nightly backups. The backups are written with
+    securetar and with the parallel compression, which copies the unchanged
+    compressed chunks of the first backup.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ThreadPoolExecutor
+
+    # pylint: disable-next=import-outside-toplevel
+    from pathlib import Path
+
+    # pylint: disable-next=import-outside-toplevel
+    import random
+
+    # pylint: disable-next=import-outside-toplevel
+    from securetar import SecureTarFile, atomic_contents_add
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.backup.const import MAX_COMPRESS_WORKERS
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.backup.util import CompressedChunks, InnerTarFile
+
+    def _database_rows(idx):
+        rows = b"".join(
+            f"{idx}:{row}|sensor.power_{row % 97}|{random.random():.3f}\n".encode()
+            for row in range(26000)
+        )
+        return rows.ljust(2**20, b"\0")[: 2**20]
+
+    def _write_config_dir(config_dir):
+        (config_dir / ".storage").mkdir(parents=True)
+        for idx in range(500):
+            (config_dir / ".storage" / f"file_{idx}.json").write_bytes(
+                JSON_DUMP({"version": 1, "data": {"idx": idx}}).encode()
+            )
+        with (config_dir / "home-assistant_v2.db").open("wb") as file:
+            for idx in range(256):
+                file.write(_database_rows(idx))
+
+    def _change_database(config_dir):
+        with (config_dir / "home-assistant_v2.db").open("r+b") as file:
+            for _ in range(8):
+                file.seek(random.randrange(2**16) * 4096)
+                file.write(os.urandom(4096))
+            file.seek(0, os.SEEK_END)
+            for idx in range(4):
+                file.write(_database_rows(256 + idx))
+
+    def _securetar_backup(config_dir, path):
+        outer_secure_tarfile = SecureTarFile(path, "w", gzip=False)
+        with (
+            outer_secure_tarfile,
+            outer_secure_tarfile.create_inner_tar(
+                "./homeassistant.tar.gz", gzip=True
+            ) as core_tar,
+        ):
+            atomic_contents_add(core_tar, config_dir, [], "data")
+
+    def _parallel_backup(config_dir, path, executor, previous_chunks):
+        with SecureTarFile(path, "w", gzip=False) as outer_tar:
+            inner_tar = InnerTarFile(
+                outer_tar,
+                "./homeassistant.tar.gz",
+                executor=executor,
+                previous_chunks=previous_chunks,
+            )
+            with inner_tar as core_tar:
+                atomic_contents_add(core_tar, config_dir, [], "data")
+        stat = path.stat()
+        return CompressedChunks(path, stat.st_size, stat.st_mtime_ns, inner_tar.chunks)
+
+    def _run(tmp_dir):
+        config_dir = tmp_dir / "config"
+        _write_config_dir(config_dir)
+        executor = ThreadPoolExecutor(
+            max_workers=min(MAX_COMPRESS_WORKERS, os.cpu_count() or 1)
+        )
+        previous_chunks = None
+        runtime = 0.0
+        for backup in ("first", "second"):
+            path = tmp_dir / f"securetar_{backup}.tar"
+            start = timer()
+            _securetar_backup(config_dir, path)
+            print(
+                f"securetar {backup} backup: {timer() - start:.2f}s, "
+                f"{path.stat().st_size / 2**20:.1f}MB"
+            )
+
+            path = tmp_dir / f"parallel_{backup}.tar"
+            start = timer()
+            previous_chunks = _parallel_backup(
+                config_dir, path, executor, previous_chunks
+            )
+            runtime = timer() - start
+            print(
+                f"parallel {backup} backup: {runtime:.2f}s, "
+                f"{path.stat().st_size / 2**20:.1f}MB"
+            )
+            _change_database(config_dir)
+        executor.shutdown()
+        return runtime
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        return await hass.async_add_executor_job(_run, Path(tmp_dir))
@@ -74,6 +74,14 @@ DATA_SETUP_TIME: HassKey[
 
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
+# DATA_DEPS_REQS_WAITERS is a dict of futures, indicating domains for which
+# something waits until their dependencies and requirements are processed:
+# - Futures are added by async_get_deps_reqs_processed_future.
+# - Futures are set and removed by async_process_deps_reqs.
+DATA_DEPS_REQS_WAITERS: HassKey[dict[str, asyncio.Future[None]]] = HassKey(
+    "deps_reqs_waiters"
+)
+
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
     "bootstrap_persistent_errors"
 )
@@ -577,6 +585,29 @@ async def async_process_deps_reqs(
         )
 
     processed.add(integration.domain)
+    if (waiters := hass.data.get(DATA_DEPS_REQS_WAITERS)) and (
+        future := waiters.pop(integration.domain, None)
+    ):
+        future.set_result(None)
+
+
+@core.callback
+def async_get_deps_reqs_processed_future(
+    hass: core.HomeAssistant, domain: str
+) -> asyncio.Future[None]:
+    """Return a future that is done once the deps and reqs of a domain are processed.
+
+    The future is never done if the setup of the domain fails before
+    its dependencies and requirements are processed.
+    """
+    if domain in hass.data.get(DATA_DEPS_REQS, ()):
+        processed = hass.loop.create_future()
+        processed.set_result(None)
+        return processed
+    waiters = hass.data.setdefault(DATA_DEPS_REQS_WAITERS, {})
+    if (future := waiters.get(domain)) is None:
+        future = waiters[domain] = hass.loop.create_future()
+    return future
 
 
 @core.callback
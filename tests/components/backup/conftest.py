@@ -25,8 +25,17 @@ def mocked_json_bytes_fixture() -> Generator[Mock]:
         yield mocked_json_bytes
 
 
+@pytest.fixture(name="mocked_inner_tarfile")
+def mocked_inner_tarfile_fixture() -> Generator[Mock]:
+    """Mock inner tarfile."""
+    with patch(
+        "homeassistant.components.backup.manager.InnerTarFile"
+    ) as mocked_inner_tarfile:
+        yield mocked_inner_tarfile
+
+
 @pytest.fixture(name="mocked_tarfile")
-def mocked_tarfile_fixture() -> Generator[Mock]:
+def mocked_tarfile_fixture(mocked_inner_tarfile: Mock) -> Generator[Mock]:
     """Mock tarfile."""
     with patch(
         "homeassistant.components.backup.manager.SecureTarFile"
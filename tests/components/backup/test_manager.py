@@ -217,6 +217,7 @@ async def test_async_initiate_backup(
     caplog: pytest.LogCaptureFixture,
     mocked_json_bytes: Mock,
     mocked_tarfile: Mock,
+    mocked_inner_tarfile: Mock,
     generate_backup_id: MagicMock,
     path_glob: MagicMock,
     params: dict[str, Any],
@@ -370,8 +371,13 @@ async def test_async_initiate_backup(
         assert agent_backup.protected == backup.protected
         assert agent_backup.size == backup.size
 
-    outer_tar = mocked_tarfile.return_value
-    core_tar = outer_tar.create_inner_tar.return_value.__enter__.return_value
+    if password is None:
+        core_tar = mocked_inner_tarfile.return_value.__enter__.return_value
+    else:
+        # Encrypted backups are written by securetar
+        mocked_inner_tarfile.assert_not_called()
+        outer_tar = mocked_tarfile.return_value
+        core_tar = outer_tar.create_inner_tar.return_value.__enter__.return_value
     expected_files = [call(hass.config.path(), arcname="data", recursive=False)] + [
         call(file, arcname=f"data/{file}", recursive=False)
         for file in _EXPECTED_FILES_WITH_DATABASE[include_database]
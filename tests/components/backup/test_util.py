@@ -0,0 +1,131 @@
+"""Tests for the Backup integration's utility functions."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import io
+from pathlib import Path
+import tarfile
+from unittest.mock import patch
+
+import pytest
+from securetar import SecureTarFile, atomic_contents_add
+
+from homeassistant.components.backup import util
+from homeassistant.components.backup.util import CompressedChunks, InnerTarFile
+
+
+@pytest.fixture(name="executor")
+def executor_fixture() -> Generator[ThreadPoolExecutor]:
+    """Return an executor to compress the chunks."""
+    executor = ThreadPoolExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+def _write_backup(
+    config_dir: Path,
+    backup_path: Path,
+    executor: ThreadPoolExecutor,
+    previous_chunks: CompressedChunks | None = None,
+) -> CompressedChunks:
+    """Write a backup of the config dir and return its compressed chunks."""
+    with SecureTarFile(backup_path, "w", gzip=False) as outer_tar:
+        tar_info = tarfile.TarInfo(name="./backup.json")
+        tar_info.size = 2
+        outer_tar.addfile(tar_info, fileobj=io.BytesIO(b"{}"))
+        inner_tar = InnerTarFile(
+            outer_tar,
+            "./homeassistant.tar.gz",
+            executor=executor,
+            previous_chunks=previous_chunks,
+        )
+        with inner_tar as core_tar:
+            atomic_contents_add(core_tar, config_dir, [], "data")
+
+    assert inner_tar.chunks is not None
+    stat = backup_path.stat()
+    return CompressedChunks(
+        backup_path, stat.st_size, stat.st_mtime_ns, inner_tar.chunks
+    )
+
+
+def _read_backup(backup_path: Path, extract_path: Path) -> None:
+    """Extract a backup the same way it is restored."""
+    with SecureTarFile(backup_path, "r", gzip=False) as outer_tar:
+        outer_tar.extractall(path=extract_path, filter="fully_trusted")
+    with SecureTarFile(
+        extract_path / "homeassistant.tar.gz", "r", gzip=True
+    ) as core_tar:
+        core_tar.extractall(path=extract_path / "homeassistant", filter="fully_trusted")
+
+
+@pytest.fixture(name="config_dir")
+def config_dir_fixture(tmp_path: Path) -> Path:
+    """Return a config dir with small files and a large database."""
+    config_dir = tmp_path / "config"
+    (config_dir / ".storage").mkdir(parents=True)
+    (config_dir / ".storage" / "core.config").write_text('{"version": 1}')
+    (config_dir / "configuration.yaml").write_text("default_config:\n")
+    (config_dir / "home-assistant_v2.db").write_bytes(
+        b"".join(f"row {idx} of the database\n".encode() for idx in range(200000))
+    )
+    return config_dir
+
+
+def test_inner_tar_file(
+    tmp_path: Path, config_dir: Path, executor: ThreadPoolExecutor
+) -> None:
+    """Test the inner tar file is restored like one written by securetar."""
+    _write_backup(config_dir, tmp_path / "backup.tar", executor)
+
+    _read_backup(tmp_path / "backup.tar", tmp_path / "extracted")
+    for path in (
+        Path(".storage", "core.config"),
+        Path("configuration.yaml"),
+        Path("home-assistant_v2.db"),
+    ):
+        assert (
+            tmp_path / "extracted" / "homeassistant" / "data" / path
+        ).read_bytes() == (config_dir / path).read_bytes()
+    # The chunks make up a single gzip member with a valid trailer
+    gzip.decompress((tmp_path / "extracted" / "homeassistant.tar.gz").read_bytes())
+
+
+def test_inner_tar_file_copies_unchanged_chunks(
+    tmp_path: Path, config_dir: Path, executor: ThreadPoolExecutor
+) -> None:
+    """Test the unchanged compressed chunks of the previous backup are copied."""
+    with patch.object(
+        util, "_compress_chunk", wraps=util._compress_chunk
+    ) as compress_chunk_mock:
+        first_chunks = _write_backup(config_dir, tmp_path / "first.tar", executor)
+        first_compressed = compress_chunk_mock.call_count
+        assert first_compressed > 2
+
+        # Changing a small file before the database keeps its chunks
+        (config_dir / ".storage" / "core.config").write_text('{"version": 2}')
+        compress_chunk_mock.reset_mock()
+        _write_backup(
+            config_dir, tmp_path / "second.tar", executor, previous_chunks=first_chunks
+        )
+        # Only the chunk with the changed file and the chunk after it, which
+        # uses the changed file as dictionary, are compressed again
+        assert 1 <= compress_chunk_mock.call_count <= 2
+
+        # The chunks are not copied once the previous backup changed
+        (tmp_path / "first.tar").write_bytes(b"")
+        compress_chunk_mock.reset_mock()
+        _write_backup(
+            config_dir, tmp_path / "third.tar", executor, previous_chunks=first_chunks
+        )
+        assert compress_chunk_mock.call_count == first_compressed
+
+    _read_backup(tmp_path / "second.tar", tmp_path / "second")
+    data_path = tmp_path / "second" / "homeassistant" / "data"
+    assert (data_path / ".storage" / "core.config").read_text() == '{"version": 2}'
+    assert (data_path / "home-assistant_v2.db").read_bytes() == (
+        config_dir / "home-assistant_v2.db"
+    ).read_bytes()
@@ -2907,10 +2907,18 @@ async def test_intent_cache_all_entities(hass: HomeAssistant) -> None:
     assert result is not None
     assert getattr(result, mark, None) is True
 
-    # Adding a new entity clears the cache
+    # Adding an entity with a name that is not in the text keeps the cache
     hass.states.async_set("light.new_light", "off")
     result = await agent.async_recognize_intent(user_input)
     assert result is not None
+    assert getattr(result, mark, None) is True
+
+    # Adding an entity with a name that is in the text clears the cache
+    hass.states.async_set(
+        "light.test_light_2", "off", attributes={ATTR_FRIENDLY_NAME: "Test Light"}
+    )
+    result = await agent.async_recognize_intent(user_input)
+    assert result is not None
     assert getattr(result, mark, None) is None
 
 
@@ -2943,6 +2951,156 @@ async def test_intent_cache_fuzzy(hass: HomeAssistant) -> None:
     assert getattr(result, mark, None) is True
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_intent_cache_changed_entity_names(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test that only the cached results with changed entity names are removed."""
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    assert isinstance(agent, default_agent.DefaultAgent)
+
+    kitchen_light = entity_registry.async_get_or_create("light", "demo", "1234")
+    hass.states.async_set(
+        kitchen_light.entity_id, "off", attributes={ATTR_FRIENDLY_NAME: "kitchen light"}
+    )
+    hass.states.async_set(
+        "light.bedroom_light", "off", attributes={ATTR_FRIENDLY_NAME: "bedroom light"}
+    )
+    await hass.async_block_till_done()
+
+    def _user_input(text: str) -> ConversationInput:
+        return ConversationInput(
+            text=text,
+            context=Context(),
+            conversation_id=None,
+            device_id=None,
+            language=hass.config.language,
+            agent_id=None,
+        )
+
+    mark = "_from_cache"
+    for text in ("turn on kitchen light", "turn on bedroom light"):
+        result = await agent.async_recognize_intent(_user_input(text))
+        assert result is not None
+        assert result.entities["name"].text == text.removeprefix("turn on ")
+        setattr(result, mark, True)
+
+    # Adding an alias only removes the results with the names of the entity
+    entity_registry.async_update_entity(kitchen_light.entity_id, aliases={"stove"})
+    await hass.async_block_till_done()
+
+    result = await agent.async_recognize_intent(_user_input("turn on kitchen light"))
+    assert result is not None
+    assert result.entities["name"].text == "kitchen light"
+    assert getattr(result, mark, None) is None
+
+    result = await agent.async_recognize_intent(_user_input("turn on bedroom light"))
+    assert result is not None
+    assert getattr(result, mark, None) is True
+
+    result = await agent.async_recognize_intent(_user_input("turn on stove"))
+    assert result is not None
+    assert result.entities["name"].text == "stove"
+    assert result.entities["name"].value == "stove"
+
+    # The names of a removed entity are no longer matched
+    hass.states.async_remove("light.bedroom_light")
+    await hass.async_block_till_done()
+
+    result = await agent.async_recognize_intent(_user_input("turn on bedroom light"))
+    assert result is not None
+    assert "name" not in result.entities
+    assert agent._exposed_names_trie is not None
+    assert not list(agent._exposed_names_trie.find("bedroom light"))
+
+    result = await agent.async_recognize_intent(_user_input("turn on stove"))
+    assert result is not None
+    assert result.entities["name"].text == "stove"
+
+
+@pytest.mark.usefixtures("init_components")
+async def test_unexposed_names_trie_replaced(hass: HomeAssistant) -> None:
+    """Test that the unexposed names trie is replaced instead of updated."""
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    assert isinstance(agent, default_agent.DefaultAgent)
+
+    hass.states.async_set(
+        "light.hidden_light", "off", attributes={ATTR_FRIENDLY_NAME: "hidden light"}
+    )
+    expose_entity(hass, "light.hidden_light", False)
+    await hass.async_block_till_done()
+
+    user_input = ConversationInput(
+        text="turn on secret light",
+        context=Context(),
+        conversation_id=None,
+        device_id=None,
+        language=hass.config.language,
+        agent_id=None,
+    )
+    await agent.async_recognize_intent(user_input)
+
+    slot_list = await hass.async_add_executor_job(
+        agent._get_unexposed_entity_names, "turn on hidden light"
+    )
+    assert [value.text_in.text for value in slot_list.values] == ["hidden light"]
+    unexposed_names_trie = agent._unexposed_names_trie
+    assert unexposed_names_trie is not None
+
+    # Readding the entity with a new name drops the trie, which may still be
+    # read in the executor, instead of removing the old name from it
+    hass.states.async_remove("light.hidden_light")
+    hass.states.async_set(
+        "light.hidden_light", "off", attributes={ATTR_FRIENDLY_NAME: "secret light"}
+    )
+    await hass.async_block_till_done()
+    await agent.async_recognize_intent(user_input)
+
+    assert agent._unexposed_names_trie is not unexposed_names_trie
+    assert list(unexposed_names_trie.find("hidden light"))
+
+    slot_list = await hass.async_add_executor_job(
+        agent._get_unexposed_entity_names, "turn on secret light"
+    )
+    assert [value.text_in.text for value in slot_list.values] == ["secret light"]
+    slot_list = await hass.async_add_executor_job(
+        agent._get_unexposed_entity_names, "turn on hidden light"
+    )
+    assert not slot_list.values
+
+
+@pytest.mark.usefixtures("init_components")
+async def test_intent_cache_area_changed(
+    hass: HomeAssistant, area_registry: ar.AreaRegistry
+) -> None:
+    """Test that changing an area updates the area slot list and clears the cache."""
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    assert isinstance(agent, default_agent.DefaultAgent)
+
+    user_input = ConversationInput(
+        text="turn on the lights in the attic",
+        context=Context(),
+        conversation_id=None,
+        device_id=None,
+        language=hass.config.language,
+        agent_id=None,
+    )
+    result = await agent.async_recognize_intent(user_input)
+    assert result is not None
+    assert "area" not in result.entities
+
+    mark = "_from_cache"
+    setattr(result, mark, True)
+
+    area_registry.async_create("attic")
+    await hass.async_block_till_done()
+
+    result = await agent.async_recognize_intent(user_input)
+    assert result is not None
+    assert getattr(result, mark, None) is None
+    assert result.entities["area"].value == "attic"
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_entities_filtered_by_input(hass: HomeAssistant) -> None:
     """Test that entities are filtered by the input text before intent matching."""
@@ -0,0 +1,241 @@
+"""The tests for the history query coalescer."""
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components.history.const import DATA_HISTORY_COALESCER
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.components.recorder.common import async_wait_recording_done
+
+
+def _build(states: dict[str, list[dict[str, Any]]], end_time: Any) -> Any:
+    """Return the states as the response."""
+    return states
+
+
+@pytest.mark.parametrize(
+    ("minimal_response", "significant_changes_only"),
+    [(False, True), (True, True), (True, False)],
+)
+async def test_coalesce_history_queries(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    minimal_response: bool,
+    significant_changes_only: bool,
+) -> None:
+    """Test concurrent history requests share one query with the same result."""
+    assert await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    for minute in range(4):
+        with freeze_time(start + timedelta(minutes=minute + 1)):
+            hass.states.async_set("sensor.a", str(minute), {"unit": "W"})
+            hass.states.async_set("sensor.b", "on" if minute % 2 else "off")
+            hass.states.async_set("light.c", "on", {"brightness": minute})
+            hass.states.async_set("climate.d", "heat", {"temperature": minute})
+        await async_wait_recording_done(hass)
+
+    start_time = start + timedelta(minutes=1, seconds=30)
+    end_time = start + timedelta(minutes=10)
+    entity_ids_by_request = [
+        ["sensor.a", "sensor.b"],
+        ["sensor.b", "light.c"],
+        ["light.c"],
+        ["climate.d", "sensor.a", "sensor.b", "light.c"],
+        # Only one of the entities is recorded
+        ["sensor.a", "sensor.missing"],
+    ]
+    coalescer = hass.data[DATA_HISTORY_COALESCER]
+
+    with patch.object(
+        history,
+        "get_significant_states_with_session",
+        wraps=history.get_significant_states_with_session,
+    ) as get_significant_states_mock:
+        results = await asyncio.gather(
+            *(
+                coalescer.async_get_significant_states(
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    True,
+                    significant_changes_only,
+                    minimal_response,
+                    False,
+                    _build,
+                )
+                for entity_ids in entity_ids_by_request
+            )
+        )
+
+    # The requests for multiple recorded entities are merged
+    assert get_significant_states_mock.call_count == 3
+    assert coalescer.requests == 5
+    assert coalescer.queries == 3
+
+    def _get_expected() -> list[dict[str, list[dict[str, Any]]]]:
+        return [
+            history.get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                True,
+                significant_changes_only,
+                minimal_response,
+                False,
+                True,
+            )
+            for entity_ids in entity_ids_by_request
+        ]
+
+    expected = await recorder_mock.async_add_executor_job(_get_expected)
+    assert results == expected
+    assert [list(result) for result in results] == [list(result) for result in expected]
+
+
+async def test_coalesce_history_queries_until_now(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test requests without an end time get the end time of the query."""
+    assert await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.a", "1")
+    await async_wait_recording_done(hass)
+    coalescer = hass.data[DATA_HISTORY_COALESCER]
+    start_time = dt_util.utcnow() - timedelta(hours=1)
+
+    def _end_time(states: dict[str, list[dict[str, Any]]], end_time: Any) -> Any:
+        return end_time
+
+    before = dt_util.utcnow()
+    end_times = await asyncio.gather(
+        *(
+            coalescer.async_get_significant_states(
+                start_time, None, ["sensor.a"], True, True, False, False, _end_time
+            )
+            for _ in range(3)
+        )
+    )
+    assert end_times[0] >= before
+    assert end_times == [end_times[0]] * 3
+    assert coalescer.requests == 3
+    assert coalescer.queries == 3
+
+
+async def test_coalesce_history_queries_error(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test an error building one response does not fail the other requests."""
+    assert await async_setup_component(hass, "history", {})
+    coalescer = hass.data[DATA_HISTORY_COALESCER]
+    start_time = dt_util.utcnow() - timedelta(hours=1)
+
+    def _fail(states: dict[str, list[dict[str, Any]]], end_time: Any) -> Any:
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        coalescer.async_get_significant_states(
+            start_time, None, ["sensor.a"], True, True, False, False, _fail
+        ),
+        coalescer.async_get_significant_states(
+            start_time, None, ["sensor.a"], True, True, False, False, _build
+        ),
+        return_exceptions=True,
+    )
+    assert isinstance(results[0], ValueError)
+    assert results[1] == {}
+
+
+async def test_coalesce_history_queries_close_start_times(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test requests with close start times share the query of the widest window."""
+    assert await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    for minute in range(3):
+        with freeze_time(start + timedelta(minutes=minute + 1)):
+            hass.states.async_set("sensor.a", str(minute))
+            hass.states.async_set("sensor.b", str(minute))
+        await async_wait_recording_done(hass)
+
+    start_time = start + timedelta(minutes=1, seconds=30)
+    end_time = start + timedelta(minutes=10)
+    start_times = [
+        start_time + timedelta(milliseconds=200),
+        start_time,
+        # Too far apart to join the query
+        start_time + timedelta(seconds=2),
+    ]
+    coalescer = hass.data[DATA_HISTORY_COALESCER]
+
+    with caplog.at_level(logging.DEBUG, logger="homeassistant.components.history"):
+        results = await asyncio.gather(
+            *(
+                coalescer.async_get_significant_states(
+                    request_start_time,
+                    end_time,
+                    ["sensor.a", "sensor.b"],
+                    True,
+                    True,
+                    False,
+                    False,
+                    _build,
+                )
+                for request_start_time in start_times
+            )
+        )
+        # Requests without the start time state only join the same window
+        await asyncio.gather(
+            *(
+                coalescer.async_get_significant_states(
+                    request_start_time,
+                    end_time,
+                    ["sensor.a", "sensor.b"],
+                    False,
+                    True,
+                    False,
+                    False,
+                    _build,
+                )
+                for request_start_time in start_times[:2]
+            )
+        )
+
+    assert coalescer.requests == 5
+    assert coalescer.queries == 4
+    assert "Served 2 history requests with 1 queries" in caplog.text
+    assert "5 requests with 4 queries in total" in caplog.text
+
+    def _get_expected(request_start_time: datetime) -> dict[str, list[Any]]:
+        return history.get_significant_states(
+            hass,
+            request_start_time,
+            end_time,
+            ["sensor.a", "sensor.b"],
+            None,
+            True,
+            True,
+            False,
+            False,
+            True,
+        )
+
+    assert results[0] == results[1]
+    assert results[1] == await recorder_mock.async_add_executor_job(
+        _get_expected, start_time
+    )
+    assert results[2] == await recorder_mock.async_add_executor_job(
+        _get_expected, start_times[2]
+    )
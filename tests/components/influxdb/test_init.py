@@ -5,8 +5,11 @@ from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
 import logging
+from pathlib import Path
+from typing import Any
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+from influxdb.line_protocol import make_line
 import pytest
 
 from homeassistant.components import influxdb
@@ -34,6 +37,41 @@ async def async_wait_for_queue_to_process(hass: HomeAssistant) -> None:
     await hass.async_add_executor_job(hass.data[influxdb.DOMAIN].block_till_done)
 
 
+class LineProtocol:
+    """Match the lines written to Influx with the points of a body.
+
+    The points are encoded by the influxdb library, their time is not compared.
+    """
+
+    def __init__(self, body: list[dict[str, Any]]) -> None:
+        """Encode the points of the body."""
+        self.lines = [
+            make_line(
+                point["measurement"],
+                point["tags"],
+                # The values of the fields are always written as floats
+                {
+                    key: float(value) if isinstance(value, int) else value
+                    for key, value in point["fields"].items()
+                },
+            )
+            for point in body
+        ]
+
+    def __eq__(self, other: object) -> bool:
+        """Return if the lines match the points."""
+        if not isinstance(other, list):
+            return NotImplemented
+        lines = [line.rpartition(" ") for line in other]
+        return [line for line, _, _ in lines] == self.lines and all(
+            timestamp.isdigit() for _, _, timestamp in lines
+        )
+
+    def __repr__(self) -> str:
+        """Return the expected lines."""
+        return repr(self.lines)
+
+
 @dataclass
 class FilterTest:
     """Class for capturing a filter test."""
@@ -51,6 +89,12 @@ def mock_batch_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Keep the spool of unwritten events in a temporary directory."""
+    hass.config.config_dir = str(tmp_path)
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture(
     request: pytest.FixtureRequest,
@@ -70,7 +114,7 @@ def get_mock_call_fixture(request: pytest.FixtureRequest):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": LineProtocol(body)}
 
         if precision is not None:
             data["write_precision"] = precision
@@ -79,7 +123,9 @@ def get_mock_call_fixture(request: pytest.FixtureRequest):
 
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: call(
+        LineProtocol(body), time_precision=precision, protocol="line"
+    )
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1362,13 +1408,27 @@ async def test_event_listener_ignore_attributes_overlapping_entities(
 async def test_event_listener_scheduled_write(
     hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
 ) -> None:
-    """Test the event listener retries after a write failure."""
+    """Test the event listener retries after a write failure.
+
+    The event is spooled after the last retry and written once writing
+    works again.
+    """
     config = {"max_retries": 1}
     config.update(config_ext)
     await _setup(hass, mock_client, config, get_write_api)
     write_api = get_write_api(mock_client)
     write_api.side_effect = OSError("foo")
 
+    def _body(value: float) -> list[dict[str, Any]]:
+        return [
+            {
+                "measurement": "entity.entity_id",
+                "tags": {"domain": "entity", "entity_id": "entity_id"},
+                "time": ANY,
+                "fields": {"value": value},
+            }
+        ]
+
     # Write fails
     with patch.object(influxdb.time, "sleep") as mock_sleep:
         hass.states.async_set("entity.entity_id", 1)
@@ -1376,6 +1436,8 @@ async def test_event_listener_scheduled_write(
         await async_wait_for_queue_to_process(hass)
         assert mock_sleep.called
     assert write_api.call_count == 2
+    spool_path = hass.config.path(".storage", influxdb.SPOOL_FILE)
+    assert Path(spool_path).exists()
 
     # Write works again
     write_api.side_effect = None
@@ -1384,7 +1446,156 @@ async def test_event_listener_scheduled_write(
         await hass.async_block_till_done()
         await async_wait_for_queue_to_process(hass)
         assert not mock_sleep.called
-    assert write_api.call_count == 3
+    assert write_api.call_count == 4
+    assert write_api.call_args_list[2] == get_mock_call(_body(2))
+    assert write_api.call_args_list[3] == get_mock_call(_body(1))
+    assert not Path(spool_path).exists()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_escaping(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
+) -> None:
+    """Test the special characters of the line protocol are escaped."""
+    config = {"tags_attributes": ["tag, =\\"], "override_measurement": "a b,c=d"}
+    config.update(config_ext)
+    await _setup(hass, mock_client, config, get_write_api)
+
+    attrs = {"tag, =\\": 'x "y"\nz', 'field "\\': 'x "y"\n\\z'}
+    body = [
+        {
+            "measurement": "a b,c=d",
+            "tags": {
+                "domain": "fake",
+                "entity_id": "something",
+                "tag, =\\": 'x "y"\nz',
+            },
+            "time": ANY,
+            "fields": {"value": 1, 'field "\\_str': 'x "y"\n\\z'},
+        }
+    ]
+    hass.states.async_set("fake.something", 1, attrs)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    assert write_api.call_args == get_mock_call(body)
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_spool_replayed_after_start(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
+) -> None:
+    """Test the events spooled by the previous run are written after the first write."""
+    spool_path = Path(hass.config.path(".storage", influxdb.SPOOL_FILE))
+    spool_path.parent.mkdir()
+    spool_path.write_text(
+        "fake.spooled,domain=fake,entity_id=spooled value=1.0 1\n"
+        "fake.spooled,domain=fake,entity_id=spooled value=2.0 2\n"
+        # Stopped while spooling
+        "fake.spooled,domain=fa"
+    )
+    await _setup(hass, mock_client, config_ext, get_write_api)
+    write_api = get_write_api(mock_client)
+
+    hass.states.async_set("fake.entity_id", 3)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    assert write_api.call_count == 2
+    assert write_api.call_args == get_mock_call(
+        [
+            {
+                "measurement": "fake.spooled",
+                "tags": {"domain": "fake", "entity_id": "spooled"},
+                "time": ANY,
+                "fields": {"value": value},
+            }
+            for value in (1, 2)
+        ]
+    )
+    assert not spool_path.exists()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_spool_full(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+) -> None:
+    """Test the events are lost when they do not fit in the spool."""
+    await _setup(hass, mock_client, config_ext, get_write_api)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = OSError("foo")
+
+    with patch(f"{INFLUX_PATH}.SPOOL_MAX_SIZE", 0):
+        hass.states.async_set("fake.entity_id", 1)
+        await hass.async_block_till_done()
+        await async_wait_for_queue_to_process(hass)
+    assert write_api.call_count == 1
+    assert not Path(hass.config.path(".storage", influxdb.SPOOL_FILE)).exists()
+
+    write_api.side_effect = None
+    hass.states.async_set("fake.entity_id", 2)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    assert write_api.call_count == 2
+    assert "Resumed, lost 1 events." in caplog.text
 
 
 @pytest.mark.parametrize(
@@ -1741,6 +1741,249 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.MAX_EVENTS_PER_MESSAGE", 2)
+async def test_logbook_stream_past_events_in_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test historical events are sent in chunks of partial messages."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+        hass.states.async_set("binary_sensor.is_light", state)
+    await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+            "entity_ids": ["binary_sensor.is_light"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    chunks = []
+    for _ in range(3):
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        chunks.append(msg["event"])
+
+    assert [len(chunk["events"]) for chunk in chunks] == [2, 2, 1]
+    assert [chunk.get("partial") for chunk in chunks] == [True, True, None]
+    assert [event["state"] for chunk in chunks for event in chunk["events"]] == [
+        "off",
+        "on",
+        "off",
+        "on",
+        "off",
+    ]
+    assert len({chunk["start_time"] for chunk in chunks}) == 1
+
+
+@patch("homeassistant.components.logbook.websocket_api.MAX_EVENTS_PER_MESSAGE", 2)
+async def test_logbook_stream_past_events_in_chunks_same_time(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test events at the same time are not lost or repeated between chunks."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    timestamp = dt_util.utcnow().timestamp()
+    for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+        hass.states.async_set("binary_sensor.is_light", state, timestamp=timestamp)
+    await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+            "entity_ids": ["binary_sensor.is_light"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["success"]
+
+    chunks = []
+    for _ in range(3):
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        chunks.append(msg["event"])
+
+    assert [len(chunk["events"]) for chunk in chunks] == [2, 2, 1]
+    assert [chunk.get("partial") for chunk in chunks] == [True, True, None]
+    assert [event["state"] for chunk in chunks for event in chunk["events"]] == [
+        "off",
+        "on",
+        "off",
+        "on",
+        "off",
+    ]
+
+
+@patch("homeassistant.components.logbook.websocket_api.MAX_EVENTS_PER_MESSAGE", 2)
+async def test_logbook_stream_past_events_waits_for_client(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the next chunk is only fetched once the client caught up."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+        hass.states.async_set("binary_sensor.is_light", state)
+    await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+    drained = asyncio.Event()
+    wait_drained_calls = []
+
+    async def _async_wait_drained(self: Any, max_pending: int) -> None:
+        wait_drained_calls.append(max_pending)
+        await drained.wait()
+
+    with (
+        patch(
+            "homeassistant.components.websocket_api.http.WebSocketHandler._async_wait_drained",
+            _async_wait_drained,
+        ),
+        patch.object(
+            logbook.processor.EventProcessor,
+            "get_events_after",
+            autospec=True,
+            side_effect=logbook.processor.EventProcessor.get_events_after,
+        ) as get_events_after_mock,
+    ):
+        websocket_client = await hass_ws_client()
+        await websocket_client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+                "entity_ids": ["binary_sensor.is_light"],
+            }
+        )
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+        chunks = []
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        chunks.append(msg["event"])
+
+        # The client has not caught up yet
+        await asyncio.sleep(0.1)
+        assert get_events_after_mock.call_count == 1
+        assert wait_drained_calls == [websocket_api.MAX_PENDING_HISTORICAL_MESSAGES]
+
+        drained.set()
+        for _ in range(2):
+            msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+            chunks.append(msg["event"])
+
+    assert [len(chunk["events"]) for chunk in chunks] == [2, 2, 1]
+    assert get_events_after_mock.call_count == 3
+    assert len(wait_drained_calls) == 2
+
+
+@patch("homeassistant.components.logbook.websocket_api.MAX_EVENTS_PER_MESSAGE", 2)
+async def test_logbook_stream_past_events_stops_after_unsubscribe(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test no more chunks are fetched once the client unsubscribed."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+        hass.states.async_set("binary_sensor.is_light", state)
+    await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+    drained = asyncio.Event()
+
+    async def _async_wait_drained(self: Any, max_pending: int) -> None:
+        await drained.wait()
+
+    with (
+        patch(
+            "homeassistant.components.websocket_api.http.WebSocketHandler._async_wait_drained",
+            _async_wait_drained,
+        ),
+        patch.object(
+            logbook.processor.EventProcessor,
+            "get_events_after",
+            autospec=True,
+            side_effect=logbook.processor.EventProcessor.get_events_after,
+        ) as get_events_after_mock,
+    ):
+        websocket_client = await hass_ws_client()
+        await websocket_client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+                "entity_ids": ["binary_sensor.is_light"],
+            }
+        )
+
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["event"]["partial"] is True
+
+        await websocket_client.send_json(
+            {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 8
+        assert msg["success"]
+
+        drained.set()
+        await asyncio.sleep(0.1)
+        await websocket_client.send_json({"id": 9, "type": "ping"})
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 9
+        assert msg["type"] == "pong"
+
+    assert get_events_after_mock.call_count == 1
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -10,10 +10,15 @@ from unittest.mock import MagicMock, Mock, call, patch
 
 import certifi
 import paho.mqtt.client as paho_mqtt
+from paho.mqtt.matcher import MQTTMatcher
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    WildcardSubscriptions,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -23,7 +28,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -633,6 +644,72 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+def test_wildcard_subscriptions_match() -> None:
+    """Test the wildcard subscriptions trie matches like the paho matcher."""
+    job = HassJob(lambda msg: None)
+    filters = [
+        "#",
+        "+",
+        "+/+",
+        "home/#",
+        "home/+/temperature",
+        "home/+/+",
+        "home/kitchen/#",
+        "home/+/temperature/#",
+        "+/kitchen/temperature",
+        "$SYS/#",
+        "$SYS/+/load",
+        "home//#",
+    ]
+    subscriptions = WildcardSubscriptions()
+    for topic_filter in filters:
+        subscriptions.add(Subscription(topic_filter, False, job))
+    # The same filter with another callback is matched as well
+    other_job = HassJob(lambda msg: None)
+    subscriptions.add(Subscription("home/+/temperature", False, other_job))
+
+    matcher = MQTTMatcher()
+    for topic_filter in filters:
+        matcher[topic_filter] = topic_filter
+    for topic in (
+        "home",
+        "home/",
+        "home//temperature",
+        "home/kitchen",
+        "home/kitchen/temperature",
+        "home/kitchen/temperature/max",
+        "garden/kitchen/temperature",
+        "$SYS",
+        "$SYS/broker/load",
+        "$other/broker",
+        "",
+        "/",
+    ):
+        matches = subscriptions.match(topic)
+        assert {subscription.topic for subscription in matches} == set(
+            matcher.iter_match(topic)
+        )
+        # Matches are returned in the order the subscriptions were added
+        assert matches == [
+            subscription for subscription in subscriptions if subscription in matches
+        ]
+
+    assert len(subscriptions.match("home/kitchen/temperature")) == 8
+    subscriptions.remove(Subscription("home/+/temperature", False, job))
+    assert [
+        subscription.job
+        for subscription in subscriptions.match("home/kitchen/temperature")
+        if subscription.topic == "home/+/temperature"
+    ] == [other_job]
+    with pytest.raises(KeyError):
+        subscriptions.remove(Subscription("home/+/temperature", False, job))
+
+    for subscription in list(subscriptions):
+        subscriptions.remove(subscription)
+    assert len(subscriptions) == 0
+    assert subscriptions.match("home/kitchen/temperature") == []
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1487,6 +1487,46 @@ async def test_rapid_rediscover(
     assert events[4].data["old_state"] is None
 
 
+async def test_retained_discovery_burst(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a burst of retained discovery messages is processed together."""
+    await mqtt_mock_entry()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    for object_id, name in (("bla", "Beer"), ("bla2", "Wine"), ("bla3", "Milk")):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/binary_sensor/{object_id}/config",
+            f'{{ "name": "{name}", "state_topic": "test-topic" }}',
+            retain=True,
+        )
+    assert hass.states.async_entity_ids("binary_sensor") == []
+    await hass.async_block_till_done()
+
+    assert sorted(hass.states.async_entity_ids("binary_sensor")) == [
+        "binary_sensor.beer",
+        "binary_sensor.milk",
+        "binary_sensor.wine",
+    ]
+    assert len(events) == 3
+    assert "Processing 3 retained discovery messages" in caplog.text
+
+    # A message that is not retained is processed after the queued ones
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla4/config",
+        '{ "name": "Water", "state_topic": "test-topic" }',
+        retain=True,
+    )
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla4/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.water") is None
+    assert "Processing 1 retained discovery messages" in caplog.text
+
+
 async def test_rapid_rediscover_unique(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
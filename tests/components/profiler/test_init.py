@@ -21,6 +21,7 @@ from homeassistant.components.profiler import (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_IMPORT_TIMES,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
@@ -35,6 +36,7 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.loader import DATA_IMPORT_TIMES
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -267,6 +269,44 @@ async def test_log_current_tasks(
     await hass.async_block_till_done()
 
 
+async def test_log_import_times(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test we can log the slowest imports of integration modules."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_IMPORT_TIMES)
+
+    with patch.dict(
+        hass.data[DATA_IMPORT_TIMES],
+        {
+            "homeassistant.components.fast": 0.001,
+            "homeassistant.components.slow": 2.5,
+            "homeassistant.components.slow.sensor": 0.5,
+        },
+        clear=True,
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_IMPORT_TIMES, {"max_modules": 2}, blocking=True
+        )
+
+    assert "Import of homeassistant.components.slow took 2.500 seconds" in caplog.text
+    assert (
+        "Import of homeassistant.components.slow.sensor took 0.500 seconds"
+        in caplog.text
+    )
+    assert "homeassistant.components.fast " not in caplog.text
+    assert "Imported 3 integration modules in 3.001 seconds" in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_log_scheduled(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
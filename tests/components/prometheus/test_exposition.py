@@ -0,0 +1,82 @@
+"""The tests for the Prometheus exposition."""
+
+from unittest.mock import patch
+
+import prometheus_client
+
+from homeassistant.components.prometheus import exposition
+from homeassistant.components.prometheus.exposition import PrometheusExposition
+
+LABELS = ["entity", "friendly_name", "domain"]
+
+
+def test_exposition_matches_generate_latest() -> None:
+    """Test the exposition renders the same text as prometheus_client."""
+    registry = prometheus_client.CollectorRegistry()
+    state_change = prometheus_client.Counter(
+        "state_change", "The number of state changes", LABELS, registry=registry
+    )
+    sensor_state = prometheus_client.Gauge(
+        "sensor_state", 'State of the "sensor"\\\n', LABELS, registry=registry
+    )
+    empty = prometheus_client.Gauge("empty", "No samples", LABELS, registry=registry)
+    entity_exposition = PrometheusExposition()
+    for metric in (state_change, sensor_state, empty):
+        entity_exposition.add_metric(metric)
+
+    def _set(entity_id: str, friendly_name: str, value: float) -> None:
+        labels = (entity_id, friendly_name, "sensor")
+        state_change.labels(*labels).inc()
+        sensor_state.labels(*labels).set(value)
+        entity_exposition.entity_changed(entity_id)
+
+    _set("sensor.a", 'Sensor "A"\\\n', 1.5)
+    _set("sensor.b", "Sensor B", 1e-20)
+    _set("sensor.c", "Sensor C", float("inf"))
+    assert entity_exposition.generate_latest() == prometheus_client.generate_latest(
+        registry
+    )
+
+    _set("sensor.b", "Sensor B", 12345678.9)
+    assert entity_exposition.generate_latest() == prometheus_client.generate_latest(
+        registry
+    )
+
+    state_change.remove("sensor.a", 'Sensor "A"\\\n', "sensor")
+    sensor_state.remove("sensor.a", 'Sensor "A"\\\n', "sensor")
+    _set("sensor.d", "Sensor D", -1)
+    assert entity_exposition.generate_latest() == prometheus_client.generate_latest(
+        registry
+    )
+
+    state_change.remove("sensor.c", "Sensor C", "sensor")
+    assert entity_exposition.generate_latest() == prometheus_client.generate_latest(
+        registry
+    )
+
+
+def test_exposition_renders_changed_entities() -> None:
+    """Test only the samples of the changed entities are rendered again."""
+    gauge = prometheus_client.Gauge("sensor_state", "State", LABELS, registry=None)
+    entity_exposition = PrometheusExposition()
+    entity_exposition.add_metric(gauge)
+    for entity_id in ("sensor.a", "sensor.b"):
+        gauge.labels(entity_id, entity_id, "sensor").set(1)
+        entity_exposition.entity_changed(entity_id)
+
+    with patch.object(
+        exposition, "_render_child", wraps=exposition._render_child
+    ) as render_child_mock:
+        first = entity_exposition.generate_latest()
+        assert render_child_mock.call_count == 2
+
+        gauge.labels("sensor.b", "sensor.b", "sensor").set(2)
+        # Not rendered again until the entity is marked as changed
+        assert entity_exposition.generate_latest() == first
+        assert render_child_mock.call_count == 2
+
+        entity_exposition.entity_changed("sensor.b")
+        assert entity_exposition.generate_latest() == first.replace(
+            b'friendly_name="sensor.b"} 1.0', b'friendly_name="sensor.b"} 2.0'
+        )
+        assert render_child_mock.call_count == 3
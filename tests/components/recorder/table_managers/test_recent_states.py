@@ -0,0 +1,231 @@
+"""Test the recent states table manager."""
+
+from datetime import datetime, timedelta
+import itertools
+import json
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.db_schema import States
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.table_managers import recent_states
+from homeassistant.components.recorder.table_managers.recent_states import (
+    RecentStatesManager,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import JSONEncoder
+import homeassistant.util.dt as dt_util
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+ENTITY_IDS = ["sensor.power", "climate.living_room", "light.kitchen"]
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+async def _async_record_states(hass: HomeAssistant) -> datetime:
+    """Record states for a few entities one minute apart."""
+    start = dt_util.utcnow() + timedelta(minutes=1)
+    for minute in range(6):
+        with freeze_time(start + timedelta(minutes=minute)):
+            hass.states.async_set("sensor.power", str(minute), {"unit": "W"})
+            hass.states.async_set(
+                "climate.living_room", "heat", {"current_temperature": minute}
+            )
+            if minute % 2:
+                hass.states.async_set("light.kitchen", "on", {"brightness": minute})
+            else:
+                hass.states.async_set("light.kitchen", "off")
+        if minute == 3:
+            with freeze_time(start + timedelta(minutes=minute, seconds=30)):
+                hass.states.async_remove("light.kitchen")
+        await async_wait_recording_done(hass)
+    return start
+
+
+def _significant_states(hass: HomeAssistant, **kwargs) -> str:
+    """Return the significant states as JSON."""
+    return json.dumps(
+        history.get_significant_states(hass, **kwargs), cls=JSONEncoder, sort_keys=True
+    )
+
+
+async def test_history_served_from_memory(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the history served from memory matches the database."""
+    manager = recorder_mock.recent_states_manager
+    start = await _async_record_states(hass)
+    assert manager.rows == 19
+
+    query_start_times = (
+        start + timedelta(minutes=1, seconds=30),
+        start + timedelta(minutes=2),
+    )
+    query_end_times = (None, start + timedelta(minutes=4))
+    entity_ids_options = (ENTITY_IDS, ["sensor.power"], ["light.kitchen"])
+
+    def _get_all_significant_states() -> list[str]:
+        return [
+            _significant_states(
+                hass,
+                start_time=start_time,
+                end_time=end_time,
+                entity_ids=entity_ids,
+                include_start_time_state=include_start_time_state,
+                significant_changes_only=significant_changes_only,
+                minimal_response=minimal_response,
+                no_attributes=no_attributes,
+                compressed_state_format=compressed_state_format,
+            )
+            for (
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                compressed_state_format,
+            ) in itertools.product(
+                query_start_times,
+                query_end_times,
+                entity_ids_options,
+                *((True, False),) * 5,
+            )
+        ]
+
+    from_memory = await recorder_mock.async_add_executor_job(
+        _get_all_significant_states
+    )
+    assert manager.misses == 0
+    assert manager.hits == 640
+
+    recorder_mock.recent_states_manager.reset()
+    from_database = await recorder_mock.async_add_executor_job(
+        _get_all_significant_states
+    )
+    assert manager.hits == 640
+    assert manager.misses == 640
+    assert from_memory == from_database
+
+
+async def test_history_older_than_memory(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test history older than the rows kept in memory is queried."""
+    manager = recorder_mock.recent_states_manager
+    start = await _async_record_states(hass)
+
+    def _get_states() -> str:
+        return _significant_states(
+            hass,
+            start_time=start - timedelta(seconds=30),
+            entity_ids=ENTITY_IDS,
+            significant_changes_only=False,
+        )
+
+    hist = await recorder_mock.async_add_executor_job(_get_states)
+    assert manager.hits == 0
+    assert manager.misses == 3
+    assert '"state": "5"' in hist
+
+
+def _state(metadata_id: int, state_id: int, last_updated_ts: float) -> States:
+    """Return a committed state."""
+    return States(
+        state_id=state_id,
+        metadata_id=metadata_id,
+        state=str(state_id),
+        last_updated_ts=last_updated_ts,
+    )
+
+
+def test_recent_states_window() -> None:
+    """Test only the recent window is kept with the state at its start."""
+    manager = RecentStatesManager()
+    for state_id in range(1, 6):
+        manager.add_pending(_state(1, state_id, state_id * 50000.0), '{"a":1}')
+    manager.post_commit_pending()
+
+    # Rows 1 and 2 are older than the window of the newest row
+    # and row 3 is older but is the state at the start of the window
+    assert manager.rows == 3
+    rows, missing = manager.get_significant_rows(
+        [1, 2], 170000.0, None, False, [], False, True, None, False
+    )
+    assert missing == [2]
+    assert [(row.state, row.last_updated_ts) for row in rows] == [
+        ("4", 200000.0),
+        ("5", 250000.0),
+    ]
+    rows, missing = manager.get_significant_rows(
+        [1], 170000.0, None, False, [], False, True, None, True
+    )
+    assert [(row.state, row.last_updated_ts) for row in rows] == [
+        ("3", 0),
+        ("4", 200000.0),
+        ("5", 250000.0),
+    ]
+    assert rows[1].attributes is rows[2].attributes
+
+    # The start of the window is not kept anymore
+    rows, missing = manager.get_significant_rows(
+        [1], 140000.0, None, False, [], False, True, None, True
+    )
+    assert rows == []
+    assert missing == [1]
+
+
+def test_recent_states_memory_limits() -> None:
+    """Test the rows kept in memory are limited."""
+    manager = RecentStatesManager()
+    with (
+        patch.object(recent_states, "MAX_ROWS_PER_ENTITY", 4),
+        patch.object(recent_states, "MAX_ROWS", 10),
+    ):
+        for state_id in range(1, 7):
+            manager.add_pending(_state(1, state_id, float(state_id)), None)
+        manager.post_commit_pending()
+        assert manager.rows == 4
+
+        for metadata_id in range(2, 5):
+            for state_id in range(1, 4):
+                manager.add_pending(
+                    _state(metadata_id, metadata_id * 10 + state_id, float(state_id)),
+                    None,
+                )
+        manager.add_pending(_state(1, 7, 7.0), None)
+        manager.post_commit_pending()
+
+    # The entities that did not change for the longest time are evicted
+    assert manager.rows == 7
+    _, missing = manager.get_significant_rows(
+        [1, 2, 3, 4], 4.5, None, False, [], False, False, None, False
+    )
+    assert missing == [2, 3]
+
+
+async def test_recent_states_evicted_on_purge(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test entities with purged states are evicted from memory."""
+    manager = recorder_mock.recent_states_manager
+    start = await _async_record_states(hass)
+    assert manager.rows == 19
+    assert purge_old_data(recorder_mock, start - timedelta(seconds=30), repack=False)
+    assert manager.rows == 19
+
+    # Purging the first minute purges states of all the entities
+    assert purge_old_data(recorder_mock, start + timedelta(seconds=30), repack=False)
+    assert manager.rows == 0
@@ -0,0 +1,157 @@
+"""Test the recorder bulk insert manager."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.bulk_insert import BulkInsertManager
+from homeassistant.components.recorder.db_schema import (
+    SCHEMA_VERSION,
+    EventData,
+    Events,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.queries import select_event_type_ids
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+async def _async_record_states_and_events(hass: HomeAssistant) -> None:
+    """Record states that change several times inside one commit interval."""
+    for value in range(3):
+        hass.states.async_set("sensor.one", str(value), {"shared": True})
+        hass.states.async_set("sensor.two", str(value), {"value": value})
+        hass.bus.async_fire("bulk_event", {"value": value})
+        hass.bus.async_fire("bulk_event")
+    hass.states.async_remove("sensor.two")
+    # The first wait makes sure the recorder processed the events,
+    # the second one commits them all at once.
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+
+def _assert_recorded_rows(hass: HomeAssistant) -> None:
+    """Assert the recorded rows are linked to their related rows."""
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata_ids = {
+            row.entity_id: row.metadata_id for row in session.query(StatesMeta)
+        }
+        attributes = {
+            row.attributes_id: row.shared_attrs
+            for row in session.query(StateAttributes)
+        }
+        states = list(session.query(States).order_by(States.state_id))
+
+        one = [row for row in states if row.metadata_id == metadata_ids["sensor.one"]]
+        assert [row.state for row in one] == ["0", "1", "2"]
+        assert one[0].old_state_id is None
+        assert one[1].old_state_id == one[0].state_id
+        assert one[2].old_state_id == one[1].state_id
+        assert {attributes[row.attributes_id] for row in one} == {'{"shared":true}'}
+
+        two = [row for row in states if row.metadata_id == metadata_ids["sensor.two"]]
+        assert [row.state for row in two] == ["0", "1", "2", None]
+        assert [attributes.get(row.attributes_id) for row in two] == [
+            '{"value":0}',
+            '{"value":1}',
+            '{"value":2}',
+            "{}",
+        ]
+        assert two[3].old_state_id == two[2].state_id
+
+        event_type_id = session.execute(
+            select_event_type_ids(("bulk_event",))
+        ).scalar_one()
+        event_data = {row.data_id: row.shared_data for row in session.query(EventData)}
+        events = (
+            session.query(Events)
+            .filter(Events.event_type_id == event_type_id)
+            .order_by(Events.event_id)
+        )
+        assert [event_data.get(row.data_id) for row in events] == [
+            '{"value":0}',
+            None,
+            '{"value":1}',
+            None,
+            '{"value":2}',
+            None,
+        ]
+
+
+async def test_bulk_insert(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test rows inserted in bulk are linked to their related rows."""
+    instance: Recorder = await async_setup_recorder_instance(
+        hass, {"commit_interval": 1}
+    )
+    assert instance.bulk_insert_manager.active is True
+
+    await _async_record_states_and_events(hass)
+    await instance.async_add_executor_job(_assert_recorded_rows, hass)
+
+    # The table managers picked up the ids of the rows inserted in bulk
+    hass.states.async_set("sensor.one", "3", {"shared": True})
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    def _assert_new_state_linked() -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            last_two = list(
+                session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "sensor.one")
+                .order_by(States.state_id.desc())
+                .limit(2)
+            )
+        assert last_two[0].state == "3"
+        assert last_two[0].old_state_id == last_two[1].state_id
+        assert last_two[0].attributes_id == last_two[1].attributes_id
+
+    await instance.async_add_executor_job(_assert_new_state_linked)
+
+
+async def test_bulk_insert_not_supported(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test rows are added with the ORM when bulk inserts are not supported."""
+    with patch.object(BulkInsertManager, "activate"):
+        instance: Recorder = await async_setup_recorder_instance(
+            hass, {"commit_interval": 1}
+        )
+    assert instance.bulk_insert_manager.active is False
+
+    await _async_record_states_and_events(hass)
+    await instance.async_add_executor_job(_assert_recorded_rows, hass)
+
+
+@pytest.mark.parametrize(
+    ("schema_version", "supported", "active"),
+    [
+        (SCHEMA_VERSION, True, True),
+        (SCHEMA_VERSION, False, False),
+        (SCHEMA_VERSION - 1, True, False),
+        (None, True, False),
+    ],
+)
+def test_activate(schema_version: int | None, supported: bool, active: bool) -> None:
+    """Test bulk inserts are only used with the current schema."""
+    engine = Mock()
+    engine.dialect.insert_executemany_returning_sort_by_parameter_order = supported
+    bulk_insert_manager = BulkInsertManager()
+    bulk_insert_manager.activate(engine, schema_version)
+    assert bulk_insert_manager.active is active
@@ -395,7 +395,8 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        instance = get_instance(hass)
+        for obj in (*instance.event_session, *instance.bulk_insert_manager._states):
             if isinstance(obj, States):
                 raise OperationalError(
                     "insert the state", "fake params", "forced to fail"
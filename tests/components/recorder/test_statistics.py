@@ -1428,6 +1428,94 @@ async def test_weekly_statistics_mean(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2023-01-01 00:00:00+00:00")
+async def test_daily_statistics_many_periods(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone,
+) -> None:
+    """Test reducing a year of statistics to daily statistics."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    first_day = dt_util.as_utc(dt_util.parse_datetime("2022-01-01 00:00:00"))
+    external_statistics = []
+    expected_stats = []
+    for day in range(0, 365, 3):
+        # The local days around DST changes are 23 or 25 hours long
+        day_start = dt_util.as_local(first_day + timedelta(days=day)).replace(hour=0)
+        day_end = (day_start + timedelta(days=1, hours=2)).replace(hour=0)
+        hours = [
+            day_start,
+            day_start + timedelta(hours=12),
+            day_end - timedelta(hours=1),
+        ]
+        external_statistics.extend(
+            {
+                "start": hour,
+                "last_reset": None,
+                "max": day + idx,
+                "mean": day + idx / 2,
+                "min": day - idx,
+                "state": day * 3 + idx,
+                "sum": day * 3 + idx,
+            }
+            for idx, hour in enumerate(hours)
+        )
+        expected_stats.append(
+            {
+                "start": day_start.timestamp(),
+                "end": day_end.timestamp(),
+                "last_reset": None,
+                "max": day + 2,
+                "mean": day + 0.5,
+                "min": day - 2,
+                "state": day * 3 + 2,
+                "sum": day * 3 + 2,
+            }
+        )
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+    stats = statistics_during_period(
+        hass,
+        first_day - timedelta(days=1),
+        None,
+        statistic_ids={"test:total_energy_import"},
+        period="day",
+        types={"last_reset", "max", "mean", "min", "state", "sum"},
+    )
+    assert stats == {"test:total_energy_import": expected_stats}
+
+    # Statistics for all statistic ids
+    stats = statistics_during_period(
+        hass,
+        first_day + timedelta(days=30),
+        first_day + timedelta(days=60),
+        statistic_ids=None,
+        period="day",
+        types={"max", "sum"},
+    )
+    assert stats == {
+        "test:total_energy_import": [
+            {key: row[key] for key in ("start", "end", "max", "sum")}
+            for row in expected_stats
+            if (first_day + timedelta(days=29)).timestamp()
+            < row["start"]
+            < (first_day + timedelta(days=61)).timestamp()
+        ]
+    }
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
 async def test_weekly_statistics_sum(
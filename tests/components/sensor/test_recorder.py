@@ -35,7 +35,12 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -315,6 +320,144 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def _time_weighted_average_before_single_pass(
+    fstates: list[tuple[float, State]], start: datetime, end: datetime
+) -> float:
+    """Calculate the time weighted average like before the single pass."""
+    old_fstate: float | None = None
+    old_start_time: datetime | None = None
+    accumulated = 0.0
+
+    for fstate, state in fstates:
+        start_time = max(state.last_updated, start)
+        if old_start_time is None:
+            start = start_time
+        else:
+            duration = start_time - old_start_time
+            accumulated += old_fstate * duration.total_seconds()
+
+        old_fstate = fstate
+        old_start_time = start_time
+
+    if old_fstate is not None:
+        duration = end - old_start_time
+        accumulated += old_fstate * duration.total_seconds()
+
+    period_seconds = (end - start).total_seconds()
+    if period_seconds == 0:
+        return 0.0
+    return accumulated / period_seconds
+
+
+@pytest.mark.parametrize(
+    "offsets_and_values",
+    [
+        [(-3600, 5.0)],
+        [(-60, -10.0), (50, 15.0), (250, 30.0)],
+        [(10, 30.0), (100, -10.0), (200, 15.0), (299, 15.0)],
+        [(0, 1.0), (0, 2.0), (150, 2.0), (150, -1.0)],
+        [(300, 10.0)],
+    ],
+)
+@pytest.mark.parametrize(
+    "wanted",
+    [
+        {"max", "mean", "min"},
+        {"max", "min"},
+        {"min"},
+        {"max"},
+        {"mean"},
+    ],
+)
+def test_time_weighted_average_min_max(
+    offsets_and_values: list[tuple[int, float]], wanted: set[str]
+) -> None:
+    """Test the single pass matches the mean, min and max computed before it."""
+    start = datetime(2024, 1, 1, tzinfo=dt_util.UTC)
+    end = start + timedelta(minutes=5)
+    fstates = [
+        (
+            value,
+            State(
+                "sensor.test",
+                str(value),
+                last_updated=start + timedelta(seconds=offset),
+            ),
+        )
+        for offset, value in offsets_and_values
+    ]
+    expected = {
+        "mean": _time_weighted_average_before_single_pass(fstates, start, end),
+        "min": min(value for value, _ in fstates),
+        "max": max(value for value, _ in fstates),
+    }
+
+    mean, min_, max_ = sensor_recorder._time_weighted_average_min_max(
+        fstates, start.timestamp(), end.timestamp()
+    )
+    result = {"mean": mean, "min": min_, "max": max_}
+    assert {key: result[key] for key in wanted} == pytest.approx(
+        {key: expected[key] for key in wanted}
+    )
+
+
+@pytest.mark.parametrize(
+    ("wanted", "has_mean", "mean", "min", "max"),
+    [
+        ({"max", "mean", "min"}, True, 13.050847, -10, 30),
+        ({"max", "min"}, False, None, -10, 30),
+        ({"min"}, False, None, -10, None),
+        ({"mean"}, True, 13.050847, None, None),
+    ],
+)
+async def test_compile_hourly_statistics_wanted(
+    hass: HomeAssistant,
+    wanted: set[str],
+    has_mean: bool,
+    mean: float | None,
+    min: float | None,
+    max: float | None,
+) -> None:
+    """Test only the wanted statistics are compiled."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    with freeze_time(zero) as freezer:
+        await async_record_states(hass, freezer, zero, "sensor.test1", attributes)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        sensor_recorder,
+        "_wanted_statistics",
+        lambda sensor_states: {state.entity_id: wanted for state in sensor_states},
+    ):
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    statistic_ids = await async_list_statistic_ids(hass)
+    assert statistic_ids[0]["has_mean"] is has_mean
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(mean) if mean is not None else None,
+                "min": min,
+                "max": max,
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
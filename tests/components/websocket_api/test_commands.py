@@ -11,7 +11,7 @@ import voluptuous as vol
 
 from homeassistant import loader
 from homeassistant.components.device_automation import toggle_entity
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import commands, const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
@@ -19,7 +19,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -1262,6 +1262,106 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shared_between_connections(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_read_only_access_token: str,
+    hass_read_only_user: MockUser,
+) -> None:
+    """Test subscribe entities connections share the state changed listener."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.not_permitted", "off")
+    hass_read_only_user.groups = []
+    hass_read_only_user.mock_policy(
+        {"entities": {"entity_ids": {"light.permitted": True}}}
+    )
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    admin_client = await hass_ws_client(hass)
+    read_only_client = await hass_ws_client(hass, hass_read_only_access_token)
+    for client in (admin_client, read_only_client):
+        await client.send_json({"id": 5, "type": "subscribe_entities"})
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["type"] == "event"
+    assert set(msg["event"]["a"]) == {"light.permitted"}
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+    msg = await admin_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"] == {
+        "c": {"light.not_permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+    msg = await admin_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+    assert await read_only_client.receive_json() == msg
+
+    for client in (admin_client, read_only_client):
+        await client.send_json(
+            {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+        )
+        msg = await client.receive_json()
+        assert msg["success"]
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
+async def test_subscribe_entities_set_many(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the state changes of a batch are sent in a single message."""
+    hass.states.async_set("light.kitchen", "off")
+    await websocket_client.send_json({"id": 5, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "event"
+
+    hass.states.async_set_many(
+        [
+            ("light.kitchen", "on", None),
+            ("light.hall", "on", None),
+            # A second change of an entity starts a new message
+            ("light.kitchen", "off", None),
+        ]
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"] == {
+        "a": {"light.hall": ANY},
+        "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}},
+    }
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"] == {"c": {"light.kitchen": {"+": {"s": "off"}}}}
+
+
+async def test_subscribe_entities_send_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an error sending to one subscription does not stop the others."""
+    entity_subscriptions = commands._EntitySubscriptions(hass)
+    user = Mock(id="abc", is_admin=True)
+    failing = Mock(user=user, send_message=Mock(side_effect=RuntimeError("boom")))
+    working = Mock(user=user, send_message=Mock())
+    entity_subscriptions.async_subscribe(failing, 5, None, None)
+    entity_subscriptions.async_subscribe(working, 6, None, None)
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert failing.send_message.call_count == 1
+    assert working.send_message.call_count == 1
+    assert (
+        "Error forwarding the state change of light.kitchen to subscription 5"
+        in caplog.text
+    )
+
+
 async def test_subscribe_unsubscribe_entities_with_filter(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
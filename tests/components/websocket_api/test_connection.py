@@ -132,3 +132,25 @@ async def test_binary_handler_registration() -> None:
     # Verify we reuse an unsubscribed prefix
     prefix, unsub = connection.async_register_binary_handler(None)
     assert prefix == 15
+
+
+@pytest.mark.parametrize(
+    ("features", "max_bytes", "max_delay"),
+    [
+        ({}, 0, 0),
+        ({"coalesce_max_bytes": 65536, "coalesce_max_delay": 100}, 65536, 0.1),
+        ({"coalesce_max_delay": 60000}, 0, 1),
+        ({"coalesce_max_delay": -5}, 0, 0),
+    ],
+)
+async def test_coalesce_features(
+    features: dict[str, int], max_bytes: int, max_delay: float
+) -> None:
+    """Test the coalesce features are limited."""
+    connection = websocket_api.ActiveConnection(
+        None, Mock(data={websocket_api.DOMAIN: None}), None, None, Mock()
+    )
+    connection.set_supported_features({"coalesce_messages": 1, **features})
+    assert connection.can_coalesce is True
+    assert connection.coalesce_max_bytes == max_bytes
+    assert connection.coalesce_max_delay == max_delay
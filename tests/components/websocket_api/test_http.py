@@ -17,6 +17,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -345,6 +346,48 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_wait_drained(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test waiting for the writer to catch up with the queued messages."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    connection = cast(ActiveConnection, instance._connection)
+
+    for idx in range(5):
+        instance._send_message({"id": idx})
+    assert len(instance._message_queue) == 5
+
+    await connection.async_wait_drained(1)
+    assert len(instance._message_queue) <= 1
+
+    for idx in range(5):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == idx
+
+    # Waiting stops once the connection is closing
+    for idx in range(5):
+        instance._send_message({"id": idx})
+    wait_task = hass.async_create_task(connection.async_wait_drained(0))
+    await asyncio.sleep(0)
+    assert not wait_task.done()
+    instance._cancel()
+    await asyncio.wait_for(wait_task, 1)
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -451,6 +494,108 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_coalesce_max_bytes_and_delay(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test coalesced messages are held back and split by size."""
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_COALESCE_MAX_BYTES: 60,
+                const.FEATURE_COALESCE_MAX_DELAY: 50,
+            },
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    await asyncio.gather(
+        *(
+            websocket_client.send_json({"id": id_, "type": "ping"})
+            for id_ in range(2, 12)
+        )
+    )
+    frames: list[list[dict[str, Any]]] = []
+    while sum(len(frame) for frame in frames) < 10:
+        # Receive the frames without splitting the coalesced messages
+        frame = json_loads(await websocket_client.receive_str())
+        assert isinstance(frame, list)
+        frames.append(frame)
+
+    # Two pong messages fit in 60 bytes
+    assert [len(frame) for frame in frames] == [2, 2, 2, 2, 2]
+    assert [msg["id"] for frame in frames for msg in frame] == list(range(2, 12))
+
+
+async def test_coalesce_forced_release_cancels_delay(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test releasing the coalesced messages early cancels the delayed release."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    connection = instance._connection
+    assert connection is not None
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_COALESCE_MAX_DELAY: 1000,
+            },
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    assert connection.writer_stats.messages_sent == 1
+
+    with patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_MAX_FORCE_READY", 3
+    ):
+        instance._send_message({"id": 2})
+        assert instance._release_ready_handle is not None
+        instance._send_message({"id": 3})
+        instance._send_message({"id": 4})
+        # Released early, the delayed release must not cut the next delay short
+        assert instance._release_ready_handle is None
+
+    frame = json_loads(await websocket_client.receive_str())
+    assert isinstance(frame, list)
+    assert [msg["id"] for msg in frame] == [2, 3, 4]
+    assert connection.writer_stats.messages_sent == 4
+    assert connection.writer_stats.frames_sent == 2
+
+    loop = asyncio.get_running_loop()
+    instance._send_message({"id": 5})
+    assert instance._release_ready_handle is not None
+    assert instance._release_ready_handle.when() == pytest.approx(
+        loop.time() + 1, abs=0.1
+    )
+    await websocket_client.close()
+    await hass.async_block_till_done()
+    assert instance._release_ready_handle is None
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -13,7 +14,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import (
     Event,
@@ -30,6 +31,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -4980,3 +4982,96 @@ async def test_async_track_template_result_no_hass_deprecated(
     )
     assert message not in caplog.text
     caplog.clear()
+
+
+async def test_track_template_result_shared_dependencies(hass: HomeAssistant) -> None:
+    """Test trackers of identical templates share listeners and renders."""
+    hass.states.async_set("sensor.grid_power", "500")
+    hass.states.async_set("sensor.other", "on")
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    results: list[tuple[int, Any]] = []
+    infos = []
+
+    for idx in range(20):
+
+        @ha.callback
+        def _refresh(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+            idx: int = idx,
+        ) -> None:
+            results.extend((idx, update.result) for update in updates)
+
+        infos.append(
+            async_track_template_result(
+                hass,
+                [
+                    TrackTemplate(
+                        Template(
+                            "{{ states('sensor.grid_power') | float > 1000 }}", hass
+                        ),
+                        {"this": idx},
+                    ),
+                    TrackTemplate(
+                        Template("{{ states.sensor.other.state }}", hass), None
+                    ),
+                ],
+                _refresh,
+            )
+        )
+    await hass.async_block_till_done()
+    # One listener for each entity and one to know when renders are stale
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 3
+    stats = async_get_template_render_stats(hass)
+
+    hass.states.async_set("sensor.grid_power", "1500")
+    hass.states.async_set("sensor.other", "off")
+    await hass.async_block_till_done()
+
+    assert results == [(idx, True) for idx in range(20)] + [
+        (idx, "off") for idx in range(20)
+    ]
+    new_stats = async_get_template_render_stats(hass)
+    assert new_stats["state_changes"] - stats["state_changes"] == 2
+    # The identical state only templates are rendered once
+    assert new_stats["renders"] - stats["renders"] == 21
+    assert new_stats["shared_renders"] - stats["shared_renders"] == 19
+
+    for info in infos:
+        info.async_remove()
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+
+async def test_track_template_changes_in_same_iteration(hass: HomeAssistant) -> None:
+    """Test state changes in the same loop iteration are all tracked."""
+    template_condition = Template("{{ is_state('switch.test', 'on') }}", hass)
+    hass.states.async_set("switch.test", "off")
+    runs = []
+
+    @ha.callback
+    def _run(entity_id, old_state, new_state):
+        runs.append((old_state.state, new_state.state))
+
+    async_track_template(hass, template_condition, _run)
+    results: list[Any] = []
+
+    @ha.callback
+    def _refresh(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        results.extend(update.result for update in updates)
+
+    async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('switch.test') }}", hass), None)],
+        _refresh,
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("switch.test", "on")
+    hass.states.async_set("switch.test", "off")
+    await hass.async_block_till_done()
+
+    assert runs == [("off", "on")]
+    assert results == ["on", "off"]
@@ -0,0 +1,111 @@
+"""Tests for the import bundle helper."""
+
+from datetime import timedelta
+import sys
+from typing import Any
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant import loader
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, __version__
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import import_bundle
+
+from tests.common import async_fire_time_changed
+
+EXECUTOR_PACKAGE = "custom_components.test_package_loaded_executor"
+LOOP_PACKAGE = "custom_components.test_package_loaded_loop"
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_import_bundle_saved_when_started(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the integration modules imported until started are saved."""
+    await import_bundle.async_setup(hass)
+    with patch.dict(sys.modules):
+        for module in list(sys.modules):
+            if module.startswith((EXECUTOR_PACKAGE, LOOP_PACKAGE)):
+                del sys.modules[module]
+        for domain in ("test_package_loaded_loop", "test_package_loaded_executor"):
+            integration = await loader.async_get_integration(hass, domain)
+            await integration.async_get_component()
+        await integration.async_get_platforms(["light"])
+
+    import_times = loader.async_get_import_times(hass)
+    assert EXECUTOR_PACKAGE in import_times
+    assert f"{EXECUTOR_PACKAGE}.config_flow" in import_times
+    assert f"{EXECUTOR_PACKAGE}.light" in import_times
+    assert LOOP_PACKAGE in import_times
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert import_bundle.STORAGE_KEY not in hass_storage
+
+    freezer.tick(timedelta(seconds=import_bundle.SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    data = hass_storage[import_bundle.STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    # The integration that must be imported in the event loop is left out
+    assert data["modules"] == [
+        module for module in import_times if module.startswith(EXECUTOR_PACKAGE)
+    ]
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_import_bundle_preloaded(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the modules of the import bundle are preloaded."""
+    hass_storage[import_bundle.STORAGE_KEY] = {
+        "version": import_bundle.STORAGE_VERSION,
+        "data": {
+            "ha_version": __version__,
+            "modules": [
+                EXECUTOR_PACKAGE,
+                f"{EXECUTOR_PACKAGE}.switch",
+                "custom_components.not_a_module",
+            ],
+        },
+    }
+    with patch.dict(sys.modules):
+        for module in list(sys.modules):
+            if module.startswith(EXECUTOR_PACKAGE):
+                del sys.modules[module]
+        await import_bundle.async_setup(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert EXECUTOR_PACKAGE in sys.modules
+        assert f"{EXECUTOR_PACKAGE}.switch" in sys.modules
+
+    import_times = loader.async_get_import_times(hass)
+    assert EXECUTOR_PACKAGE in import_times
+    assert f"{EXECUTOR_PACKAGE}.switch" in import_times
+    assert "custom_components.not_a_module" not in import_times
+    assert "Failed to preload custom_components.not_a_module" in caplog.text
+    assert "Preloaded 2 of 3 modules" in caplog.text
+
+
+async def test_import_bundle_other_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the import bundle of another version is not preloaded."""
+    hass_storage[import_bundle.STORAGE_KEY] = {
+        "version": import_bundle.STORAGE_VERSION,
+        "data": {
+            "ha_version": "0.1.0",
+            "modules": ["custom_components.test_package"],
+        },
+    }
+    with patch.object(import_bundle, "_preload_module") as preload_mock:
+        await import_bundle.async_setup(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert not preload_mock.called
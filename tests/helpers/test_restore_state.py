@@ -6,9 +6,12 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
+
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import restore_state
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -16,6 +19,7 @@ from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -342,6 +346,87 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+class ExtraDataRestoreEntity(RestoreEntity):
+    """Restore entity with extra data."""
+
+    def __init__(self, entity_id: str, extra_data: dict[str, Any] | None) -> None:
+        """Initialize the entity."""
+        self.entity_id = entity_id
+        self.extra_data = extra_data
+
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData | None:
+        """Return the extra data."""
+        return RestoredExtraData(self.extra_data) if self.extra_data else None
+
+
+async def test_dump_data_only_serializes_changes(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test only the stored states that changed are serialized again."""
+    platform = MockEntityPlatform(hass, domain="sensor")
+    entities = [
+        ExtraDataRestoreEntity("sensor.s0", {"native_value": 1}),
+        ExtraDataRestoreEntity("sensor.s1", {"native_value": 2}),
+        ExtraDataRestoreEntity("sensor.s2", None),
+    ]
+    await platform.async_add_entities(entities)
+    data = async_get(hass)
+    data.last_states = {
+        "sensor.old": StoredState(
+            State("sensor.old", "off"), None, dt_util.utcnow() - timedelta(days=1)
+        )
+    }
+
+    async def _async_dump() -> tuple[list[Any], list[Any], int]:
+        """Dump the states and return them with the expected stored states."""
+        expected = [state.as_dict() for state in data.async_get_stored_states()]
+        with (
+            patch(
+                "homeassistant.helpers.restore_state.Store.async_save"
+            ) as mock_write_data,
+            patch.object(
+                restore_state, "json_bytes", wraps=restore_state.json_bytes
+            ) as json_bytes_mock,
+        ):
+            await data.async_dump_states()
+        return (
+            json_round_trip(mock_write_data.mock_calls[0][1][0]),
+            json_round_trip(expected),
+            json_bytes_mock.call_count,
+        )
+
+    written_states, expected, serialized = await _async_dump()
+    assert written_states == expected
+    assert [state["state"]["entity_id"] for state in written_states] == [
+        "sensor.s0",
+        "sensor.s1",
+        "sensor.s2",
+        "sensor.old",
+    ]
+    # The last_seen of the dump and the extra data of every entity
+    assert serialized == 4
+
+    freezer.tick(timedelta(minutes=15))
+    hass.states.async_set("sensor.s0", "on")
+    entities[1].extra_data = {"native_value": 3}
+    written_states, expected, serialized = await _async_dump()
+    assert written_states == expected
+    assert written_states[0]["state"]["state"] == "on"
+    assert written_states[1]["extra_data"] == {"native_value": 3}
+    assert written_states[2]["last_seen"] == dt_util.utcnow().isoformat()
+    # The stored state of sensor.s2 is not serialized again
+    assert serialized == 3
+
+    freezer.tick(timedelta(minutes=15))
+    written_states, expected, serialized = await _async_dump()
+    assert written_states == expected
+    assert serialized == 1
+
+    await entities[0].async_remove()
+    assert "sensor.s0" not in data._dumped_states
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -20,7 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment, save_json
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1180,154 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test saves are journaled and replayed when loading."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        entries = [json_fragment(json_bytes({"id": idx})) for idx in range(100)]
+        data: dict[str, Any] = {"entries": entries, "info": {"a": 1}, "other": 1}
+        await store.async_save(data)
+
+        def _read(path: str) -> bytes:
+            with open(path, "rb") as fdesc:
+                return fdesc.read()
+
+        snapshot = await hass.async_add_executor_job(_read, store.path)
+        assert len(await hass.async_add_executor_job(_read, journal_path)) < 30
+
+        data = {
+            "entries": [
+                *entries[:10],
+                json_fragment(json_bytes({"id": 10, "changed": True})),
+                *entries[11:50],
+            ],
+            "info": {"a": 2},
+        }
+        await store.async_save(data)
+        data["entries"].append({"id": "new"})
+        await store.async_save(data)
+
+        # The snapshot is not rewritten, only the changes are journaled
+        assert await hass.async_add_executor_job(_read, store.path) == snapshot
+        journal = await hass.async_add_executor_job(_read, journal_path)
+        assert journal.count(b"\n") == 3
+        assert len(journal) < 200
+
+        expected = {
+            "entries": [
+                *({"id": idx} for idx in range(10)),
+                {"id": 10, "changed": True},
+                *({"id": idx} for idx in range(11, 50)),
+                {"id": "new"},
+            ],
+            "info": {"a": 2},
+        }
+        load_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await load_store.async_load() == expected
+
+        # A save interrupted by a crash is not replayed
+        def _append(path: str, line: bytes) -> None:
+            with open(path, "ab") as fdesc:
+                fdesc.write(line)
+
+        await hass.async_add_executor_job(_append, journal_path, b'[["set","info",{"a"')
+        load_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await load_store.async_load() == expected
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the snapshot when it grows."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        data = [{"id": idx, "value": 0} for idx in range(20)]
+        await store.async_save(data)
+
+        def _read(path: str) -> bytes:
+            with open(path, "rb") as fdesc:
+                return fdesc.read()
+
+        snapshot = await hass.async_add_executor_job(_read, store.path)
+        for value in range(1, 20):
+            data = [*data[:-1], {"id": 19, "value": value}]
+            await store.async_save(data)
+            if value == 1:
+                assert await hass.async_add_executor_job(_read, store.path) == snapshot
+
+        # The snapshot was rewritten and the journal started over
+        assert await hass.async_add_executor_job(_read, store.path) != snapshot
+        assert (
+            len(await hass.async_add_executor_job(_read, journal_path))
+            < len(snapshot) * storage.JOURNAL_COMPACT_RATIO
+        )
+        load_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await load_store.async_load() == data
+
+        # A journal that does not belong to the snapshot is ignored,
+        # like after a crash before the journal was started over
+        data = [*data[:-1], {"id": 19, "value": "journaled"}]
+        await store.async_save(data)
+        replaced = [{"id": "replaced"}]
+        await hass.async_add_executor_job(
+            save_json,
+            store.path,
+            {"version": MOCK_VERSION, "minor_version": 1, "data": replaced},
+        )
+        load_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await load_store.async_load() == replaced
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+
+        await hass.async_stop(force=True)
+
+
+@pytest.mark.parametrize("pending_save", [False, True])
+async def test_journal_compacted_on_final_write(
+    tmpdir: py.path.local, pending_save: bool
+) -> None:
+    """Test the journal is compacted into the file on the final write."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        data = [{"id": idx, "value": 0} for idx in range(20)]
+        await store.async_save(data)
+        data = [*data[:-1], {"id": 19, "value": 1}]
+        await store.async_save(data)
+
+        def _read(path: str) -> bytes:
+            with open(path, "rb") as fdesc:
+                return fdesc.read()
+
+        # The file alone does not hold the journaled change
+        snapshot = json.loads(await hass.async_add_executor_job(_read, store.path))
+        assert snapshot["data"][-1] == {"id": 19, "value": 0}
+
+        if pending_save:
+            data = [*data[:-1], {"id": 19, "value": 2}]
+            store.async_delay_save(lambda: data, 60)
+
+        hass.set_state(CoreState.final_write)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        snapshot = json.loads(await hass.async_add_executor_job(_read, store.path))
+        assert snapshot["data"] == data
+        assert (await hass.async_add_executor_job(_read, journal_path)).count(
+            b"\n"
+        ) == 1
+        load_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await load_store.async_load() == data
+
+        await hass.async_stop(force=True)
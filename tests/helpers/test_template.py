@@ -6584,3 +6584,107 @@ async def test_merge_response_not_mutate_original_object(
 
     tpl = template.Template(_template, hass)
     assert tpl.async_render()
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.power') | float * 2 }}",
+        "{{ states('sensor.power') | float(0) + 0.5 }}",
+        "{{ states('sensor.power') | int / 3 }}",
+        "{{ (states('sensor.power') | float / 3) | round(2) }}",
+        "{{ states('sensor.power') | round(1, default=0) }}",
+        "{{ states('sensor.text') }}",
+        "{{ states('sensor.missing') }}",
+        "{{ states('sensor.power', with_unit=True) }}",
+        "{{ state_attr('sensor.power', 'unit_of_measurement') }}",
+        "{{ state_attr('sensor.power', 'values') }}",
+        "{{ state_attr('sensor.power', 'missing') }}",
+        "{{ state_attr('sensor.power', 'scale') * 1e-10 }}",
+        "{{ is_state('sensor.text', ['on', 'off']) }}",
+        "{{ is_state_attr('sensor.power', 'scale', 2) }}",
+        "{{ has_value('sensor.missing') }}",
+        "{{ 1 < states('sensor.power') | float <= 100 }}",
+        "{{ states('sensor.power') | float > 100 or is_state('sensor.text', 'on') }}",
+        "{{ not is_state('sensor.text', 'on') and 'ok' }}",
+        "{{ 'on' in states('sensor.text') }}",
+        "{{ -(states('sensor.power') | int) // 7 }}",
+        "{{ states('sensor.text') | float(default=none) }}",
+        "{{ 1 / 0 }}",
+        "{{ states('sensor.text') | float }}",
+    ],
+)
+async def test_fast_render_matches_jinja(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test templates rendered without Jinja render the same as with Jinja."""
+    hass.states.async_set(
+        "sensor.power",
+        "42.5",
+        {"unit_of_measurement": "W", "values": [1, 2], "scale": 2},
+    )
+    hass.states.async_set("sensor.text", "on")
+
+    def _render_all(tpl: template.Template) -> list[Any]:
+        results: list[Any] = []
+        for parse_result in (True, False):
+            try:
+                info = tpl.async_render_to_info(parse_result=parse_result)
+                results.append(info.result())
+            except TemplateError as err:
+                results.append(str(err))
+                continue
+            results.append(type(info.result()))
+            results.append(info.entities)
+        return results
+
+    fast_tpl = template.Template(template_str, hass)
+    fast_results = _render_all(fast_tpl)
+    assert fast_tpl._fast_render is not None
+
+    with patch.object(
+        template.TemplateEnvironment, "get_fast_render", return_value=None
+    ):
+        jinja_tpl = template.Template(template_str, hass)
+        jinja_results = _render_all(jinja_tpl)
+    assert jinja_tpl._fast_render is None
+
+    assert fast_results == jinja_results
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.power') }} W",
+        "{{ states.sensor.power.state }}",
+        "{{ states('sensor.power') | float ** 2 }}",
+        "{{ states('sensor.power') | float % 2 }}",
+        "{{ states('sensor.power') | multiply(2) }}",
+        "{{ now() }}",
+        "{{ value | float }}",
+        "{{ states(*['sensor.power']) }}",
+        "{% if is_state('sensor.power', 'on') %}on{% endif %}",
+    ],
+)
+async def test_fast_render_not_supported(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test templates outside of the fast render subset are rendered by Jinja."""
+    hass.states.async_set("sensor.power", "42")
+    tpl = template.Template(template_str, hass)
+    tpl.async_render({"value": "1"})
+    assert tpl._fast_render is None
+
+
+async def test_fast_render_shadowed_by_variables(hass: HomeAssistant) -> None:
+    """Test variables that shadow a global make the render fall back to Jinja."""
+    hass.states.async_set("sensor.power", "42")
+    tpl = template.Template("{{ states('sensor.power') | int + 1 }}", hass)
+    assert tpl.async_render({"this": "unused"}) == 43
+    assert tpl._fast_render is not None
+    assert tpl.async_render({"states": lambda entity_id: "1"}) == 2
+
+    limited_tpl = template.Template("{{ states('sensor.power') }}", hass)
+    with pytest.raises(TemplateError):
+        limited_tpl.async_render(limited=True)
+    assert limited_tpl._fast_render is None
@@ -514,6 +514,76 @@ async def test_setup_after_deps_via_platform(hass: HomeAssistant) -> None:
     assert order == ["after_dep_of_platform_int", "platform_int"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_stage_2_does_not_wait_for_discovery_setup(hass: HomeAssistant) -> None:
+    """Test stage 2 starts once the discovery integrations processed their reqs."""
+    assert "bluetooth" in bootstrap.STAGE_1_INTEGRATIONS
+    assert "bluetooth" not in bootstrap.STAGE_1_SETUP_BLOCKING_INTEGRATIONS
+    order = []
+    bluetooth_done = asyncio.Event()
+
+    async def async_setup_bluetooth(hass: HomeAssistant, config: ConfigType) -> bool:
+        await bluetooth_done.wait()
+        order.append("bluetooth")
+        return True
+
+    async def async_setup_normal(hass: HomeAssistant, config: ConfigType) -> bool:
+        order.append("normal_integration")
+        bluetooth_done.set()
+        return True
+
+    mock_integration(
+        hass, MockModule(domain="bluetooth", async_setup=async_setup_bluetooth)
+    )
+    mock_integration(
+        hass, MockModule(domain="normal_integration", async_setup=async_setup_normal)
+    )
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"bluetooth": {}, "normal_integration": {}}
+    )
+
+    assert order == ["normal_integration", "bluetooth"]
+    assert "bluetooth" in hass.config.components
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_critical_path(hass: HomeAssistant) -> None:
+    """Test the critical path of the setup is reported."""
+    # Setup times are only tracked during startup
+    hass.set_state(CoreState.not_running)
+
+    def gen_domain_setup(delay: float):
+        async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+            await asyncio.sleep(delay)
+            return True
+
+        return async_setup
+
+    mock_integration(
+        hass, MockModule(domain="slow_dep", async_setup=gen_domain_setup(0.05))
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="root",
+            async_setup=gen_domain_setup(0),
+            dependencies=["slow_dep"],
+        ),
+    )
+    mock_integration(hass, MockModule(domain="fast", async_setup=gen_domain_setup(0)))
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"root": {}, "slow_dep": {}, "fast": {}}
+    )
+
+    # The setup groups before stage 1 are on the path as well
+    critical_path = hass.data[bootstrap.DATA_SETUP_CRITICAL_PATH]
+    assert [step.domain for step in critical_path][-2:] == ["slow_dep", "root"]
+    assert critical_path[-2].run_time >= 0.05
+    assert critical_path[-1].wait_time >= 0.05
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_not_trigger_load(hass: HomeAssistant) -> None:
     """Test after_dependencies does not trigger loading it."""
@@ -683,6 +753,33 @@ async def test_setup_hass(
     assert hass == async_get_hass()
 
 
+@pytest.mark.parametrize("hass_config", [{"browser": {}}])
+@pytest.mark.parametrize("import_bundle", [True, False])
+@pytest.mark.usefixtures("mock_hass_config")
+async def test_setup_hass_import_bundle(
+    mock_enable_logging: AsyncMock,
+    mock_is_virtual_env: Mock,
+    mock_mount_local_lib_path: AsyncMock,
+    mock_ensure_config_exists: AsyncMock,
+    mock_process_ha_config_upgrade: Mock,
+    import_bundle: bool,
+) -> None:
+    """Test the import bundle is only set up when enabled."""
+    with patch(
+        "homeassistant.helpers.import_bundle.async_setup"
+    ) as mock_import_bundle_setup:
+        hass = await bootstrap.async_setup_hass(
+            runner.RuntimeConfig(
+                config_dir=get_test_config_dir(),
+                skip_pip=True,
+                import_bundle=import_bundle,
+            ),
+        )
+
+    assert "browser" in hass.config.components
+    assert len(mock_import_bundle_setup.mock_calls) == int(import_bundle)
+
+
 @pytest.mark.parametrize("hass_config", [{"browser": {}, "frontend": {}}])
 @pytest.mark.usefixtures("mock_hass_config")
 async def test_setup_hass_takes_longer_than_log_slow_startup(
@@ -1160,6 +1257,38 @@ async def test_tasks_logged_that_block_stage_2(
     assert not wanted_messages
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_stage_timeout_cancels_pending_setups(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test setups still pending when a stage times out are cancelled."""
+    setup_cancelled = False
+
+    async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+        nonlocal setup_cancelled
+        try:
+            await hass.loop.create_future()
+        except asyncio.CancelledError:
+            setup_cancelled = True
+            raise
+        return True
+
+    mock_integration(
+        hass, MockModule(domain="normal_integration", async_setup=async_setup)
+    )
+
+    with (
+        patch.object(bootstrap, "STAGE_2_TIMEOUT", 0),
+        patch.object(bootstrap, "COOLDOWN_TIME", 0),
+    ):
+        await bootstrap._async_set_up_integrations(hass, {"normal_integration": {}})
+        await hass.async_block_till_done()
+
+    assert setup_cancelled
+    assert "Setup timed out for stage 2 waiting on" in caplog.text
+    assert "normal_integration" not in hass.config.components
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_bootstrap_is_cancellation_safe(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
@@ -16,6 +16,7 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from pytest_unordered import unordered
 import voluptuous as vol
@@ -1165,6 +1166,175 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test listeners with a dispatch key only see matching events."""
+    calls = []
+    other_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener."""
+        other_calls.append(event)
+
+    unsub = hass.bus.async_listen(
+        "test", listener, dispatch_key=("entity_id", "light.kitchen")
+    )
+    unsub_other = hass.bus.async_listen(
+        "test", other_listener, dispatch_key=("entity_id", "light.hall")
+    )
+    assert hass.bus.async_listeners()["test"] == 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test", {"no_entity_id": True})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data == {"entity_id": "light.kitchen"}
+    assert len(other_calls) == 0
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.hall"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert len(other_calls) == 1
+
+    unsub_other()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_keyed_listener_with_filter(hass: HomeAssistant) -> None:
+    """Test the event filter runs for keyed listeners once the key matches."""
+    calls = []
+    filtered = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        filtered.append(event_data)
+        return event_data["state"] == "on"
+
+    unsub = hass.bus.async_listen(
+        "test",
+        listener,
+        event_filter=mock_filter,
+        dispatch_key=("entity_id", "light.kitchen"),
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.hall", "state": "on"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "state": "off"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "state": "on"})
+    await hass.async_block_till_done()
+
+    assert len(filtered) == 2
+    assert len(calls) == 1
+    assert calls[0].data == {"entity_id": "light.kitchen", "state": "on"}
+
+    unsub()
+
+
+async def test_eventbus_keyed_listener_sanity_checks(hass: HomeAssistant) -> None:
+    """Test dispatch keys are validated."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError, match="Dispatch key is not supported"):
+        hass.bus.async_listen(
+            MATCH_ALL, listener, dispatch_key=("entity_id", "light.kitchen")
+        )
+
+    # A dispatch key is enough to listen to state reported events
+    unsub = hass.bus.async_listen(
+        EVENT_STATE_REPORTED, listener, dispatch_key=("entity_id", "light.kitchen")
+    )
+    unsub()
+
+
+async def test_eventbus_remove_unknown_keyed_listener(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test removing a keyed listener twice logs an error."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    unsub = hass.bus.async_listen(
+        "test", listener, dispatch_key=("entity_id", "light.kitchen")
+    )
+    unsub()
+    unsub()
+    assert "Unable to remove unknown job listener" in caplog.text
+
+
+async def test_eventbus_batch_listener(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test batch listeners get the events fired together in one call."""
+    calls = []
+    batches = []
+    match_all_batches = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub_listener = hass.bus.async_listen("test", listener)
+    unsub = hass.bus.async_listen_batch("test", batches.append)
+    unsub_match_all = hass.bus.async_listen_batch(MATCH_ALL, match_all_batches.append)
+    assert hass.bus.async_listeners()["test"] == 2
+
+    context = ha.Context()
+    hass.bus.async_fire_batch_internal(
+        "test", [{"idx": 0}, {"idx": 1}], context=context, time_fired=1234.0
+    )
+    assert [event.data for event in calls] == [{"idx": 0}, {"idx": 1}]
+    assert len(batches) == 1
+    assert batches[0] == calls
+    assert all(event.context is context for event in batches[0])
+    assert all(event.time_fired_timestamp == 1234.0 for event in batches[0])
+    assert match_all_batches == batches
+
+    hass.bus.async_fire("test", {"idx": 2})
+    assert batches[1] == [calls[2]]
+    assert match_all_batches[1] == [calls[2]]
+
+    # Batch listeners for all events do not get the excluded ones
+    hass.bus.async_fire(EVENT_STATE_REPORTED, {"entity_id": "light.kitchen"})
+    assert len(match_all_batches) == 2
+
+    # No batch is fired without events
+    hass.bus.async_fire_batch_internal("test", [])
+    assert len(batches) == 2
+
+    unsub_listener()
+    unsub()
+    unsub_match_all()
+    assert "test" not in hass.bus.async_listeners()
+    hass.bus.async_fire_batch_internal("test", [{"idx": 3}])
+    assert len(batches) == 2
+
+    unsub()
+    assert "Unable to remove unknown job listener" in caplog.text
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1560,6 +1730,212 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.hall", "on")
+    changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported_events = []
+    states_seen = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Record the states visible when the first event is handled."""
+        if not states_seen:
+            states_seen.extend(
+                hass.states.get(entity_id).state
+                for entity_id in ("light.bowl", "light.kitchen")
+            )
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED,
+        reported_events.append,
+        dispatch_key=("entity_id", "light.hall"),
+    )
+    batches = []
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, batches.append)
+
+    context = ha.Context()
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "off", None),
+            ("light.kitchen", "on", {"brightness": 50}),
+            ("light.hall", "on", None),
+        ],
+        context=context,
+        timestamp=1234.0,
+    )
+    await hass.async_block_till_done()
+
+    assert states_seen == ["off", "on"]
+    assert [event.data["entity_id"] for event in changed_events] == [
+        "light.bowl",
+        "light.kitchen",
+    ]
+    assert changed_events[0].data["old_state"].state == "on"
+    assert changed_events[1].data["old_state"] is None
+    assert all(event.context is context for event in changed_events)
+    assert all(event.time_fired_timestamp == 1234.0 for event in changed_events)
+    assert len(reported_events) == 1
+    assert reported_events[0].context is context
+    # The state changes of the batch are delivered to batch listeners at once
+    assert batches == [changed_events]
+
+    kitchen = hass.states.get("light.kitchen")
+    assert kitchen.attributes == {"brightness": 50}
+    assert kitchen.last_updated_timestamp == 1234.0
+    assert hass.states.get("light.bowl").attributes == {}
+
+
+async def test_statemachine_set_many_shares_context(hass: HomeAssistant) -> None:
+    """Test all states of a batch share one context when none is passed."""
+    hass.states.async_set_many(
+        [("light.bowl", "on", None), ("light.kitchen", "on", None)]
+    )
+    bowl = hass.states.get("light.bowl")
+    kitchen = hass.states.get("light.kitchen")
+    assert bowl.context is kitchen.context
+    assert bowl.last_updated == kitchen.last_updated
+
+
+async def test_statemachine_set_many_invalid(hass: HomeAssistant) -> None:
+    """Test an invalid entry leaves the whole batch unwritten."""
+    changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    changed_events.clear()
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many([("light.bowl", "on", None), ("bad id", "on", None)])
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [("light.bowl", "on", None), ("light.kitchen", "x" * 256, None)]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "off"
+    assert hass.states.get("light.kitchen") is None
+    assert changed_events == []
+
+
+async def test_statemachine_compact(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states written in compact mode."""
+    hass.states.async_set_compact(True)
+    reported_events: list[ha.Event] = []
+
+    @callback
+    def _report_filter(event_data: ha.EventStateReportedData) -> bool:
+        return True
+
+    @callback
+    def _report_listener(event: ha.Event) -> None:
+        reported_events.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, _report_listener, event_filter=_report_filter
+    )
+    start = dt_util.utcnow()
+
+    hass.states.async_set("sensor.power", "100", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.solar", "50", {"unit_of_measurement": "W"})
+    power = hass.states.get("sensor.power")
+    solar = hass.states.get("sensor.solar")
+    assert isinstance(power, ha.CompactState)
+    # States with identical attributes share them
+    assert power.attributes is solar.attributes
+    assert power.last_changed == power.last_updated == power.last_reported == start
+
+    freezer.tick(10)
+    hass.states.async_set("sensor.power", "100", {"unit_of_measurement": "kW"})
+    power = hass.states.get("sensor.power")
+    assert power.attributes == {"unit_of_measurement": "kW"}
+    assert power.last_changed == start
+    assert power.last_changed_timestamp == start.timestamp()
+    assert power.last_updated == start + timedelta(seconds=10)
+
+    freezer.tick(10)
+    hass.states.async_set("sensor.power", "100", {"unit_of_measurement": "kW"})
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.power") is power
+    assert power.last_reported == start + timedelta(seconds=20)
+    assert power.last_reported_timestamp == (start + timedelta(seconds=20)).timestamp()
+    assert power.last_updated == start + timedelta(seconds=10)
+    assert len(reported_events) == 1
+    assert reported_events[0].data["old_last_reported"] == start + timedelta(seconds=10)
+
+    # Identical attributes in another order are not shared
+    hass.states.async_set(
+        "sensor.kitchen", "on", {"device_class": "heat", "icon": "mdi:fire"}
+    )
+    hass.states.async_set(
+        "sensor.oven", "on", {"icon": "mdi:fire", "device_class": "heat"}
+    )
+    assert (
+        hass.states.get("sensor.kitchen").attributes
+        is not hass.states.get("sensor.oven").attributes
+    )
+
+    # Named attributes are not shared
+    hass.states.async_set("sensor.grill", "on", {"friendly_name": "Grill"})
+    hass.states.async_set("sensor.stove", "on", {"friendly_name": "Grill"})
+    assert (
+        hass.states.get("sensor.grill").attributes
+        is not hass.states.get("sensor.stove").attributes
+    )
+
+    # Attributes that cannot be serialized are kept as they are
+    hass.states.async_set("sensor.object", "on", {"value": object()})
+    assert "value" in hass.states.get("sensor.object").attributes
+
+    assert (
+        power.as_dict()
+        == ha.State(
+            "sensor.power",
+            "100",
+            {"unit_of_measurement": "kW"},
+            last_changed=start,
+            last_reported=start + timedelta(seconds=20),
+            last_updated=start + timedelta(seconds=10),
+            context=power.context,
+        ).as_dict()
+    )
+
+    hass.states.async_set_compact(False)
+    hass.states.async_set("sensor.power", "200")
+    assert type(hass.states.get("sensor.power")) is ha.State
+
+
+def test_compact_state_times() -> None:
+    """Test the times of a compact state can be passed as datetimes."""
+    now = dt_util.utcnow()
+    state = ha.CompactState(
+        "light.bedroom",
+        "on",
+        last_changed=now - timedelta(minutes=2),
+        last_reported=now,
+        last_updated=now - timedelta(minutes=1),
+    )
+    assert state.last_changed_timestamp == (now - timedelta(minutes=2)).timestamp()
+    assert state.last_updated_timestamp == (now - timedelta(minutes=1)).timestamp()
+    assert state.last_reported_timestamp == now.timestamp()
+    assert state.last_changed == now - timedelta(minutes=2)
+
+    state.last_changed = now
+    assert state.last_changed_timestamp == now.timestamp()
+
+    restored = ha.CompactState.from_dict(state.as_dict())
+    assert restored.last_changed == state.last_changed
+    assert restored.last_reported == state.last_reported
+    assert restored.last_updated == state.last_updated
+
+    with freeze_time(now):
+        state = ha.CompactState("light.bedroom", "on")
+    assert state.last_changed == state.last_updated == state.last_reported == now
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
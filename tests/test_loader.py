@@ -9,6 +9,7 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 from awesomeversion import AwesomeVersion
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import loader
@@ -19,7 +20,12 @@ from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -1445,6 +1451,68 @@ async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     assert module is module_mock
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_async_get_component_loads_executor_if_still_initializing(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Verify a module another thread is still importing is loaded in the executor."""
+    integration = await loader.async_get_integration(
+        hass, "test_package_loaded_executor"
+    )
+    config_flow_module_name = f"{integration.pkg_path}.config_flow"
+    module_mock = MagicMock(
+        __file__="__init__.py", __spec__=MagicMock(_initializing=True)
+    )
+    config_flow_module_mock = MagicMock(__file__="config_flow.py")
+
+    def import_module(name: str) -> Any:
+        if name == integration.pkg_path:
+            return module_mock
+        if name == config_flow_module_name:
+            return config_flow_module_mock
+        raise ImportError
+
+    with (
+        patch.dict(
+            "sys.modules",
+            {
+                integration.pkg_path: module_mock,
+                config_flow_module_name: config_flow_module_mock,
+            },
+        ),
+        patch("homeassistant.loader.importlib.import_module", import_module),
+    ):
+        module = await integration.async_get_component()
+
+    assert "loaded_executor=True" in caplog.text
+    assert module is module_mock
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_import_times(hass: HomeAssistant) -> None:
+    """Verify the time it took to import the modules of integrations is recorded."""
+    integration = await loader.async_get_integration(
+        hass, "test_package_loaded_executor"
+    )
+    with patch.dict("sys.modules"):
+        for module in list(sys.modules):
+            if module.startswith(integration.pkg_path):
+                del sys.modules[module]
+        await integration.async_get_component()
+        await integration.async_get_platforms(["light"])
+    # Modules that are already imported are not recorded
+    http_integration = await loader.async_get_integration(hass, "http")
+    assert await http_integration.async_get_component() is http
+
+    import_times = loader.async_get_import_times(hass)
+    assert list(import_times) == [
+        integration.pkg_path,
+        f"{integration.pkg_path}.config_flow",
+        f"{integration.pkg_path}.light",
+    ]
+    assert all(seconds > 0 for seconds in import_times.values())
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_async_get_component_concurrent_loads(hass: HomeAssistant) -> None:
     """Verify async_get_component waits if the first load if called again when still in progress."""
@@ -2039,3 +2107,73 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def _async_restart_loader(hass: HomeAssistant) -> None:
+    """Forget the resolved integrations and the loaded manifest index."""
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    hass.data.pop(loader.DATA_MANIFEST_INDEX)
+
+
+async def test_manifest_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test resolved integrations are served from the manifest index."""
+    integration = await loader.async_get_integration(hass, "hue")
+    freezer.tick(loader.MANIFEST_INDEX_SAVE_DELAY + 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    stored = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    assert stored["ha_version"] == loader.__version__
+    entry = stored["entries"][str(integration.file_path)]
+    assert "light.py" in entry["files"]
+    assert "is_built_in" not in entry["manifest"]
+
+    await _async_restart_loader(hass)
+    with (
+        patch("homeassistant.loader.json_loads") as mock_json_loads,
+        patch("homeassistant.loader.os.listdir") as mock_listdir,
+    ):
+        indexed = await loader.async_get_integration(hass, "hue")
+    assert not mock_json_loads.called
+    assert not mock_listdir.called
+    assert indexed is not integration
+    assert indexed.manifest == integration.manifest
+    assert indexed.platforms_exists(["light", "missing"]) == ["light"]
+    index = hass.data[loader.DATA_MANIFEST_INDEX]
+    assert (index.hits, index.misses) == (1, 0)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"stat": [0, 0, 0]},
+        {"ha_version": "0.1.0"},
+    ],
+)
+async def test_manifest_index_invalidated(
+    hass: HomeAssistant, hass_storage: dict[str, Any], change: dict[str, Any]
+) -> None:
+    """Test changed integrations and updates invalidate the manifest index."""
+    integration = await loader.async_get_integration(hass, "hue")
+    entry = {
+        "stat": change.get("stat", [1, 1, 1]),
+        "manifest": {**integration.manifest, "name": "Outdated"},
+        "files": [],
+    }
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "data": {
+            "ha_version": change.get("ha_version", loader.__version__),
+            "entries": {str(integration.file_path): entry},
+        },
+    }
+    await _async_restart_loader(hass)
+    with patch("homeassistant.loader.os.listdir", wraps=os.listdir) as mock_listdir:
+        resolved = await loader.async_get_integration(hass, "hue")
+    assert mock_listdir.called
+    assert resolved.name == integration.name
+    assert resolved.platforms_exists(["light"]) == ["light"]
@@ -601,6 +601,29 @@ async def test_platform_error_slow_setup(
         assert "'test_component1' is taking longer than 0.1 seconds" in caplog.text
 
 
+async def test_deps_reqs_processed_future(hass: HomeAssistant) -> None:
+    """Test waiting for the dependencies and requirements to be processed."""
+    dep_setup = asyncio.Event()
+
+    async def async_setup_dep(hass: HomeAssistant, config: ConfigType) -> bool:
+        await dep_setup.wait()
+        return True
+
+    mock_integration(hass, MockModule("dep", async_setup=async_setup_dep))
+    mock_integration(hass, MockModule("comp", dependencies=["dep"]))
+
+    future = setup.async_get_deps_reqs_processed_future(hass, "comp")
+    assert setup.async_get_deps_reqs_processed_future(hass, "comp") is future
+    setup_task = hass.async_create_task(setup.async_setup_component(hass, "comp", {}))
+    await asyncio.sleep(0)
+    assert not future.done()
+
+    dep_setup.set()
+    await future
+    assert await setup_task
+    assert setup.async_get_deps_reqs_processed_future(hass, "comp").done()
+
+
 async def test_when_setup_already_loaded(hass: HomeAssistant) -> None:
     """Test when setup."""
     calls = []